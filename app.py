@@ -2,167 +2,103 @@ from dash import Dash
 import dash_bootstrap_components as dbc
 import pandas as pd
 from datetime import datetime
-import firebase_admin
-from firebase_admin import credentials
 from firebase_admin import db
 from layout import create_layout
 import callbacks
-from preprocess import generate_prediction_data
+from data_store import BidStore, SnapshotHolder, APP_TO_FIREBASE_COLUMNS, DEFAULT_PREDICTION_YEARS, apply_user_input_overlay
+from snapshot_file import SnapshotPersister, start_from_snapshot
+from shared_snapshot import SharedSnapshotFollower
+from data_loader import initialize_firebase, FirebaseLoader
+from write_queue import WriteQueue
+from bid_schema import memory_report
+from callback_metrics import CallbackMetrics
 import os
+import time
 
-# Firebase 초기화 함수
-def initialize_firebase():
-    try:
-        # 이미 초기화된 경우 새 앱 인스턴스 생성
-        firebase_admin.get_app()
-    except ValueError:
-        # 초기화되지 않은 경우 새로 초기화
-        import os
-        import json
-        
-        # 환경 변수에서 Firebase 인증 정보 가져오기
-        firebase_credentials = os.environ.get('FIREBASE_CREDENTIALS')
-        
-        if firebase_credentials:
-            # 환경 변수에 저장된 JSON 문자열을 딕셔너리로 변환
-            cred_dict = json.loads(firebase_credentials)
-            cred = credentials.Certificate(cred_dict)
-        else:
-            # 로컬 개발 환경일 경우 파일 사용
-            try:
-                cred = credentials.Certificate('g2b-db-6aae9-firebase-adminsdk-fbsvc-0e3b1ce560.json')
-            except FileNotFoundError:
-                print("Firebase 인증 파일을 찾을 수 없습니다.")
-                raise
-                
-        firebase_admin.initialize_app(cred, {
-            'databaseURL': 'https://g2b-db-6aae9-default-rtdb.asia-southeast1.firebasedatabase.app/'
-        })
-    print("Firebase 초기화 완료")
-
-# Firebase에서 데이터 로드하는 함수
-def load_data_from_firebase():
-    print("Firebase에서 데이터 로드 중...")
-    
-    # 기본 데이터와 사용자 입력 데이터 가져오기
-    bids_ref = db.reference('/bids')
-    user_inputs_ref = db.reference('/user_inputs')
-    
-    bids_data = bids_ref.get() or {}
-    user_inputs = user_inputs_ref.get() or {}
-    
-    # 통합 데이터 프레임 생성
-    rows = []
-    
-    for year in bids_data:
-        for month in bids_data[year]:
-            for bid_id, bid_info in bids_data[year][month].items():
-                row = bid_info.copy()
-                
-                # Firebase 컬럼명을 앱 내부 컬럼명으로 매핑
-                if "낙찰금액" in row:
-                    row["입찰금액_1순위"] = row.pop("낙찰금액")
-                if "사업금액" in row:
-                    row["계약 기간 내"] = row.pop("사업금액")
-                if "채권자명" in row:
-                    row["실수요기관"] = row.pop("채권자명")
-                if "개찰업체정보" in row:
-                    row["입찰결과_1순위"] = row.pop("개찰업체정보")
-                
-                # 사용자 입력 데이터 추가
-                if bid_id in user_inputs:
-                    user_data = user_inputs[bid_id]
-                    row['물동량 평균'] = user_data.get('물동량 평균', 0)
-                    row['용역기간(개월)'] = user_data.get('용역기간(개월)', 0)
-                
-                # 연도 및 월 정보 추가 (숫자 형태로)
-                row['예상_연도'] = int(year)
-                row['예상_입찰월'] = int(month)
-                
-                # 입찰일시를 datetime으로 변환
-                if '입찰일시' in row:
-                    try:
-                        row['예상_입찰일'] = pd.to_datetime(row['입찰일시'])
-                    except:
-                        # 변환 실패 시 기본값 설정
-                        row['예상_입찰일'] = pd.to_datetime(f"{year}-{month}-01")
-                
-                # 예상_년월 추가
-                row['예상_년월'] = f"{year}-{month}"
-                
-                # bid_id 추가 (나중에 업데이트할 때 필요)
-                row['bid_id'] = bid_id
-                
-                rows.append(row)
-    
-    df = pd.DataFrame(rows)
-    
-    # CSV 로드와 일관성을 유지하기 위한 컬럼 이름 및 타입 조정
-    if '예상_입찰일' not in df.columns and '입찰일시' in df.columns:
-        df['예상_입찰일'] = pd.to_datetime(df['입찰일시'])
-    
-    print(f"총 {len(df)} 레코드 로드 완료")
-    
-    # 예측 데이터 생성 로직 추가
-    prediction_df = generate_prediction_data(df, prediction_years=3)
-    
-    # 원본 데이터와 예측 데이터 병합
-    if not prediction_df.empty:
-        df = pd.concat([df, prediction_df], ignore_index=True)
-        print(f"예측 데이터 {len(prediction_df)}개 생성 완료, 최종 데이터 수: {len(df)}")
-    
-    # 연도별 데이터 수 확인
-    print(f"연도별 데이터 수:")
-    print(df.groupby("예상_연도")["공고명"].count())
-    
-    return df
+# gunicorn 다중 작업자 실행이면 gunicorn.conf.py가 공유 디렉터리를 지정하고 로더 프로세스를 시작함
+# (작업자는 Firebase 리스너 없이 로더가 게시한 공유 스냅샷을 매핑해서 사용)
+SHARED_SNAPSHOT_DIR = os.environ.get('SHARED_SNAPSHOT_DIR')
+
+# 예측 데이터를 생성할 연도 수 (현재 연도 기준, 예측은 연도를 조회할 때만 생성)
+PREDICTION_YEARS = int(os.environ.get('PREDICTION_YEARS', DEFAULT_PREDICTION_YEARS))
+
+# 콜백이 공유하는 현재 데이터 스냅샷 (버전 관리, 참조 교체로 게시)
+snapshots = SnapshotHolder(prediction_years=PREDICTION_YEARS)
 
 # 애플리케이션 초기화
 app = Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP], suppress_callback_exceptions=True)
 server = app.server
 
-# Firebase 초기화
+# 콜백별 실행 시간/행 수/응답 크기와 데이터 로드 상태를 /metrics로 제공
+metrics = CallbackMetrics()
+metrics.register_route(server)
+
+# Firebase 초기화 (작업자도 사용자 입력 쓰기에 사용)
 initialize_firebase()
 
-# Firebase 실시간 리스너 설정
-def setup_firebase_listeners():
-    """Firebase 실시간 리스너 설정"""
-    global df
-    
-    def on_bids_change(event):
-        """입찰 데이터 변경 시 실행되는 콜백"""
-        print(f"Firebase 데이터 변경 감지: {event.path}")
-        
-        # 데이터 다시 로드
-        global df
-        df = load_data_from_firebase()
-        print(f"데이터 업데이트 완료: 총 {len(df)}건")
-    
-    def on_user_inputs_change(event):
-        """사용자 입력 데이터 변경 시 실행되는 콜백"""
-        print(f"사용자 입력 데이터 변경: {event.path}")
-        
-        # 데이터 다시 로드
-        global df
-        df = load_data_from_firebase()
-        print(f"사용자 입력 반영 완료: 총 {len(df)}건")
-    
-    # 입찰 데이터 리스너
-    bids_ref = db.reference('/bids')
-    bids_ref.listen(on_bids_change)
-    
-    # 사용자 입력 데이터 리스너
-    user_inputs_ref = db.reference('/user_inputs')
-    user_inputs_ref.listen(on_user_inputs_change)
-    
-    print("Firebase 실시간 리스너 설정 완료")
+metrics.add_gauge("data_version", lambda: snapshots.version, "현재 게시된 데이터 스냅샷 버전")
+
+# 로컬 스냅샷 저장 위치 (마지막으로 게시된 데이터를 보관)
+SNAPSHOT_DIR = os.environ.get('SNAPSHOT_DIR', 'snapshot_cache')
 
-setup_firebase_listeners()
+# 리스너 초기 이벤트를 기다리는 최대 시간(초), 넘으면 직접 전체 로드
+LISTENER_LOAD_TIMEOUT = float(os.environ.get('LISTENER_LOAD_TIMEOUT', 60))
 
-# Firebase에서 데이터 로드
-df = load_data_from_firebase()
-print(f"총 {len(df)} 레코드 로드 완료")
-print(f"원본 데이터 최대 연도: {df[~df['공고명'].str.contains('예측')]['예상_연도'].max()}")
+# 리스너 이벤트가 몰려도 스냅샷 게시는 한 작업자가 모아서 한 번씩만 실행
+RELOAD_MERGE_WINDOW = float(os.environ.get('RELOAD_MERGE_WINDOW', 0.5))
+
+# 시작 시 컬럼별 메모리 사용량 출력 여부 (진단용, MEMORY_REPORT=1)
+MEMORY_REPORT = os.environ.get('MEMORY_REPORT', '0') == '1'
+
+load_start = time.perf_counter()
+if SHARED_SNAPSHOT_DIR:
+    # 작업자: 로더 프로세스가 게시한 공유 스냅샷을 매핑하고 새 버전이 나오면 교체
+    # (리스너가 없으므로 저장소는 비어 있고, 수정 사항은 현재 스냅샷에 직접 반영)
+    # 수정 사항은 이 작업자에만 바로 보이고, 다른 작업자는 로더가 다시 게시한 뒤에 보임
+    bid_store = BidStore()
+    shared_follower = SharedSnapshotFollower(
+        SHARED_SNAPSHOT_DIR, snapshots,
+        interval=float(os.environ.get('SHARED_SNAPSHOT_INTERVAL', 1.0)),
+        on_switch=lambda marker, seconds: metrics.set_gauge(
+            "shared_snapshot_map_seconds", seconds, "마지막 공유 스냅샷 매핑에 걸린 시간(초)"
+        ),
+    )
+    if not shared_follower.wait_first(LISTENER_LOAD_TIMEOUT):
+        print("공유 스냅샷이 아직 없습니다. 로더가 게시하면 자동으로 반영됩니다.")
+    shared_follower.start()
+    metrics.add_gauge("shared_snapshot_switches_total", lambda: shared_follower.switches, "공유 스냅샷 전환 횟수", kind="counter")
+else:
+    # 단일 프로세스: 이 프로세스에서 Firebase 리스너를 열고 직접 게시
+    firebase_loader = FirebaseLoader(
+        snapshots,
+        merge_window=RELOAD_MERGE_WINDOW,
+        listener_load_timeout=LISTENER_LOAD_TIMEOUT,
+        on_publish=lambda snapshot, seconds: metrics.set_gauge(
+            "data_publish_seconds", seconds, "마지막 스냅샷 게시에 걸린 시간(초)"
+        ),
+    )
+    bid_store = firebase_loader.bid_store
+    reload_scheduler = firebase_loader.reload_scheduler
+    load_data_from_firebase = firebase_loader.load_data_from_firebase
+    metrics.add_gauge("reloads_total", lambda: reload_scheduler.stats()["reloads_run"], "실행된 데이터 다시 로드 횟수", kind="counter")
+    metrics.add_gauge("reload_failures_total", lambda: reload_scheduler.stats()["reloads_failed"], "실패한 데이터 다시 로드 횟수", kind="counter")
+    metrics.add_gauge("reload_triggers_total", lambda: reload_scheduler.stats()["triggers_received"], "받은 데이터 다시 로드 요청 수", kind="counter")
+
+    # 연도 선택으로 아직 받지 않은 연도를 조회하면 그 연도를 먼저 받음
+    snapshots.set_year_loader(firebase_loader.ensure_year)
+
+    snapshot_persister = SnapshotPersister(SNAPSHOT_DIR)
+    snapshots.subscribe(snapshot_persister.schedule)
+
+    # 로컬 스냅샷이 있으면 즉시 서비스를 시작하고 Firebase 동기화는 백그라운드에서 진행
+    # (스냅샷이 없으면 기존처럼 Firebase에서 로드할 때까지 대기)
+    start_from_snapshot(snapshots, SNAPSHOT_DIR, firebase_loader.reconcile_with_firebase)
+metrics.set_gauge("data_load_seconds", time.perf_counter() - load_start, "시작 시 데이터 로드에 걸린 시간(초)")
+df = snapshots.current().df
+print(f"총 {len(df)} 레코드 로드 완료 (버전 {snapshots.version})")
+print(f"원본 데이터 최대 연도: {snapshots.current().index.max_original_year}, 예측 최대 연도: {snapshots.current().max_prediction_year}")
+if MEMORY_REPORT and not df.empty:
+    memory_report(df)
 
 # 항상 고정된 월 그룹 사용: (1-4), (5-8), (9-12)
 months = list(range(1, 13))
@@ -174,55 +110,74 @@ default_page = next(i for i, group in enumerate(month_groups) if today.month in
 
 initial_state = {
     "year": today.year,
-    "month_page": default_page  # 현재 월이 포함된 그룹으로 시작
+    "month_page": default_page,  # 현재 월이 포함된 그룹으로 시작
+    # 브라우저의 페이지 이동 계산용 요약 (데이터 버전이 바뀌면 update_next_bids에서 갱신)
+    "navigation_summary": callbacks.build_navigation_summary(snapshots.current()),
 }
 
 # 앱 레이아웃 설정
 app.layout = create_layout(initial_state)
 
 # 콜백 등록
-callbacks.register_callbacks(app, df)
+callbacks.register_callbacks(app, snapshots, metrics)
+
+# 사용자 입력 쓰기 큐 (bid_id별로 병합 후 다중 경로 update로 백그라운드 전송)
+def write_user_inputs(payload):
+    db.reference('/user_inputs').update(payload)
+
+user_input_writes = WriteQueue(write_user_inputs)
 
 # 데이터 업데이트 함수 (callbacks.py 파일에서 접근 가능하도록 전역 함수로 추가)
-def update_firebase_data(bid_id, field, value):
-    """Firebase에 데이터 업데이트 함수"""
+def update_firebase_batch(edits):
+    """
+    여러 입찰의 사용자 입력을 한 번에 업데이트하는 함수
+
+    Firebase 전송은 쓰기 큐에 맡기고, 로컬 데이터는 즉시 새 스냅샷으로 반영한다.
+
+    Args:
+        edits (dict): {bid_id: {앱 컬럼명: 값}}
+    """
     try:
-        # 앱 내부 컬럼명을 Firebase 컬럼명으로 변환
-        firebase_field = field
-        if field == "입찰금액_1순위":
-            firebase_field = "낙찰금액"
-        elif field == "계약 기간 내":
-            firebase_field = "사업금액"
-        elif field == "실수요기관":
-            firebase_field = "채권자명"
-        elif field == "입찰결과_1순위":
-            firebase_field = "개찰업체정보"
-        
-        # 사용자 입력 레퍼런스
-        user_input_ref = db.reference(f'/user_inputs/{bid_id}')
-        
-        # 현재 값 가져오기
-        current_data = user_input_ref.get() or {}
-        
-        # 값 업데이트
-        current_data[firebase_field] = float(value)
-        current_data['마지막_수정일'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        current_data['수정자'] = 'dashboard_user'
-        
-        # Firebase 업데이트
-        user_input_ref.set(current_data)
-        
-        # 로컬 DataFrame도 업데이트
-        global df
-        df.loc[df['bid_id'] == bid_id, field] = float(value)
+        # 앱 내부 컬럼명을 Firebase 컬럼명으로 변환하고 값 검증
+        firebase_edits = {
+            bid_id: {
+                APP_TO_FIREBASE_COLUMNS.get(field, field): float(value)
+                for field, value in fields.items()
+            }
+            for bid_id, fields in edits.items()
+        }
+    except (TypeError, ValueError) as e:
+        print(f"데이터 업데이트 오류: {e}")
+        return False, f"업데이트 중 오류가 발생했습니다: {str(e)}"
+    
+    # Firebase 전송은 백그라운드에서 (수정 정보 포함, 로컬 반영이 실패해도 전송)
+    modified_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    for bid_id, fields in firebase_edits.items():
+        user_input_writes.enqueue(bid_id, {**fields, '마지막_수정일': modified_at, '수정자': 'dashboard_user'})
+    
+    try:
+        # 로컬 데이터 업데이트 (기존 스냅샷은 수정하지 않고 새 스냅샷 게시)
+        def rebuild():
+            if not bid_store.publishable:
+                # 로컬 스냅샷으로 시작해 Firebase 동기화 전이거나 공유 스냅샷 작업자면 현재 데이터에 직접 반영
+                return apply_user_input_overlay(snapshots.current().df, edits)
+            bid_store.apply_user_inputs_event("patch", "/", WriteQueue.build_payload(firebase_edits))
+            # 아직 받지 않은 연도는 현재 데이터의 행을 유지
+            return bid_store.to_dataframe(snapshots.current().df)
         
+        snapshots.update(rebuild)
         return True, "데이터가 성공적으로 업데이트되었습니다."
     except Exception as e:
         print(f"데이터 업데이트 오류: {e}")
-        return False, f"업데이트 중 오류가 발생했습니다: {str(e)}"
+        return False, f"Firebase에는 저장하지만 화면 반영 중 오류가 발생했습니다: {str(e)}"
+
+def update_firebase_data(bid_id, field, value):
+    """Firebase에 데이터 업데이트 함수"""
+    return update_firebase_batch({bid_id: {field: value}})
 
 # app 객체에 함수 추가 (callbacks.py에서 접근할 수 있도록)
 app.update_firebase_data = update_firebase_data
+app.update_firebase_batch = update_firebase_batch
 
 # 실행
 if __name__ == "__main__":
@@ -0,0 +1,442 @@
+"""
+합성 입찰 데이터로 데이터 처리 함수와 Dash 콜백의 시간/최대 메모리를 측정
+
+사용법:
+    python benchmarks/run_benchmarks.py                       # 10k, 100k, 1M
+    python benchmarks/run_benchmarks.py --sizes 10000 --repeat 3
+    python benchmarks/run_benchmarks.py --sizes 10000 --save-baseline
+    python benchmarks/run_benchmarks.py --sizes 10000 --baseline benchmarks/baseline.json
+
+결과는 JSON(--output, 기본 benchmarks/results/<시각>.json)으로 저장되며,
+--baseline을 지정하면 같은 (측정 항목, 크기)끼리 시간을 비교해서 출력한다.
+"""
+import argparse
+import contextlib
+import copy
+import gc
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import types
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pandas as pd
+from dash._callback_context import context_value
+from dash._utils import AttributeDict
+
+import callbacks
+from bid_schema import prediction_mask
+from cache import LRUCache
+from data_store import APP_TO_FIREBASE_COLUMNS, SnapshotHolder
+from preprocess import generate_prediction_data, predictions_for_year, preprocess_bid_data
+from reconcile import find_successor_dates
+from synthetic_bids import generate_bids, to_firebase_tree
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+BASELINE_FILE = os.path.join(ROOT, "benchmarks", "baseline.json")
+
+# preprocess_bid_data 청크 단위 읽기 측정에 사용할 청크 크기(행)
+CSV_CHUNK_SIZE = 50_000
+
+# 기준 대비 이 비율 이상 느려지고, 차이가 NOISE_FLOOR초 이상이면 성능 저하로 표시
+DEFAULT_THRESHOLD = 1.2
+NOISE_FLOOR = 0.005
+
+
+def measure(func, repeat=1, memory=True):
+    """
+    func()를 repeat번 실행한 시간과, 추가로 한 번 실행한 최대 메모리 측정
+
+    tracemalloc은 실행을 느리게 하므로 시간 측정과 메모리 측정은 따로 실행한다.
+
+    Returns:
+        tuple: (측정 결과 dict, 마지막 실행 결과)
+    """
+    runs = []
+    result = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = func()
+        runs.append(time.perf_counter() - start)
+
+    peak = None
+    if memory:
+        result = None
+        gc.collect()
+        tracemalloc.start()
+        try:
+            result = func()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return {"seconds": min(runs), "runs": runs, "peak_memory_bytes": peak}, result
+
+
+@contextlib.contextmanager
+def quiet():
+    """측정 대상 함수의 진행 상황 출력(print) 숨김"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+# ---------------------------------------------------------------------------
+# Firebase 대역 (app.load_data_from_firebase 측정용)
+# ---------------------------------------------------------------------------
+
+class FakeReference:
+    """db.reference 대역: FakeReference.tree의 데이터를 get()으로 반환"""
+
+    tree = {"bids": {}, "user_inputs": {}}
+
+    def __init__(self, path="/"):
+        self.segments = [segment for segment in path.split("/") if segment]
+
+    def get(self, *args, **kwargs):
+        node = FakeReference.tree
+        for segment in self.segments:
+            node = node.get(segment) if isinstance(node, dict) else None
+        return node
+
+    def listen(self, callback):
+        # 리스너 이벤트 없음 (app은 시간 초과 후 연도별 데이터를 직접 조회)
+        return types.SimpleNamespace(close=lambda: None)
+
+    def set(self, value):
+        pass
+
+    def update(self, value):
+        pass
+
+
+def import_app(bids_data, user_inputs):
+    """
+    Firebase 접속 없이 app 모듈을 import
+
+    firebase_admin 초기화와 db.reference를 대역으로 바꾸고, 리스너 대기 없이
+    바로 연도별 데이터를 직접 조회해서 초기 데이터를 읽도록 환경 변수를 설정한다.
+    """
+    import firebase_admin
+    from firebase_admin import db
+
+    firebase_admin.get_app = lambda *args, **kwargs: None
+    db.reference = FakeReference
+    FakeReference.tree = {"bids": bids_data, "user_inputs": user_inputs}
+    os.environ["LISTENER_LOAD_TIMEOUT"] = "0"
+    os.environ["SNAPSHOT_DIR"] = tempfile.mkdtemp(prefix="bench_snapshot_")
+    with quiet():
+        import app
+    # 측정 중 로컬 스냅샷 저장(백그라운드 타이머)이 실행되지 않도록 중지
+    app.snapshot_persister.enabled = False
+    with app.snapshot_persister._lock:
+        if app.snapshot_persister._timer is not None:
+            app.snapshot_persister._timer.cancel()
+            app.snapshot_persister._timer = None
+    return app
+
+
+# ---------------------------------------------------------------------------
+# 콜백 직접 호출
+# ---------------------------------------------------------------------------
+
+class CallbackRecorder:
+    """
+    register_callbacks에 Dash app 대신 넘겨서 서버 콜백 함수를 이름별로 모음
+
+    쓰기 콜백이 호출하는 app.update_firebase_batch는 전송 없이 기록만 한다.
+    """
+
+    def __init__(self):
+        self.functions = {}
+        self.writes = []
+
+    def callback(self, *args, **kwargs):
+        def decorator(func):
+            self.functions[func.__name__] = func
+            return func
+        return decorator
+
+    def clientside_callback(self, *args, **kwargs):
+        pass
+
+    def update_firebase_batch(self, edits):
+        self.writes.append(edits)
+        return True, "데이터가 성공적으로 업데이트되었습니다."
+
+    def update_firebase_data(self, bid_id, field, value):
+        return self.update_firebase_batch({bid_id: {field: value}})
+
+
+@contextlib.contextmanager
+def triggered(prop_id=None, value=None):
+    """callback_context.triggered를 사용하는 콜백을 Dash 요청 밖에서 호출하기 위한 문맥"""
+    inputs = [{"prop_id": prop_id, "value": value}] if prop_id else []
+    token = context_value.set(AttributeDict(triggered_inputs=inputs))
+    try:
+        yield
+    finally:
+        context_value.reset(token)
+
+
+def clear_callback_caches(snapshots=None):
+    """callbacks 모듈의 버전별 캐시(차트, 월별 섹션, 전체 테이블)와 연도별 데이터 캐시를 모두 비움"""
+    for value in vars(callbacks).values():
+        if isinstance(value, LRUCache):
+            value.clear()
+    if snapshots is not None:
+        snapshots.year_cache.clear()
+
+
+def choose_inputs(snapshot):
+    """데이터가 가장 많은 연도/월과 그 월의 첫 원본 공고를 실제 사용 입력으로 선택"""
+    df = snapshot.df
+    originals = df[~df["is_prediction"]]
+    year = int(originals["예상_연도"].value_counts().idxmax())
+    in_year = originals[originals["예상_연도"] == year]
+    month_num = int(in_year["예상_입찰월"].value_counts().idxmax())
+    bid = in_year[in_year["예상_입찰월"] == month_num].iloc[0]
+    return {
+        "year": year,
+        "month": f"{year}-{month_num:02d}",
+        "month_view": (month_num - 1) // 4,
+        "bid_name": str(bid["공고명"]),
+        "bid_id": str(bid["bid_id"]),
+    }
+
+
+def callback_cases(functions, inputs):
+    """
+    (이름, 호출 함수) 목록
+
+    각 호출은 실제 화면 조작에서 Dash가 넘기는 값과 같은 형태의 입력을 사용한다.
+    """
+    f = functions
+    year, month, bid = inputs["year"], inputs["month"], inputs["bid_name"]
+    sort_by = [{"column_id": "계약금액(원)", "direction": "desc"}]
+    mm_filter = "{평균M/M} = 0 || {평균M/M} is blank"
+
+    def table_page():
+        with triggered("full-data-table.filter_query", mm_filter):
+            return f["update_full_table_page"](0, callbacks.FULL_TABLE_PAGE_SIZE, sort_by, mm_filter, year)
+
+    def edit_table():
+        with triggered("full-data-table.page_current", 0):
+            page = f["update_full_table_page"](0, callbacks.FULL_TABLE_PAGE_SIZE, None, "", year)[0]
+        previous = copy.deepcopy(page)
+        page[0]["평균M/M"] = (page[0].get("평균M/M") or 0) + 1
+        return f["update_database_from_table"](time.time(), page, previous)
+
+    def filter_buttons():
+        with triggered("filter-mm-btn.n_clicks", 1):
+            return f["filter_table"](1, None, None)
+
+    return [
+        ("update_monthly_chart", lambda: f["update_monthly_chart"](year)),
+        ("update_next_bids", lambda: f["update_next_bids"](year, 0, None)),
+        ("update_monthly_bids", lambda: f["update_monthly_bids"](year, inputs["month_view"], None, None)),
+        ("update_monthly_bids[selected]", lambda: f["update_monthly_bids"](year, inputs["month_view"], month, bid)),
+        ("select_month_from_dropdown", lambda: f["select_month_from_dropdown"](month, year)),
+        ("update_selection", lambda: f["update_selection"]({"month": month, "bid": bid})),
+        ("update_full_table", lambda: f["update_full_table"](year)),
+        ("update_full_table_page", table_page),
+        ("export_full_table", lambda: f["export_full_table"](1, sort_by, mm_filter, year)),
+        ("update_database_from_table", edit_table),
+        ("filter_table", filter_buttons),
+        ("open_edit_modal", lambda: f["open_edit_modal"](1, bid)),
+        ("close_modal", lambda: f["close_modal"](1)),
+        ("save_changes", lambda: f["save_changes"](1, inputs["bid_id"], 5, 12)),
+    ]
+
+
+# ---------------------------------------------------------------------------
+# 실행
+# ---------------------------------------------------------------------------
+
+def run_size(size, app, args):
+    """한 데이터 크기에 대한 모든 측정 결과 목록"""
+    results = []
+
+    def record(name, func, rows=None):
+        with quiet():
+            stats, result = measure(func, args.repeat, memory=not args.no_memory)
+        entry = {"benchmark": name, "size": size, **stats}
+        if rows is not None:
+            entry["rows"] = rows(result)
+        results.append(entry)
+        peak = stats["peak_memory_bytes"]
+        peak_text = f", 최대 메모리 {peak / 1024 / 1024:,.1f} MB" if peak is not None else ""
+        print(f"  {name}: {stats['seconds'] * 1000:,.1f} ms{peak_text}")
+        return result
+
+    print(f"[{size:,}건] 합성 데이터 생성 중...")
+    bids_csv = generate_bids(size, seed=args.seed)
+    bids_data, user_inputs = to_firebase_tree(bids_csv, APP_TO_FIREBASE_COLUMNS)
+
+    with tempfile.TemporaryDirectory(prefix="bench_csv_") as directory:
+        csv_path = os.path.join(directory, "bids.csv")
+        bids_csv.to_csv(csv_path, index=False)
+        del bids_csv
+
+        processed = record(
+            "preprocess_bid_data",
+            lambda: preprocess_bid_data(csv_path, args.prediction_years),
+            rows=len,
+        )
+        # 큰 파일용 청크 단위 읽기 (최대 메모리 비교용)
+        record(
+            "preprocess_bid_data[chunked]",
+            lambda: preprocess_bid_data(csv_path, args.prediction_years, chunksize=CSV_CHUNK_SIZE),
+            rows=len,
+        )
+
+    originals = processed[~prediction_mask(processed)]
+    originals = originals[[col for col in originals.columns if col not in ("원본_입찰일", "예측_입찰일", "is_prediction", "prediction_count")]]
+    del processed
+    # 예측과 실제 입찰 매칭 (아래 예측 생성 측정에도 포함됨, 스냅샷마다 한 번 계산)
+    record(
+        "find_successor_dates",
+        lambda: find_successor_dates(originals),
+        rows=lambda successors: int((~np.isnat(successors)).sum()),
+    )
+    record(
+        "generate_prediction_data",
+        lambda: generate_prediction_data(originals, args.prediction_years),
+        rows=len,
+    )
+    # 화면에서 한 연도를 처음 조회할 때 생성하는 예측 (예측 마지막 연도 기준)
+    record(
+        "predictions_for_year",
+        lambda: predictions_for_year(originals, datetime.now().year + args.prediction_years),
+        rows=len,
+    )
+    del originals
+
+    FakeReference.tree = {"bids": bids_data, "user_inputs": user_inputs}
+    df = record("load_data_from_firebase", app.load_data_from_firebase, rows=len)
+    df = app.bid_store.to_dataframe()
+
+    snapshots = SnapshotHolder(prediction_years=args.prediction_years)
+    record("snapshot_publish", lambda: snapshots.publish(df), rows=lambda snapshot: len(snapshot.df))
+
+    recorder = CallbackRecorder()
+    callbacks.register_callbacks(recorder, snapshots)
+    inputs = choose_inputs(snapshots.current())
+
+    for name, call in callback_cases(recorder.functions, inputs):
+        # 첫 호출(캐시 없음)과 같은 버전에서 다시 호출(캐시 사용)을 따로 측정
+        def cold():
+            clear_callback_caches(snapshots)
+            return call()
+        record(f"callbacks.{name}", cold)
+        record(f"callbacks.{name}[warm]", call)
+
+    clear_callback_caches(snapshots)
+    return results
+
+
+def environment():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "git_commit": commit,
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+    }
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    기준 결과와 시간 비교표 출력
+
+    Returns:
+        list: 성능 저하로 판단된 (측정 항목, 크기) 목록
+    """
+    previous = {(entry["benchmark"], entry["size"]): entry for entry in baseline.get("results", [])}
+    regressions = []
+    print(f"\n기준 결과와 비교 ({baseline.get('git_commit') or '-'}, {baseline.get('created_at', '-')})")
+    print(f"{'측정 항목':<45} {'크기':>10} {'기준(ms)':>12} {'현재(ms)':>12} {'비율':>7}")
+    for entry in results:
+        key = (entry["benchmark"], entry["size"])
+        if key not in previous:
+            continue
+        before, after = previous[key]["seconds"], entry["seconds"]
+        ratio = after / before if before > 0 else float("inf")
+        slower = ratio >= threshold and after - before >= NOISE_FLOOR
+        if slower:
+            regressions.append(key)
+        mark = "  느려짐" if slower else ""
+        print(f"{key[0]:<45} {key[1]:>10,} {before * 1000:>12,.1f} {after * 1000:>12,.1f} {ratio:>6.2f}x{mark}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="합성 입찰 데이터 성능 측정")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="합성 입찰 수 목록")
+    parser.add_argument("--repeat", type=int, default=1, help="시간 측정 반복 횟수 (최솟값 사용)")
+    parser.add_argument("--prediction-years", type=int, default=3, help="예측 생성 연도 수 (SnapshotHolder 기본값과 동일)")
+    parser.add_argument("--seed", type=int, default=0, help="합성 데이터 난수 시드")
+    parser.add_argument("--no-memory", action="store_true", help="최대 메모리 측정 생략")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본: benchmarks/results/<시각>.json)")
+    parser.add_argument("--baseline", help="비교할 기준 결과 JSON 경로")
+    parser.add_argument("--save-baseline", action="store_true", help=f"결과를 기준 결과({BASELINE_FILE})로도 저장")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="성능 저하로 판단할 시간 비율")
+    parser.add_argument("--fail-on-regression", action="store_true", help="성능 저하가 있으면 종료 코드 1")
+    args = parser.parse_args(argv)
+
+    # 콜백 측정 중 차트 캐시를 채우는 백그라운드 스레드가 함께 실행되지 않도록 비활성화
+    callbacks.start_chart_warm_up = lambda snapshots, snapshot: None
+
+    # app import 시 초기 로드용으로 작은 데이터 사용
+    app = import_app(*to_firebase_tree(generate_bids(100, seed=args.seed), APP_TO_FIREBASE_COLUMNS))
+
+    report = environment()
+    report.update({
+        "sizes": args.sizes,
+        "repeat": args.repeat,
+        "prediction_years": args.prediction_years,
+        "seed": args.seed,
+        "results": [],
+    })
+    for size in args.sizes:
+        report["results"].extend(run_size(size, app, args))
+
+    output = args.output or os.path.join(RESULTS_DIR, datetime.now().strftime("%Y%m%d_%H%M%S") + ".json")
+    paths = [output] + ([BASELINE_FILE] if args.save_baseline else [])
+    for path in paths:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {path}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(report["results"], json.load(f), args.threshold)
+        if regressions:
+            print(f"\n성능 저하 {len(regressions)}건")
+            if args.fail_on_regression:
+                return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+import os
+import numpy as np
+import pandas as pd
+
+# 합성 데이터의 기준이 되는 실제 입찰 목록
+SOURCE_CSV = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "DB", "2324List.csv")
+
+# 합성 데이터에 포함할 컬럼 (값이 거의 비어 있는 집계용 컬럼은 제외)
+SYNTHETIC_COLUMNS = [
+    "입찰일시", "실수요기관", "공고명", "Min", "Max", "물동량 평균", "용역기간(개월)",
+    "계약 기간 내", "월 평균 환산", "입찰결과_1순위", "2순위", "입찰금액_1순위", "예가 대비",
+]
+
+# Firebase 키에 사용할 수 없는 문자 (migrate_to_firebase.clean_firebase_key와 동일한 변환)
+FIREBASE_KEY_REPLACEMENTS = [
+    (".", "_dot_"), ("$", "_dollar_"), ("#", "_hash_"),
+    ("[", "_lbracket_"), ("]", "_rbracket_"), ("/", "_slash_"),
+]
+
+
+def _format_amounts(values):
+    """정수 금액을 원본 CSV처럼 천 단위 쉼표 문자열로 변환 (결측값은 유지)"""
+    return pd.Series(values).map(lambda value: value if pd.isna(value) else f"{int(value):,}")
+
+
+def _parse_amounts(series):
+    return pd.to_numeric(series.astype(str).str.replace(",", "", regex=False), errors="coerce")
+
+
+def generate_bids(size, seed=0, source_csv=SOURCE_CSV):
+    """
+    DB/2324List.csv의 분포를 유지하면서 size건으로 늘린 합성 입찰 목록 생성
+
+    원본 행을 복원 추출한 뒤 다음 값을 조정한다.
+      - 실수요기관: 기관당 입찰 수가 원본과 비슷하도록 기관 수를 size에 비례해 늘림
+      - 공고명: 행마다 고유한 번호를 붙임
+      - 입찰일시: 원본의 연/월 분포를 유지하고 일자만 무작위로 지정
+      - 용역기간(개월): 원본 분포에서 추출한 값 그대로 사용
+      - 계약 기간 내: 원본 금액에 로그정규 잡음(약 ±10%)을 곱함
+      - 입찰금액_1순위: 원본의 낙찰률(입찰금액/계약금액)을 새 계약금액에 적용
+
+    Args:
+        size (int): 생성할 입찰 수
+        seed (int): 난수 시드 (같은 시드면 같은 데이터)
+        source_csv (str): 분포 기준 CSV 경로
+
+    Returns:
+        pandas.DataFrame: 원본 CSV와 같은 형식의 입찰 목록 (금액은 쉼표 문자열)
+    """
+    rng = np.random.default_rng(seed)
+    source = pd.read_csv(source_csv)[SYNTHETIC_COLUMNS]
+    picks = rng.integers(0, len(source), size)
+    df = source.iloc[picks].reset_index(drop=True)
+
+    # 기관 수를 데이터 크기에 비례해서 증가 (원본 기관명 + 지사 번호)
+    replicas = max(1, size // len(source))
+    branch = rng.integers(0, replicas, size)
+    organizations = df["실수요기관"].astype(str)
+    df["실수요기관"] = organizations.where(branch == 0, organizations + " " + pd.Series(branch).astype(str) + "지사")
+
+    df["공고명"] = df["공고명"].astype(str) + " #" + pd.Series(np.arange(size)).astype(str)
+
+    # 연/월은 원본 분포 그대로, 일자만 1~28일 중 무작위
+    source_dates = pd.to_datetime(df["입찰일시"])
+    days = rng.integers(1, 29, size)
+    df["입찰일시"] = pd.to_datetime({
+        "year": source_dates.dt.year, "month": source_dates.dt.month, "day": days,
+    }).dt.strftime("%Y-%m-%d 00:00:00")
+
+    # 금액: 계약금액에 잡음을 주고 낙찰률은 원본 행의 값을 유지
+    contract = _parse_amounts(df["계약 기간 내"])
+    winning = _parse_amounts(df["입찰금액_1순위"])
+    noise = rng.lognormal(mean=0.0, sigma=0.1, size=size)
+    new_contract = (contract * noise).round()
+    new_winning = (new_contract * (winning / contract.where(contract > 0))).round()
+    df["계약 기간 내"] = _format_amounts(new_contract)
+    df["입찰금액_1순위"] = _format_amounts(new_winning)
+
+    duration = pd.to_numeric(df["용역기간(개월)"], errors="coerce")
+    df["월 평균 환산"] = _format_amounts((new_contract / duration.where(duration > 0)).round())
+    return df
+
+
+def _firebase_key(key):
+    key = str(key)
+    for char, replacement in FIREBASE_KEY_REPLACEMENTS:
+        key = key.replace(char, replacement)
+    return key
+
+
+def to_firebase_tree(df, field_names=None):
+    """
+    합성 입찰 목록을 Firebase /bids, /user_inputs 트리 형식으로 변환
+
+    /bids/{연도}/{월}/{bid_id} 아래에 기본 정보를, /user_inputs/{bid_id} 아래에
+    물동량 평균/용역기간을 저장하는 migrate_to_firebase.py의 구조를 따른다.
+
+    Args:
+        df (pandas.DataFrame): generate_bids 결과
+        field_names (dict): 컬럼명 -> Firebase 필드명 (예: data_store.APP_TO_FIREBASE_COLUMNS)
+
+    Returns:
+        tuple: (bids_data, user_inputs)
+    """
+    field_names = field_names or {}
+    dates = pd.to_datetime(df["입찰일시"])
+    years = dates.dt.year.astype(str).tolist()
+    months = dates.dt.month.astype(str).str.zfill(2).tolist()
+
+    user_columns = ["물동량 평균", "용역기간(개월)"]
+    base = df.drop(columns=user_columns).fillna("")
+    base.columns = [_firebase_key(field_names.get(col, col)) for col in base.columns]
+    records = base.to_dict("records")
+
+    mm = pd.to_numeric(df["물동량 평균"].astype(str).str.replace(",", "", regex=False), errors="coerce").fillna(0.0)
+    duration = pd.to_numeric(df["용역기간(개월)"], errors="coerce").fillna(0.0)
+
+    bids_data = {}
+    user_inputs = {}
+    for index, (year, month, record, mm_value, duration_value) in enumerate(
+        zip(years, months, records, mm.tolist(), duration.tolist())
+    ):
+        bid_id = f"bid_{index}"
+        bids_data.setdefault(year, {}).setdefault(month, {})[bid_id] = record
+        user_inputs[bid_id] = {
+            "물동량 평균": mm_value,
+            "용역기간(개월)": duration_value,
+            "마지막_수정일": "2025-01-01 00:00:00",
+            "수정자": "initial_import",
+        }
+    return bids_data, user_inputs
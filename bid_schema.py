@@ -0,0 +1,118 @@
+import numpy as np
+import pandas as pd
+
+# 통합 데이터 프레임(원본 + 예측)의 컬럼별 타입
+#  - 반복되는 텍스트(기관명, 업체명, 입찰 ID 등)는 category
+#  - 금액은 int64, 연도/월/예측 차수는 작은 정수
+BID_SCHEMA = {
+    "실수요기관": "category",
+    "입찰결과_1순위": "category",
+    "입찰일시": "category",
+    "예상_년월": "category",
+    "bid_id": "category",
+    "base_bid_id": "category",
+    "계약 기간 내": "int64",
+    "입찰금액_1순위": "int64",
+    "예상_연도": "int16",
+    "예상_입찰월": "int8",
+    "is_prediction": "bool",
+    "prediction_count": "int16",
+}
+
+# 쉼표 등이 포함된 문자열로 저장된 금액 컬럼
+AMOUNT_COLUMNS = ["계약 기간 내", "입찰금액_1순위"]
+
+# 예측 표시(is_prediction)가 없는 이전 형식 예측 행의 공고명 끝 (예: "공고명 (3차 예측)", "공고명 (예측)")
+LEGACY_PREDICTION_PATTERN = r" \((?:\d+차 )?예측\)$"
+
+
+def _to_amounts(series):
+    """'143,930,000' 같은 금액 문자열/숫자를 정수로 변환 (빈 값은 0)"""
+    if pd.api.types.is_numeric_dtype(series):
+        return series.fillna(0).astype("int64")
+    text = series.astype(str).str.replace(r"[^\d.]", "", regex=True)
+    return pd.to_numeric(text, errors="coerce").fillna(0).astype("int64")
+
+
+def prediction_mask(df):
+    """
+    행별 예측 여부 (is_prediction 컬럼이 있으면 그대로, 없으면 공고명의 예측 차수 표시로 판단)
+
+    Returns:
+        numpy.ndarray: 예측 행은 True
+    """
+    if "is_prediction" in df.columns and df["is_prediction"].dtype == bool:
+        return df["is_prediction"].to_numpy()
+    return df["공고명"].astype(str).str.contains(LEGACY_PREDICTION_PATTERN, regex=True).to_numpy(dtype=bool)
+
+
+def apply_bid_schema(df):
+    """
+    통합 데이터 프레임을 BID_SCHEMA 타입으로 변환한 새 데이터 프레임 반환
+
+    예측 여부(is_prediction)와 예측 차수(prediction_count)는 원본 행도 값을
+    갖도록 채운다. 예측 행은 생성할 때 is_prediction과 원본 입찰의 base_bid_id를
+    설정하므로, 값이 없는 행(원본 행과 이전 형식 데이터)만 여기서 채운다.
+
+    Args:
+        df (pandas.DataFrame): 원본 행과 예측 행을 합친 데이터 프레임
+
+    Returns:
+        pandas.DataFrame: 타입이 정리된 데이터 프레임
+    """
+    if df.empty:
+        return df
+    df = df.copy()
+
+    # 예측 표시가 없는 행만 공고명의 예측 차수 표시로 판단 (이전 형식 데이터에 남은 예측 행)
+    if "is_prediction" in df.columns and df["is_prediction"].dtype != bool:
+        legacy = pd.Series(prediction_mask(df.drop(columns="is_prediction")), index=df.index)
+        df["is_prediction"] = df["is_prediction"].astype("boolean").fillna(legacy).astype(bool)
+    else:
+        df["is_prediction"] = prediction_mask(df)
+    if "prediction_count" in df.columns:
+        df["prediction_count"] = df["prediction_count"].fillna(0)
+    else:
+        df["prediction_count"] = 0
+
+    # 원본 행(과 원본을 알 수 없는 이전 형식 예측 행)은 자기 자신의 bid_id
+    if "bid_id" in df.columns:
+        if "base_bid_id" in df.columns:
+            df["base_bid_id"] = df["base_bid_id"].astype(object).where(df["base_bid_id"].notna(), df["bid_id"].astype(object))
+        else:
+            df["base_bid_id"] = df["bid_id"]
+
+    for col in AMOUNT_COLUMNS:
+        if col in df.columns:
+            df[col] = _to_amounts(df[col])
+
+    for col, dtype in BID_SCHEMA.items():
+        if col not in df.columns or col in AMOUNT_COLUMNS or df[col].dtype == dtype:
+            continue
+        if dtype == "category":
+            df[col] = df[col].astype("category")
+        elif np.issubdtype(np.dtype(dtype), np.integer):
+            df[col] = df[col].fillna(0).astype(dtype)
+        else:
+            df[col] = df[col].astype(dtype)
+
+    # bid_id와 base_bid_id는 같은 범주를 공유
+    if "base_bid_id" in df.columns:
+        df["base_bid_id"] = df["base_bid_id"].cat.set_categories(df["bid_id"].cat.categories)
+
+    return df
+
+
+def memory_report(df, label="통합 데이터"):
+    """
+    컬럼별 메모리 사용량(바이트)을 출력하고 반환
+
+    Returns:
+        pandas.Series: 컬럼별 바이트 수 (인덱스 포함, 큰 순서)
+    """
+    usage = df.memory_usage(deep=True).sort_values(ascending=False)
+    print(f"{label} 메모리 사용량: 총 {usage.sum():,} bytes ({len(df)}행)")
+    for col, size in usage.items():
+        dtype = df[col].dtype if col in df.columns else "-"
+        print(f"  {col}: {size:,} bytes ({dtype})")
+    return usage
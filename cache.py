@@ -0,0 +1,57 @@
+import threading
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    스레드 안전한 LRU 캐시
+
+    데이터 버전을 키에 포함해서 사용하면 (예: (version, year)) 데이터가 바뀔 때
+    이전 버전 항목은 자연스럽게 밀려나므로 별도의 무효화가 필요 없다.
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return self._items[key]
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def get_or_build(self, key, build):
+        """캐시에 있으면 반환하고, 없으면 build()로 만들어 저장 후 반환"""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = build()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._items
+
+    def __len__(self):
+        with self._lock:
+            return len(self._items)
+
+
+_MISSING = object()
@@ -0,0 +1,222 @@
+import functools
+import threading
+import time
+from flask import Response
+from dash.exceptions import PreventUpdate
+
+# 콜백 실행 시간 히스토그램 구간(초)
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 현재 스레드에서 실행 중인 콜백 (행 수 기록/응답 크기 연결용)
+_local = threading.local()
+
+
+def note_rows(scanned, returned):
+    """
+    실행 중인 콜백이 조회한 행 수와 화면에 돌려준 행 수를 기록
+
+    계측된 콜백 밖에서 호출되면 아무것도 하지 않는다.
+
+    Args:
+        scanned (int): 조회(필터링/정렬)한 행 수
+        returned (int): 응답에 포함한 행 수
+    """
+    rows = getattr(_local, "rows", None)
+    if rows is not None:
+        rows[0] += int(scanned)
+        rows[1] += int(returned)
+
+
+class _CallbackStats:
+    __slots__ = ("calls", "errors", "prevented", "seconds", "buckets",
+                 "rows_scanned", "rows_returned", "response_bytes", "responses")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.prevented = 0
+        self.seconds = 0.0
+        self.buckets = [0] * len(DURATION_BUCKETS)
+        self.rows_scanned = 0
+        self.rows_returned = 0
+        self.response_bytes = 0
+        self.responses = 0
+
+
+class _InstrumentedApp:
+    """app.callback으로 등록되는 서버 콜백에 계측 래퍼를 씌우는 app 대리 객체"""
+
+    def __init__(self, app, metrics):
+        self._app = app
+        self._metrics = metrics
+
+    def callback(self, *args, **kwargs):
+        register = self._app.callback(*args, **kwargs)
+
+        def decorator(func):
+            return register(self._metrics.wrap(func.__name__, func))
+        return decorator
+
+    def __getattr__(self, name):
+        return getattr(self._app, name)
+
+
+def _escape_label(value):
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+class CallbackMetrics:
+    """
+    Dash 콜백별 실행 시간, 행 수, 응답 크기 및 앱 상태 값을 모아서
+    Prometheus 텍스트 형식(/metrics)으로 제공
+
+    콜백 한 번당 시간 측정 두 번과 잠금 한 번만 추가되므로 운영 환경에서도 켜둔다.
+    """
+
+    def __init__(self, prefix="bid_dashboard"):
+        self.prefix = prefix
+        self._stats = {}
+        self._gauges = {}
+        self._lock = threading.Lock()
+
+    def instrument(self, app):
+        """등록되는 콜백이 자동으로 계측되도록 app 대리 객체 반환"""
+        return _InstrumentedApp(app, self)
+
+    def wrap(self, name, func):
+        """콜백 함수를 계측 래퍼로 감쌈"""
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            _local.rows = [0, 0]
+            _local.callback = name
+            outcome = "ok"
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            except PreventUpdate:
+                outcome = "prevented"
+                raise
+            except Exception:
+                outcome = "error"
+                raise
+            finally:
+                elapsed = time.perf_counter() - start
+                rows, _local.rows = _local.rows, None
+                self._record(name, elapsed, rows, outcome)
+        return wrapper
+
+    def _record(self, name, elapsed, rows, outcome):
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = _CallbackStats()
+            stats.calls += 1
+            stats.seconds += elapsed
+            if outcome == "error":
+                stats.errors += 1
+            elif outcome == "prevented":
+                stats.prevented += 1
+            for i, bound in enumerate(DURATION_BUCKETS):
+                if elapsed <= bound:
+                    stats.buckets[i] += 1
+                    break
+            stats.rows_scanned += rows[0]
+            stats.rows_returned += rows[1]
+
+    def _record_response(self, response):
+        """같은 요청(스레드)에서 실행된 콜백에 직렬화된 응답 크기를 기록"""
+        name = getattr(_local, "callback", None)
+        if name is None:
+            return response
+        _local.callback = None
+        size = response.content_length
+        if size is None:
+            size = len(response.get_data())
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is not None:
+                stats.response_bytes += size
+                stats.responses += 1
+        return response
+
+    def set_gauge(self, name, value, help_text=""):
+        """앱 상태 값 기록 (예: 데이터 로드 시간)"""
+        with self._lock:
+            self._gauges[name] = (help_text, lambda: value, "gauge")
+
+    def add_gauge(self, name, read, help_text="", kind="gauge"):
+        """
+        수집 시점에 read()로 값을 읽는 앱 상태 값 등록 (예: 현재 데이터 버전)
+
+        Args:
+            kind (str): Prometheus 타입 ("gauge" 또는 누적 횟수는 "counter")
+        """
+        with self._lock:
+            self._gauges[name] = (help_text, read, kind)
+
+    def register_route(self, server, path="/metrics"):
+        """
+        Flask 서버에 metrics 경로와 응답 크기 기록 훅 등록
+
+        Args:
+            server (flask.Flask): Dash app.server
+            path (str): metrics 경로
+        """
+        server.after_request(self._record_response)
+        server.add_url_rule(path, "metrics", lambda: Response(self.render(), mimetype="text/plain; version=0.0.4"))
+
+    def render(self):
+        """Prometheus 텍스트 형식으로 변환"""
+        with self._lock:
+            stats = {name: _copy_stats(value) for name, value in self._stats.items()}
+            gauges = dict(self._gauges)
+
+        p = self.prefix
+        lines = []
+
+        def family(name, kind, help_text):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        family(f"{p}_callback_duration_seconds", "histogram", "Dash 콜백 실행 시간")
+        for name, s in sorted(stats.items()):
+            label = f'callback="{_escape_label(name)}"'
+            cumulative = 0
+            for bound, count in zip(DURATION_BUCKETS, s.buckets):
+                cumulative += count
+                lines.append(f'{p}_callback_duration_seconds_bucket{{{label},le="{bound}"}} {cumulative}')
+            lines.append(f'{p}_callback_duration_seconds_bucket{{{label},le="+Inf"}} {s.calls}')
+            lines.append(f"{p}_callback_duration_seconds_sum{{{label}}} {s.seconds:.6f}")
+            lines.append(f"{p}_callback_duration_seconds_count{{{label}}} {s.calls}")
+
+        counters = (
+            ("callback_errors_total", "errors", "예외로 끝난 콜백 실행 수"),
+            ("callback_prevented_total", "prevented", "PreventUpdate로 끝난 콜백 실행 수"),
+            ("callback_rows_scanned_total", "rows_scanned", "콜백이 조회한 행 수"),
+            ("callback_rows_returned_total", "rows_returned", "콜백이 응답에 포함한 행 수"),
+            ("callback_response_bytes_total", "response_bytes", "직렬화된 콜백 응답 크기(바이트)"),
+            ("callback_responses_total", "responses", "크기가 기록된 콜백 응답 수"),
+        )
+        for metric, attr, help_text in counters:
+            family(f"{p}_{metric}", "counter", help_text)
+            for name, s in sorted(stats.items()):
+                lines.append(f'{p}_{metric}{{callback="{_escape_label(name)}"}} {getattr(s, attr)}')
+
+        for name, (help_text, read, kind) in sorted(gauges.items()):
+            try:
+                value = float(read())
+            except Exception as e:
+                print(f"metrics 값 읽기 오류 ({name}): {e}")
+                continue
+            family(f"{p}_{name}", kind, help_text or name)
+            lines.append(f"{p}_{name} {value}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _copy_stats(stats):
+    copy = _CallbackStats()
+    for attr in _CallbackStats.__slots__:
+        value = getattr(stats, attr)
+        setattr(copy, attr, list(value) if isinstance(value, list) else value)
+    return copy
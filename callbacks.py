@@ -3,19 +3,59 @@ import plotly.express as px
 import pandas as pd
 from datetime import datetime
 import plotly.graph_objects as go 
+import threading
+import math
+import re
+from cache import LRUCache
+from callback_metrics import note_rows
+from table_query import filter_query_mask, sort_frame, FilterQueryError
+from display_columns import PREDICTION_SUFFIX_PATTERN
 
-def register_callbacks(app, df):
-    register_year_callbacks(app, df)
-    register_info_callbacks(app, df)
-    register_month_navigation_callbacks(app, df)
-    register_bid_selection_callbacks(app, df)
-    register_utility_callbacks(app, df)
-    register_next_bid_navigation_callbacks(app, df)
-    register_full_table_callbacks(app, df)
-    register_edit_callbacks(app, df)
+def register_callbacks(app, snapshots, metrics=None):
+    # 서버 콜백 실행 시간/행 수/응답 크기 계측 (callback_metrics.CallbackMetrics)
+    if metrics is not None:
+        app = metrics.instrument(app)
+    register_year_callbacks(app, snapshots)
+    register_info_callbacks(app, snapshots)
+    register_month_navigation_callbacks(app, snapshots)
+    register_bid_selection_callbacks(app, snapshots)
+    register_utility_callbacks(app, snapshots)
+    register_next_bid_navigation_callbacks(app, snapshots)
+    register_full_table_callbacks(app, snapshots)
+    register_edit_callbacks(app, snapshots)
     
-def register_year_callbacks(app, df):
-    @app.callback(
+def register_year_callbacks(app, snapshots):
+    # 연도 이동은 store 값 계산만 하므로 브라우저에서 처리 (서버 왕복 없음)
+    app.clientside_callback(
+        """
+        function(prevClicks, nextClicks, currentYear) {
+            const ctx = dash_clientside.callback_context;
+            const today = new Date();
+            
+            // 현재 월이 속한 그룹 찾기 (1~4, 5~8, 9~12)
+            const defaultPage = Math.floor(today.getMonth() / 4);
+            
+            const triggered = (ctx.triggered || []).filter(function(t) { return t.prop_id !== '.'; });
+            if (triggered.length === 0) {
+                // 앱 초기 로드 시 - 현재 월이 속한 그룹 표시
+                return [currentYear, currentYear + '년', defaultPage, null, null];
+            }
+            
+            const buttonId = triggered[0].prop_id.split('.')[0];
+            let newYear = currentYear;
+            if (buttonId === 'prev-year-btn' && prevClicks) {
+                newYear = currentYear - 1;
+            } else if (buttonId === 'next-year-btn' && nextClicks) {
+                newYear = currentYear + 1;
+            }
+            
+            // 현재 연도일 경우 현재월 포함 그룹, 아니면 첫 그룹(1~4월)
+            const monthView = newYear === today.getFullYear() ? defaultPage : 0;
+            
+            // 연도가 변경되면 선택된 bid와 month를 None으로 설정하여 초기화
+            return [newYear, newYear + '년', monthView, null, null];
+        }
+        """,
         [Output("selected-year", "data"),
          Output("year-display", "children"),
          Output("current-month-view", "data"),
@@ -26,217 +66,91 @@ def register_year_callbacks(app, df):
         [State("selected-year", "data")],
         prevent_initial_call=False 
     )
-    def update_selected_year(prev_clicks, next_clicks, current_year):
-        ctx = callback_context
-        today = datetime.today()
-        
-        # 월 그룹 정의 (1~4, 5~8, 9~12)
-        months = list(range(1, 13))
-        month_groups = [months[i:i+4] for i in range(0, len(months), 4)]
-        
-        # 현재 월이 속한 그룹 찾기
-        default_page = next(i for i, g in enumerate(month_groups) if today.month in g)
-        
-        if not ctx.triggered:
-            # 앱 초기 로드 시 - 현재 월이 속한 그룹 표시
-            return current_year, f"{current_year}년", default_page, None, None
 
-        button_id = ctx.triggered[0]["prop_id"].split(".")[0]
-        if button_id == "prev-year-btn" and prev_clicks:
-            new_year = current_year - 1
-        elif button_id == "next-year-btn" and next_clicks:
-            new_year = current_year + 1
-        else:
-            new_year = current_year
 
-        # 현재 연도일 경우 현재월 포함 그룹, 아니면 첫 그룹(1~4월)
-        month_view = default_page if new_year == today.year else 0
+# 페이지 이동 요약에 미리 담아 둘 다음 예정 입찰 년월 수 (현재 페이지 이후, 끝에 가까워지면 늘림)
+NAVIGATION_LOOKAHEAD_MONTHS = 24
 
-        # 연도가 변경되면 선택된 bid와 month를 None으로 설정하여 초기화
-        return new_year, f"{new_year}년", month_view, None, None
 
+def build_navigation_summary(snapshot, months_needed=NAVIGATION_LOOKAHEAD_MONTHS):
+    """
+    브라우저의 페이지 이동 계산에 필요한 데이터 버전별 요약 (navigation-summary store)
 
-def register_info_callbacks(app, df):
-    @app.callback(
-    Output("monthly-count-chart", "figure"),
-    Input("selected-year", "data")
-    )
-    def update_monthly_chart(selected_year):
-        # 원본 데이터와 예측 데이터 구분
-        original_df = df[~df["공고명"].str.contains("예측", na=False)]
-        prediction_df = df[df["공고명"].str.contains("예측", na=False)]
-        
-        # 선택한 연도의 데이터 필터링
-        year_original_df = original_df[original_df["예상_연도"] == selected_year]
-        year_prediction_df = prediction_df[prediction_df["예상_연도"] == selected_year]
-        
-        # 해당 연도에 데이터가 없으면 빈 차트 반환
-        if year_original_df.empty and year_prediction_df.empty:
-            # 모든 월 (1-12) 생성
-            all_months = pd.DataFrame({"예상_입찰월": range(1, 13)})
-            all_months["월"] = all_months["예상_입찰월"].astype(str) + "월"
-            all_months["공고수"] = 0
-            all_months["물동량"] = 0
-            
-            # 빈 차트 생성
-            fig = go.Figure()
-            
-            # 막대 차트 추가 (물동량 평균) - 0으로 표시
-            fig.add_trace(go.Bar(
-                x=all_months["월"],
-                y=all_months["물동량"],
-                name="물동량(M/M)",
-                marker_color="#17becf",
-                hovertemplate="물동량: %{y:,.0f} 명<extra></extra>"
-            ))
-            
-            # 선 차트 추가 (공고 수) - 0으로 표시
-            fig.add_trace(go.Scatter(
-                x=all_months["월"],
-                y=all_months["공고수"],
-                name="공고 수",
-                mode="lines+markers",
-                marker_color="#d62728",
-                line=dict(width=3),
-                yaxis="y2",
-                hovertemplate="공고 수: %{y} 건<extra></extra>"
-            ))
-            
-            # 레이아웃 설정
-            fig.update_layout(
-                title=f"{selected_year}년 월별 물동량 및 공고 현황",
-                title_font_size=20,
-                xaxis_title=None,
-                yaxis=dict(
-                    title="물동량(명)",
-                    titlefont=dict(color="#17becf"),
-                    tickfont=dict(color="#17becf")
-                ),
-                yaxis2=dict(
-                    title="공고 수(건)",
-                    titlefont=dict(color="#d62728"),
-                    tickfont=dict(color="#d62728"),
-                    anchor="x",
-                    overlaying="y",
-                    side="right"
-                ),
-                plot_bgcolor="white",
-                margin=dict(l=20, r=60, t=50, b=20),
-                height=400,
-                legend=dict(
-                    orientation="h",
-                    yanchor="bottom",
-                    y=1.02,
-                    xanchor="right",
-                    x=1
-                ),
-                showlegend=True
-            )
-            
-            return fig
-        
-        # 1. 월별 원본 공고 수 계산
-        if not year_original_df.empty:
-            monthly_counts_original = year_original_df.groupby("예상_입찰월")["공고명"].count().reset_index()
-            monthly_counts_original.rename(columns={"공고명": "공고수_원본"}, inplace=True)
-            
-            # 월별 평균 물동량 계산 (원본)
-            monthly_mm_original = year_original_df.groupby("예상_입찰월")["물동량 평균"].sum().reset_index()
-            monthly_mm_original.rename(columns={"물동량 평균": "물동량_원본"}, inplace=True)
-        else:
-            # 원본 데이터가 없는 경우 빈 DataFrame 생성
-            monthly_counts_original = pd.DataFrame({"예상_입찰월": [], "공고수_원본": []})
-            monthly_mm_original = pd.DataFrame({"예상_입찰월": [], "물동량_원본": []})
-        
-        # 2. 월별 예측 공고 수 계산
-        if not year_prediction_df.empty:
-            monthly_counts_prediction = year_prediction_df.groupby("예상_입찰월")["공고명"].count().reset_index()
-            monthly_counts_prediction.rename(columns={"공고명": "공고수_예측"}, inplace=True)
-            
-            # 월별 평균 물동량 계산 (예측)
-            monthly_mm_prediction = year_prediction_df.groupby("예상_입찰월")["물동량 평균"].sum().reset_index()
-            monthly_mm_prediction.rename(columns={"물동량 평균": "물동량_예측"}, inplace=True)
-        else:
-            # 예측 데이터가 없는 경우 빈 DataFrame 생성
-            monthly_counts_prediction = pd.DataFrame({"예상_입찰월": [], "공고수_예측": []})
-            monthly_mm_prediction = pd.DataFrame({"예상_입찰월": [], "물동량_예측": []})
-            
-        # 3. 데이터 병합
+    예측 기간이 길어도 필요한 년월 수만큼의 연도만 만든다.
+
+    Args:
+        snapshot (DataSnapshot): 현재 데이터 스냅샷
+        months_needed (int): 담을 년월 수 (이번 달 포함)
+
+    Returns:
+        dict: 데이터 버전, 다음 예정 입찰의 년월 목록, 목록이 마지막 연도까지인지 여부
+    """
+    today = datetime.today()
+    months = snapshot.upcoming_months_from(f"{today.year}-{today.month:02d}", limit=months_needed)
+    return {
+        "version": snapshot.version,
+        "upcoming_months": months,
+        "complete": len(months) < months_needed,
+    }
+
+
+def navigation_summary_outdated(summary, snapshot, current_page):
+    """데이터 버전이 바뀌었거나 현재 페이지가 요약의 년월 목록 끝에 가까워졌는지 확인"""
+    if not summary or summary.get("version") != snapshot.version:
+        return True
+    if summary.get("complete", True):
+        return False
+    return (current_page or 0) + NAVIGATION_LOOKAHEAD_MONTHS // 2 >= len(summary.get("upcoming_months", []))
+
+
+# 월별 차트 캐시: (데이터 버전, 연도) -> 직렬화된 figure(dict)
+monthly_chart_cache = LRUCache(maxsize=64)
+
+# 차트를 미리 만들어 둘 예측 연도 범위 (현재 연도 기준, 그 이후 연도는 조회할 때 생성)
+CHART_WARM_UP_YEARS = 3
+
+
+def build_monthly_chart(index, selected_year):
+    """선택한 연도의 월별 물동량/공고 수 차트 생성 (index: 데이터 버전의 BidIndex)"""
+    # 선택한 연도의 원본 데이터와 예측 데이터 (색인 조회)
+    year_original_df = index.rows(selected_year, prediction=False)
+    year_prediction_df = index.rows(selected_year, prediction=True)
+    
+    # 해당 연도에 데이터가 없으면 빈 차트 반환
+    if year_original_df.empty and year_prediction_df.empty:
+        # 모든 월 (1-12) 생성
         all_months = pd.DataFrame({"예상_입찰월": range(1, 13)})
         all_months["월"] = all_months["예상_입찰월"].astype(str) + "월"
+        all_months["공고수"] = 0
+        all_months["물동량"] = 0
         
-        # 원본 공고 수 데이터 병합
-        all_months = pd.merge(all_months, monthly_counts_original, on="예상_입찰월", how="left")
-        all_months["공고수_원본"] = all_months["공고수_원본"].fillna(0).astype(int)
-        
-        # 원본 물동량 데이터 병합
-        all_months = pd.merge(all_months, monthly_mm_original, on="예상_입찰월", how="left")
-        all_months["물동량_원본"] = all_months["물동량_원본"].fillna(0).astype(int)
-        
-        # 예측 공고 수 데이터 병합
-        all_months = pd.merge(all_months, monthly_counts_prediction, on="예상_입찰월", how="left")
-        all_months["공고수_예측"] = all_months["공고수_예측"].fillna(0).astype(int)
-        
-        # 예측 물동량 데이터 병합
-        all_months = pd.merge(all_months, monthly_mm_prediction, on="예상_입찰월", how="left")
-        all_months["물동량_예측"] = all_months["물동량_예측"].fillna(0).astype(int)
-        
-        # 4. 단일 데이터셋 생성 (예측이 있으면 예측, 없으면 원본)
-        all_months["물동량"] = all_months.apply(
-            lambda row: row["물동량_예측"] if row["물동량_예측"] > 0 else row["물동량_원본"], 
-            axis=1
-        )
-        
-        all_months["공고수"] = all_months.apply(
-            lambda row: row["공고수_예측"] if row["공고수_예측"] > 0 else row["공고수_원본"], 
-            axis=1
-        )
-        
-        # 5. 예측 데이터 있는 월 표시하기 위한 플래그
-        all_months["is_prediction"] = all_months["물동량_예측"] > 0
-        
-        # 차트 생성
+        # 빈 차트 생성
         fig = go.Figure()
         
-        # 막대 차트 추가 (물동량 - 단일 시리즈)
+        # 막대 차트 추가 (물동량 평균) - 0으로 표시
         fig.add_trace(go.Bar(
             x=all_months["월"],
             y=all_months["물동량"],
             name="물동량(M/M)",
             marker_color="#17becf",
-            marker=dict(
-                color=all_months.apply(
-                    lambda row: "#17becf" if row["is_prediction"] else "#1f77b4", 
-                    axis=1
-                )
-            ),
-            hovertemplate="물동량: %{y:,.0f} 명<extra></extra>",
+            hovertemplate="물동량: %{y:,.0f} 명<extra></extra>"
         ))
         
-        # 선 차트 추가 (공고 수 - 단일 시리즈)
+        # 선 차트 추가 (공고 수) - 0으로 표시
         fig.add_trace(go.Scatter(
             x=all_months["월"],
             y=all_months["공고수"],
             name="공고 수",
             mode="lines+markers",
             marker_color="#d62728",
-            marker=dict(
-                color=all_months.apply(
-                    lambda row: "#d62728" if row["is_prediction"] else "#ff7f0e", 
-                    axis=1
-                )
-            ),
             line=dict(width=3),
             yaxis="y2",
-            hovertemplate="공고 수: %{y} 건<extra></extra>",
+            hovertemplate="공고 수: %{y} 건<extra></extra>"
         ))
         
-        # 예측 데이터 있는 경우에만 예측 표시 추가
-        has_prediction = all_months["is_prediction"].any()
-        
         # 레이아웃 설정
         fig.update_layout(
-            title=f"{selected_year}년 월별 물동량 및 공고 현황 예측",
+            title=f"{selected_year}년 월별 물동량 및 공고 현황",
             title_font_size=20,
             xaxis_title=None,
             yaxis=dict(
@@ -265,20 +179,210 @@ def register_info_callbacks(app, df):
             showlegend=True
         )
         
-        # 그리드 라인 추가
-        fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor='lightgray')
-        fig.update_yaxes(showgrid=True, gridwidth=1, gridcolor='lightgray')
-        
         return fig
+    
+    # 1. 월별 원본 공고 수 계산
+    if not year_original_df.empty:
+        monthly_counts_original = year_original_df.groupby("예상_입찰월")["공고명"].count().reset_index()
+        monthly_counts_original.rename(columns={"공고명": "공고수_원본"}, inplace=True)
+        
+        # 월별 평균 물동량 계산 (원본)
+        monthly_mm_original = year_original_df.groupby("예상_입찰월")["물동량 평균"].sum().reset_index()
+        monthly_mm_original.rename(columns={"물동량 평균": "물동량_원본"}, inplace=True)
+    else:
+        # 원본 데이터가 없는 경우 빈 DataFrame 생성
+        monthly_counts_original = pd.DataFrame({"예상_입찰월": [], "공고수_원본": []})
+        monthly_mm_original = pd.DataFrame({"예상_입찰월": [], "물동량_원본": []})
+    
+    # 2. 월별 예측 공고 수 계산
+    if not year_prediction_df.empty:
+        monthly_counts_prediction = year_prediction_df.groupby("예상_입찰월")["공고명"].count().reset_index()
+        monthly_counts_prediction.rename(columns={"공고명": "공고수_예측"}, inplace=True)
+        
+        # 월별 평균 물동량 계산 (예측)
+        monthly_mm_prediction = year_prediction_df.groupby("예상_입찰월")["물동량 평균"].sum().reset_index()
+        monthly_mm_prediction.rename(columns={"물동량 평균": "물동량_예측"}, inplace=True)
+    else:
+        # 예측 데이터가 없는 경우 빈 DataFrame 생성
+        monthly_counts_prediction = pd.DataFrame({"예상_입찰월": [], "공고수_예측": []})
+        monthly_mm_prediction = pd.DataFrame({"예상_입찰월": [], "물동량_예측": []})
+        
+    # 3. 데이터 병합
+    all_months = pd.DataFrame({"예상_입찰월": range(1, 13)})
+    all_months["월"] = all_months["예상_입찰월"].astype(str) + "월"
+    
+    # 원본 공고 수 데이터 병합
+    all_months = pd.merge(all_months, monthly_counts_original, on="예상_입찰월", how="left")
+    all_months["공고수_원본"] = all_months["공고수_원본"].fillna(0).astype(int)
+    
+    # 원본 물동량 데이터 병합
+    all_months = pd.merge(all_months, monthly_mm_original, on="예상_입찰월", how="left")
+    all_months["물동량_원본"] = all_months["물동량_원본"].fillna(0).astype(int)
+    
+    # 예측 공고 수 데이터 병합
+    all_months = pd.merge(all_months, monthly_counts_prediction, on="예상_입찰월", how="left")
+    all_months["공고수_예측"] = all_months["공고수_예측"].fillna(0).astype(int)
+    
+    # 예측 물동량 데이터 병합
+    all_months = pd.merge(all_months, monthly_mm_prediction, on="예상_입찰월", how="left")
+    all_months["물동량_예측"] = all_months["물동량_예측"].fillna(0).astype(int)
+    
+    # 4. 단일 데이터셋 생성 (예측이 있으면 예측, 없으면 원본)
+    all_months["물동량"] = all_months.apply(
+        lambda row: row["물동량_예측"] if row["물동량_예측"] > 0 else row["물동량_원본"], 
+        axis=1
+    )
+    
+    all_months["공고수"] = all_months.apply(
+        lambda row: row["공고수_예측"] if row["공고수_예측"] > 0 else row["공고수_원본"], 
+        axis=1
+    )
+    
+    # 5. 예측 데이터 있는 월 표시하기 위한 플래그
+    all_months["is_prediction"] = all_months["물동량_예측"] > 0
+    
+    # 차트 생성
+    fig = go.Figure()
+    
+    # 막대 차트 추가 (물동량 - 단일 시리즈)
+    fig.add_trace(go.Bar(
+        x=all_months["월"],
+        y=all_months["물동량"],
+        name="물동량(M/M)",
+        marker_color="#17becf",
+        marker=dict(
+            color=all_months.apply(
+                lambda row: "#17becf" if row["is_prediction"] else "#1f77b4", 
+                axis=1
+            )
+        ),
+        hovertemplate="물동량: %{y:,.0f} 명<extra></extra>",
+    ))
+    
+    # 선 차트 추가 (공고 수 - 단일 시리즈)
+    fig.add_trace(go.Scatter(
+        x=all_months["월"],
+        y=all_months["공고수"],
+        name="공고 수",
+        mode="lines+markers",
+        marker_color="#d62728",
+        marker=dict(
+            color=all_months.apply(
+                lambda row: "#d62728" if row["is_prediction"] else "#ff7f0e", 
+                axis=1
+            )
+        ),
+        line=dict(width=3),
+        yaxis="y2",
+        hovertemplate="공고 수: %{y} 건<extra></extra>",
+    ))
+    
+    # 예측 데이터 있는 경우에만 예측 표시 추가
+    has_prediction = all_months["is_prediction"].any()
+    
+    # 레이아웃 설정
+    fig.update_layout(
+        title=f"{selected_year}년 월별 물동량 및 공고 현황 예측",
+        title_font_size=20,
+        xaxis_title=None,
+        yaxis=dict(
+            title="물동량(명)",
+            titlefont=dict(color="#17becf"),
+            tickfont=dict(color="#17becf")
+        ),
+        yaxis2=dict(
+            title="공고 수(건)",
+            titlefont=dict(color="#d62728"),
+            tickfont=dict(color="#d62728"),
+            anchor="x",
+            overlaying="y",
+            side="right"
+        ),
+        plot_bgcolor="white",
+        margin=dict(l=20, r=60, t=50, b=20),
+        height=400,
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1
+        ),
+        showlegend=True
+    )
+    
+    # 그리드 라인 추가
+    fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor='lightgray')
+    fig.update_yaxes(showgrid=True, gridwidth=1, gridcolor='lightgray')
+    
+    return fig
+
+
+def snapshot_for_year(snapshots, selected_year):
+    """선택 연도의 데이터를 아직 받지 않았으면 먼저 받은 뒤 현재 스냅샷 반환"""
+    snapshots.ensure_year(selected_year)
+    return snapshots.current()
+
+
+def get_monthly_chart(snapshot, selected_year):
+    """스냅샷 버전과 연도 기준으로 캐시된 차트를 반환 (없으면 생성 후 저장)"""
+    return monthly_chart_cache.get_or_build(
+        (snapshot.version, selected_year),
+        lambda: build_monthly_chart(snapshot.year(selected_year).index, selected_year).to_dict()
+    )
+
+
+def warm_monthly_chart_cache(snapshots, snapshot):
+    """
+    원본 데이터 첫 연도부터 가까운 예측 연도까지의 차트를 미리 만들어 캐시에 저장 (백그라운드 실행)
+    """
+    if not snapshot.index.years:
+        return
+    last_year = min(snapshot.last_year, datetime.today().year + CHART_WARM_UP_YEARS)
+    years = range(snapshot.index.years[0], last_year + 1)
+    for year in years:
+        # 더 새로운 버전이 게시되었으면 중단
+        if snapshots.version != snapshot.version:
+            return
+        get_monthly_chart(snapshot, year)
+    print(f"월별 차트 캐시 준비 완료 (버전 {snapshot.version}, {len(years)}개 연도)")
+
+
+def start_chart_warm_up(snapshots, snapshot):
+    threading.Thread(target=warm_monthly_chart_cache, args=(snapshots, snapshot), daemon=True).start()
+
+
+def register_info_callbacks(app, snapshots):
+    # 데이터가 새로 게시될 때마다 모든 연도의 차트를 백그라운드에서 미리 생성
+    snapshots.subscribe(lambda snapshot: start_chart_warm_up(snapshots, snapshot))
+    start_chart_warm_up(snapshots, snapshots.current())
+
+    @app.callback(
+    Output("monthly-count-chart", "figure"),
+    Input("selected-year", "data")
+    )
+    def update_monthly_chart(selected_year):
+        # 현재 데이터 스냅샷 버전과 연도로 캐시 조회
+        return get_monthly_chart(snapshot_for_year(snapshots, selected_year), selected_year)
         
     @app.callback(
     [Output("next-bid-month", "children"),
     Output("org-count", "children"),
-    Output("org-list-container", "children")],
+    Output("org-list-container", "children"),
+    Output("navigation-summary", "data")],
     [Input("selected-year", "data"),
-    Input("current-page", "data")]
+    Input("current-page", "data")],
+    [State("navigation-summary", "data")]
     )
-    def update_next_bids(selected_year, current_page):
+    def update_next_bids(selected_year, current_page, summary):
+        # 현재 데이터 스냅샷 (다음 예정 입찰 색인은 연도별 데이터에 있음: 년월 -> 기관 -> 공고)
+        snapshot = snapshot_for_year(snapshots, selected_year)
+        
+        # 데이터 버전이 바뀌었거나 페이지가 요약 끝에 가까우면 브라우저의 페이지 이동 요약도 갱신
+        new_summary = no_update
+        if navigation_summary_outdated(summary, snapshot, current_page):
+            new_summary = build_navigation_summary(snapshot, (current_page or 0) + NAVIGATION_LOOKAHEAD_MONTHS)
+
         today = datetime.today()
         
         # 다음 달의 1일 계산
@@ -292,132 +396,69 @@ def register_info_callbacks(app, df):
             next_month = current_month + 1
             next_year = current_year
         
-        next_month_start = datetime(next_year, next_month, 1)
         next_month_str = f"{next_year}-{next_month:02d}"  # 형식: "YYYY-MM"
         
-        print(f"다음 달 시작일: {next_month_start}")
-        print(f"다음 달 문자열: {next_month_str}")
-        
         # 선택된 연도에 맞게 모든 데이터 표시
         # 원본 데이터와 예측 데이터 모두 표시 (원본과 예측 구분없이 모두 표시)
         if selected_year == current_year:
-            # 현재 연도인 경우 다음 달부터 시작하는 모든 공고 표시 (원본+예측)
-            upcoming_df = df[df["예상_입찰일"] >= next_month_start].copy()
+            # 현재 연도인 경우 다음 달부터 시작하는 공고 표시 (원본+예측, 현재 페이지까지만 조회)
+            월순서 = snapshot.upcoming_months_from(next_month_str, limit=(current_page or 0) + 1)
         else:
             # 다른 연도인 경우 해당 연도의 모든 공고 표시 (원본+예측)
-            upcoming_df = df[df["예상_연도"] == selected_year].copy()
-        
-        print(f"다음 예정 입찰 데이터 수: {len(upcoming_df)}")
+            월순서 = snapshot.year(selected_year).upcoming.months_in_year(selected_year)
         
         # 데이터가 없는 경우
-        if upcoming_df.empty:
-            return "다음 입찰 예상월: 없음", "🏢 실수요기관 수: 0곳", []
-        
-        # 데이터 확인
-        print(f"첫 번째 입찰 일자: {upcoming_df['예상_입찰일'].min()}")
-        print(f"마지막 입찰 일자: {upcoming_df['예상_입찰일'].max()}")
-        
-        # NaT 값 처리 추가
-        upcoming_df["예상_년월"] = upcoming_df["예상_입찰일"].dt.strftime("%Y-%m").fillna("")
-        
-        월순서 = sorted([m for m in upcoming_df["예상_년월"].unique() if m])
-        print(f"월 순서: {월순서}")
+        if not 월순서:
+            return "다음 입찰 예상월: 없음", "🏢 실수요기관 수: 0곳", [], new_summary
         
         # 중요 변경: 다음 달 또는 그 이후에 가장 가까운 월 찾기
         if current_page == 0 and selected_year == current_year:  # 초기 페이지이고 현재 연도일 때만 자동으로 다음 달 선택
-            # next_month_str 이후의 가장 가까운 월 찾기
-            future_months = [m for m in 월순서 if m >= next_month_str]
-            if future_months:
-                current_month = future_months[0]  # 다음 달 이후의 첫 번째 달
-                # current_page 값도 업데이트
-                current_page = 월순서.index(current_month)
-            else:
-                # 다음 달 이후 데이터가 없으면 가장 최근 월 선택
-                current_month = 월순서[-1] if 월순서 else None
-                current_page = len(월순서) - 1 if 월순서 else 0
+            # next_month_str 이후의 가장 가까운 월 찾기 (월순서는 이미 다음 달 이후)
+            current_month = 월순서[0]
         else:
-            # 사용자가 페이지를 변경했거나 다른 연도인 경우 해당 페이지 사용
-            if 월순서 and current_page < len(월순서):
+            # 사용자가 페이지를 변경했거나 다른 연도인 경우 해당 페이지 사용 (범위를 넘으면 첫 달)
+            if current_page < len(월순서):
                 current_month = 월순서[current_page]
             else:
-                current_month = 월순서[0] if 월순서 else None
-                current_page = 0
-        
-        target_months = [current_month] if current_month else []
-        print(f"선택된 타겟 월: {target_months}, 페이지: {current_page}")
-        
-        # 타겟 월에 해당하는 데이터가 없는 경우
-        if not target_months:
-            return "다음 입찰 예상월: 없음", "🏢 실수요기관 수: 0곳", []
-        
-        target_df = upcoming_df[upcoming_df["예상_년월"].isin(target_months)]
-        target_월 = target_months[0] if target_months else "N/A"
-        기관_리스트 = sorted(target_df["실수요기관"].unique())
+                current_month = 월순서[0]
         
-        start = 0
-        end = len(기관_리스트)
-        page_기관 = 기관_리스트[start:end]
-        기관_총수 = len(기관_리스트)
+        target_월 = current_month
+        upcoming = snapshot.year(int(target_월[:4])).upcoming
+        기관별_공고 = upcoming.groups[target_월]
+        기관_총수 = len(기관별_공고)
         
-        # 공고 수 계산
-        total_count = len(target_df)
-        
-        # 예측 데이터 개수 계산
-        prediction_count = len(target_df[target_df["공고명"].str.contains("예측")])
+        # 공고 수 계산 (원본과 예측 데이터 비율)
+        total_count, prediction_count = upcoming.counts[target_월]
+        note_rows(total_count, total_count)
         original_count = total_count - prediction_count
-        
-        # 원본과 예측 데이터 비율 계산
         target_info = f"(원본: {original_count}건, 예측: {prediction_count}건)"
         
-        # 예측 데이터에 대한 원본 입찰일 계산
-        if "원본_입찰일" not in target_df.columns:
-            target_df["원본_입찰일"] = pd.NaT
-            for idx, row in target_df.iterrows():
-                if "예측" in str(row["공고명"]):
-                    if pd.notna(row["용역기간(개월)"]) and row["용역기간(개월)"] > 0:
-                        target_df.at[idx, "원본_입찰일"] = row["예상_입찰일"] - pd.DateOffset(months=int(row["용역기간(개월)"]))
-        
         org_list = []
-        for name in page_기관:
-            기관공고_df = target_df[target_df["실수요기관"] == name]
-            
-            # 원본 공고와 예측 공고 구분
-            기관공고_원본 = 기관공고_df[~기관공고_df["공고명"].str.contains("예측")]
-            기관공고_예측 = 기관공고_df[기관공고_df["공고명"].str.contains("예측")]
-            
-            # 두 데이터셋을 합치고 정렬
-            공고_리스트 = pd.concat([기관공고_원본, 기관공고_예측]).sort_values("예상_입찰일")
-            
+        for name, 공고_리스트 in 기관별_공고.items():
             buttons = []
-            for i, (_, row) in enumerate(공고_리스트.iterrows()):
-                # NaT 값 안전하게 처리
-                is_prediction = "예측" in str(row["공고명"])
-                data_year = str(row["예상_입찰일"].year) if pd.notna(row["예상_입찰일"]) else ""
-                data_month = row["예상_년월"] if pd.notna(row["예상_년월"]) else ""
-                original_month = row["원본_입찰일"].strftime('%Y-%m') if pd.notna(row["원본_입찰일"]) else "-"
-                
+            for i, (bid_name, is_prediction, original_month) in enumerate(공고_리스트):
                 # 예측 공고와 원본 공고를 시각적으로 구분
                 button_style = {"background-color": "#f0f8ff"} if is_prediction else {}
                 button_prefix = ""
                 
                 button = html.Button(
-                    f"{button_prefix}{row['공고명']}",
-                    id={"type": "bid-btn", "index": f"{name}_{i}"},
+                    f"{button_prefix}{bid_name}",
+                    # 선택 콜백이 클릭된 버튼의 id만으로 처리할 수 있도록 월/공고명을 id에 포함
+                    id={"type": "bid-btn", "index": f"{name}_{i}", "month": target_월, "bid": bid_name},
                     className="bid-button",
                     style=button_style,
                     **{
-                        "data-month": data_month,
-                        "data-year": data_year,
-                        "data-bid": str(row['공고명']),
+                        "data-month": target_월,
+                        "data-year": target_월[:4],
+                        "data-bid": bid_name,
                         "data-original-month": original_month,
                         "data-is-prediction": "1" if is_prediction else "0"
                     }
                 )
                 buttons.append(button)
             
-            # 원본과 예측 공고 개수 표시
-            전체_개수 = len(기관공고_원본) + len(기관공고_예측)
-            공고_개수_표시 = f"({전체_개수}건)"
+            # 공고 개수 표시
+            공고_개수_표시 = f"({len(공고_리스트)}건)"
             
             org_details = html.Details([
                 html.Summary(f"{name} {공고_개수_표시}", className="org-name"),
@@ -432,14 +473,151 @@ def register_info_callbacks(app, df):
         # 월 표시 (예측 정보 추가)
         month_display = f"다음 입찰 예상월: {target_월} (총 {total_count}건) {target_info}"
         
-        # 현재 페이지도 업데이트
-        dcc.Store(id="current-page", data=current_page)
-                
-        return month_display, f"🏢 실수요기관 수: {기관_총수}곳", org_list
+        return month_display, f"🏢 실수요기관 수: {기관_총수}곳", org_list, new_summary
 
 
-def register_month_navigation_callbacks(app, df):
-    @app.callback(
+# 월별 공고 섹션에서 사용하는 표시용 컬럼
+MONTH_SECTION_COLUMNS = [
+    "표시_공고명", "표시_예측_차수", "표시_실수요기관", "표시_입찰일", "표시_예측_입찰일", "표시_원본_입찰일",
+    "표시_물동량", "표시_용역기간", "표시_계약금액", "표시_입찰업체", "표시_입찰금액",
+]
+
+# 월별 공고 섹션 캐시: (데이터 버전, 년월) -> (년월, 공고별 렌더링 결과)
+month_section_cache = LRUCache(maxsize=96)
+
+
+def render_month_bids(month_data, display):
+    """
+    한 달치 공고를 선택 상태와 무관한 부분까지만 렌더링
+
+    Args:
+        month_data (pandas.DataFrame): 해당 월의 공고 행
+        display (pandas.DataFrame): 스냅샷의 표시용 컬럼 (build_display_frame 결과)
+
+    Returns:
+        list: 공고명 순으로 정렬된 (공고명, 예측 여부, Summary 내용, 상세 정보 Div) 목록
+    """
+    entries = []
+
+    # 원본 데이터와 예측 데이터 함께 정렬 (공고명 기준)
+    is_prediction_rows = month_data["is_prediction"]
+    sorted_data = pd.concat([month_data[~is_prediction_rows], month_data[is_prediction_rows]]).sort_values(by=["공고명"])
+    rows = display.loc[sorted_data.index, MONTH_SECTION_COLUMNS].assign(
+        공고명=sorted_data["공고명"], is_prediction=sorted_data["is_prediction"]
+    )
+
+    for row in rows.to_dict("records"):
+        # 예측 공고인지 확인
+        is_prediction = row["is_prediction"]
+        emoji = "📌"
+
+        # 예측 공고와 원본 공고에 따라 약간 다른 정보 표시
+        if is_prediction:
+            # 원본 입찰일 표시 (예측 공고인 경우만)
+            original_date_display = ""
+            if row["표시_원본_입찰일"]:
+                original_date_display = html.P(f"원본입찰일: {row['표시_원본_입찰일']}", className="bid-detail")
+
+            summary = [row["표시_공고명"], html.Span(row["표시_예측_차수"], className="prediction-label")]
+            details = html.Div([
+                html.P(f"실수요기관: {row['표시_실수요기관']}", className="bid-detail"),
+                html.P(f"예측입찰게시: {row['표시_입찰일']}", className="bid-detail"),
+                original_date_display,
+                html.P(f"평균M/M: {row['표시_물동량']}", className="bid-detail"),
+                html.P(f"용역기간: {row['표시_용역기간']}", className="bid-detail"),
+                html.P(f"계약금액: {row['표시_계약금액']}", className="bid-detail"),
+            ])
+        else:
+            summary = f"{emoji} {row['공고명']}"
+            details = html.Div([
+                html.P(f"실수요기관: {row['표시_실수요기관']}", className="bid-detail"),
+                html.P(f"입찰게시: {row['표시_입찰일']}", className="bid-detail"),
+                html.P(f"(예측)입찰게시: {row['표시_예측_입찰일']}", className="bid-detail"),
+                html.P(f"평균M/M: {row['표시_물동량']}", className="bid-detail"),
+                html.P(f"용역기간: {row['표시_용역기간']}", className="bid-detail"),
+                html.P(f"계약금액: {row['표시_계약금액']}", className="bid-detail"),
+                html.P(f"(1순위)입찰업체: {row['표시_입찰업체']}", className="bid-detail"),
+                html.P(f"(1순위)입찰금액: {row['표시_입찰금액']}", className="bid-detail"),
+            ])
+
+        entries.append((row["공고명"], is_prediction, summary, details))
+    return entries
+
+
+def get_month_section(snapshot, selected_year, month_num):
+    """
+    스냅샷 버전과 년월 기준으로 캐시된 월 섹션 렌더링 결과 반환
+
+    Returns:
+        tuple: (년월 문자열, render_month_bids 결과) 또는 해당 월 공고가 없으면 None
+    """
+    def build():
+        year_view = snapshot.year(selected_year)
+        month_data = year_view.index.rows(selected_year, months=[month_num])
+        if month_data.empty:
+            return None
+        return month_data["예상_년월"].iloc[0], render_month_bids(month_data, year_view.display)
+
+    return month_section_cache.get_or_build((snapshot.version, f"{selected_year}-{month_num:02d}"), build)
+
+
+def build_month_section(month, entries, selected_month, selected_bid):
+    """캐시된 월 섹션에 선택된 월/공고 강조 표시만 덧붙여 화면 요소 생성"""
+    is_selected = (month == selected_month)
+    emphasis = "📍 " if is_selected else ""
+    section_style = {
+        'backgroundColor': '#fff3cd' if is_selected else 'white',
+        'border': '1px solid #ffeeba' if is_selected else '1px solid #dee2e6',
+        'borderRadius': '8px',
+        'boxShadow': '0 2px 8px rgba(0, 0, 0, 0.1)',
+        'padding': '15px'
+    }
+
+    month_bids = []
+    for name, is_prediction, summary, details in entries:
+        # 스타일 설정
+        summary_class = "bid-summary"
+        if name == selected_bid:
+            summary_class += " highlighted"
+        if is_prediction:
+            summary_class += " prediction"
+        month_bids.append(html.Details([html.Summary(summary, className=summary_class), details]))
+
+    section = html.Div([
+        html.Div(id=f"anchor-{month}", className="anchor-point"),
+        html.H3(f"{emphasis}{month}", className="month-title"),
+        html.Div(month_bids, className="month-bids-list")
+    ], className="month-section", style=section_style)
+    return html.Div(section, className="month-cell")
+
+
+def register_month_navigation_callbacks(app, snapshots):
+    # 월 페이지 이동은 store 값 계산만 하므로 브라우저에서 처리
+    app.clientside_callback(
+        """
+        function(prevClicks, nextClicks, currentView, selectedYear) {
+            const ctx = dash_clientside.callback_context;
+            const triggered = (ctx.triggered || []).filter(function(t) { return t.prop_id !== '.'; });
+            const buttonId = triggered.length ? triggered[0].prop_id.split('.')[0] : null;
+            
+            // 월 그룹 3개 (1~4, 5~8, 9~12)
+            const maxPage = 2;
+            
+            if (buttonId === 'prev-months-btn') {
+                if (currentView > 0) {
+                    return [currentView - 1, selectedYear];
+                }
+                return [maxPage, selectedYear - 1];  // 전년도 마지막 그룹
+            } else if (buttonId === 'next-months-btn') {
+                if (currentView < maxPage) {
+                    return [currentView + 1, selectedYear];
+                }
+                return [0, selectedYear + 1];  // 다음년도 첫 그룹
+            }
+            
+            return [currentView, selectedYear];
+        }
+        """,
     [
         Output("current-month-view", "data", allow_duplicate=True),
         Output("selected-year", "data", allow_duplicate=True),
@@ -448,27 +626,6 @@ def register_month_navigation_callbacks(app, df):
     [State("current-month-view", "data"), State("selected-year", "data")],
     prevent_initial_call=True
 )
-    def update_month_page(prev_clicks, next_clicks, current_view, selected_year):
-        ctx = callback_context
-        button_id = ctx.triggered[0]["prop_id"].split(".")[0] if ctx.triggered else None
-
-        months = list(range(1, 13))
-        month_groups = [months[i:i+4] for i in range(0, len(months), 4)]
-        max_page = len(month_groups) - 1
-
-        if button_id == "prev-months-btn":
-            if current_view > 0:
-                return current_view - 1, selected_year
-            else:
-                return max_page, selected_year - 1  # 전년도 마지막 그룹
-
-        elif button_id == "next-months-btn":
-            if current_view < max_page:
-                return current_view + 1, selected_year
-            else:
-                return 0, selected_year + 1  # 다음년도 첫 그룹
-
-        return current_view, selected_year
 
     @app.callback(
     [
@@ -506,15 +663,16 @@ def register_month_navigation_callbacks(app, df):
      Input("selected-bid", "data")]
     )
     def update_monthly_bids(selected_year, current_month_view, selected_month, selected_bid):
+        # 현재 데이터 스냅샷 (요청 처리 중 다른 버전으로 바뀌지 않음)
+        snapshot = snapshot_for_year(snapshots, selected_year)
+
         months = list(range(1, 13))
         month_groups = [months[i:i+4] for i in range(0, len(months), 4)]
         view_month_nums = month_groups[current_month_view] if current_month_view < len(month_groups) else []
 
-        # 전체 데이터에서 선택된 연도의 데이터만 필터링
-        year_df = df[df["예상_연도"] == selected_year]
-        
-        view_months = year_df[year_df["예상_입찰월"].isin(view_month_nums)]["예상_년월"].unique()
-        view_months = sorted(view_months)
+        # 월별 섹션은 (데이터 버전, 년월) 단위로 캐시하고 선택 강조만 매번 적용
+        sections = [get_month_section(snapshot, selected_year, month_num) for month_num in view_month_nums]
+        sections = [section for section in sections if section is not None]
 
         max_pages = len(month_groups) - 1
         
@@ -522,183 +680,63 @@ def register_month_navigation_callbacks(app, df):
         prev_button_disabled = False
         next_button_disabled = False
 
-        if not view_months:
+        if not sections:
             return html.Div("이 연도에 해당하는 공고가 없습니다.", className="no-months-message"), f"{selected_year}년 {view_month_nums[0]}월-{view_month_nums[-1]}월 공고 없음", prev_button_disabled, next_button_disabled
 
         range_display = f"현재 보기: {view_month_nums[0]}월 ~ {view_month_nums[-1]}월 ({current_month_view + 1}/{max_pages + 1}페이지)"
 
-        month_cells = []
-        for m in view_months:
-            month_data = year_df[year_df["예상_년월"] == m]
-            anchor_id = f"anchor-{m}"
-            is_selected = (m == selected_month)
-            emphasis = "📍 " if is_selected else ""
-            section_style = {
-                'backgroundColor': '#fff3cd' if is_selected else 'white',
-                'border': '1px solid #ffeeba' if is_selected else '1px solid #dee2e6',
-                'borderRadius': '8px',
-                'boxShadow': '0 2px 8px rgba(0, 0, 0, 0.1)',
-                'padding': '15px'
-            }
-
-            month_bids = []
-            if month_data.empty:
-                month_bids.append(html.P("_(해당 월 공고 없음)_", className="no-bids"))
-            else:
-                # 원본 데이터와 예측 데이터 구분
-                month_original = month_data[~month_data["공고명"].str.contains("예측", na=False)]
-                month_prediction = month_data[month_data["공고명"].str.contains("예측", na=False)]
-                month_title = f"{emphasis}{m}"  
-                
-                # 두 데이터 함께 정렬 (공고명 기준)
-                sorted_data = pd.concat([month_original, month_prediction]).sort_values(by=["공고명"])
-                
-                for _, row in sorted_data.iterrows():
-                    highlight = (row["공고명"] == selected_bid)
-                    
-                    # 예측 공고인지 확인
-                    is_prediction = "예측" in str(row["공고명"])
-                    emoji = "📌" 
-                    
-                    # 스타일 설정
-                    summary_class = "bid-summary"
-                    if highlight:
-                        summary_class += " highlighted"
-                    if is_prediction:
-                        summary_class += " prediction"
-                    
-                    # 예측 입찰일 계산 - "예측_입찰일" 컬럼이 있으면 그 값을 사용, 없으면 계산
-                    if is_prediction and "예측_입찰일" in row and pd.notna(row["예측_입찰일"]):
-                        predicted_date = row["예측_입찰일"].strftime('%Y-%m-%d') if not pd.isna(row["예측_입찰일"]) else "-"
-                    elif not is_prediction and pd.notna(row["예상_입찰일"]) and pd.notna(row["용역기간(개월)"]) and row["용역기간(개월)"] > 0:
-                        # 용역기간 기반 예측 계산 (용역기간-1개월 적용)
-                        adjusted_period = max(1, int(row["용역기간(개월)"]) - 1)  # 최소 1개월 보장
-                        predicted_date = row["예상_입찰일"] + pd.DateOffset(months=adjusted_period)
-                        predicted_date = predicted_date.strftime('%Y-%m-%d') if not pd.isna(predicted_date) else "-"
-                    else:
-                        predicted_date = "-"
-                    
-                    # 안전한 숫자 포맷팅 함수
-                    def safe_format_number(value, suffix=""):
-                        if value == 0 or pd.isna(value) or value == "":
-                            return "-"
-                        try:
-                            # 문자열인 경우 쉼표 제거
-                            if isinstance(value, str):
-                                value = value.replace(',', '')
-                            # 정수로 변환 후 천 단위 쉼표 포맷팅
-                            return f"{int(float(value)):,} {suffix}".strip()
-                        except (ValueError, TypeError):
-                            # 변환 실패 시 원본 반환
-                            return f"{value} {suffix}".strip()
-                    
-                    # 숫자 값 포맷팅 - 안전하게 처리
-                    mm_value = safe_format_number(row['물동량 평균'], "명")
-                    contract_value = safe_format_number(row['계약 기간 내'], "원")
-                    bid_value = safe_format_number(row['입찰금액_1순위'], "원")
-                    
-                    # 용역기간 표시 처리
-                    duration = row['용역기간(개월)']
-                    duration_display = '-' if duration == 0 else f'{duration} 개월'
-                    
-                    # 입찰일 형식을 YYYY-MM-DD로 변경
-                    bid_date = row['예상_입찰일'].strftime('%Y-%m-%d') if pd.notna(row['예상_입찰일']) else '-'
-                    
-                    # 원본 입찰일 표시 (예측 공고인 경우만)
-                    original_date_display = ""
-                    if is_prediction and "원본_입찰일" in row and pd.notna(row["원본_입찰일"]):
-                        original_date = row["원본_입찰일"].strftime('%Y-%m-%d')
-                        original_date_display = html.P(f"원본입찰일: {original_date}", className="bid-detail")
-                    
-                    # 예측 공고와 원본 공고에 따라 약간 다른 정보 표시
-                    if is_prediction:
-                        # 예측 차수 정보 추출 - 공고명에서 "n차 예측" 형식 추출
-                        prediction_label = " (예측)"
-                        if "차 예측" in row['공고명']:
-                            # "n차 예측" 형식 추출
-                            import re
-                            match = re.search(r'(\d+차 예측)', row['공고명'])
-                            if match:
-                                prediction_label = f" ({match.group(1)})"
-                        
-                        # 공고명에서 예측 표시 제거 (n차 예측 포함)
-                        clean_name = re.sub(r' \(\d+차 예측\)| \(예측\)', '', row['공고명'])
-                        
-                        # 예측 공고용 상세 정보
-                        bid_details = html.Details([
-                            html.Summary([
-                                f"{clean_name}",
-                                html.Span(prediction_label, className="prediction-label")
-                            ], className=summary_class),
-                            html.Div([
-                                html.P(f"실수요기관: {row['실수요기관'] if row['실수요기관'] else '-'}", className="bid-detail"),
-                                html.P(f"예측입찰게시: {bid_date}", className="bid-detail"),
-                                original_date_display,
-                                html.P(f"평균M/M: {mm_value}", className="bid-detail"),
-                                html.P(f"용역기간: {duration_display}", className="bid-detail"),
-                                html.P(f"계약금액: {contract_value}", className="bid-detail"),
-                            ])
-                        ])
-                    else:
-                        # 원본 공고용 상세 정보
-                        bid_details = html.Details([
-                            html.Summary(f"{emoji} {row['공고명']}", className=summary_class),
-                            html.Div([
-                                html.P(f"실수요기관: {row['실수요기관'] if row['실수요기관'] else '-'}", className="bid-detail"),
-                                html.P(f"입찰게시: {bid_date}", className="bid-detail"),
-                                html.P(f"(예측)입찰게시: {predicted_date}", className="bid-detail"),
-                                html.P(f"평균M/M: {mm_value}", className="bid-detail"),
-                                html.P(f"용역기간: {duration_display}", className="bid-detail"),
-                                html.P(f"계약금액: {contract_value}", className="bid-detail"),
-                                html.P(f"(1순위)입찰업체: {'-' if row['입찰결과_1순위'] == '예측' or not row['입찰결과_1순위'] else row['입찰결과_1순위']}", className="bid-detail"),
-                                html.P(f"(1순위)입찰금액: {bid_value}", className="bid-detail"),
-                            ])
-                        ])
-                    
-                    month_bids.append(bid_details)
-
-                section = html.Div([
-                    html.Div(id=anchor_id, className="anchor-point"),
-                    html.H3(month_title, className="month-title"),
-                    html.Div(month_bids, className="month-bids-list")
-                ], className="month-section", style=section_style)
-                month_cells.append(html.Div(section, className="month-cell"))
+        month_cells = [
+            build_month_section(month, entries, selected_month, selected_bid)
+            for month, entries in sections
+        ]
+        row_count = sum(len(entries) for _, entries in sections)
+        note_rows(row_count, row_count)
 
         return month_cells, range_display, prev_button_disabled, next_button_disabled
             
-def register_bid_selection_callbacks(app, df):
+def register_bid_selection_callbacks(app, snapshots):
+    # 클릭된 버튼의 id(월, 공고명)만 bid-click store에 기록 (브라우저에서 처리)
+    # 화면의 버튼 수와 관계없이 서버로는 클릭된 버튼 하나의 정보만 전송됨
+    app.clientside_callback(
+        """
+        function(nClicks) {
+            const ctx = dash_clientside.callback_context;
+            const triggered = (ctx.triggered || []).filter(function(t) { return t.prop_id !== '.'; });
+            // 새로 그려진 버튼(n_clicks 없음)은 무시
+            if (triggered.length === 0 || !triggered[0].value || !ctx.triggered_id) {
+                return dash_clientside.no_update;
+            }
+            return {month: ctx.triggered_id.month, bid: ctx.triggered_id.bid};
+        }
+        """,
+        Output("bid-click", "data"),
+        Input({"type": "bid-btn", "index": ALL, "month": ALL, "bid": ALL}, "n_clicks"),
+        prevent_initial_call=True
+    )
+
     @app.callback(
         [Output("selected-month", "data", allow_duplicate=True),
         Output("selected-bid", "data", allow_duplicate=True),  # 여기에 allow_duplicate=True 추가
         Output("scroll-target-display", "children"),
         Output("current-month-view", "data", allow_duplicate=True),
         Output("selected-year", "data", allow_duplicate=True)],
-        [Input({"type": "bid-btn", "index": ALL}, "n_clicks")],
-        [State({"type": "bid-btn", "index": ALL}, "data-month"),
-        State({"type": "bid-btn", "index": ALL}, "data-bid"),
-        State("selected-year", "data")],
+        [Input("bid-click", "data")],
         prevent_initial_call=True
     )
-    def update_selection(n_clicks, months, bids, selected_year):
-        ctx = callback_context
-        if not ctx.triggered or not any(n_clicks):
+    def update_selection(bid_click):
+        if not bid_click:
             return no_update, no_update, no_update, no_update, no_update
 
         try:
-            for i, n in enumerate(n_clicks):
-                if n:
-                    selected_month = months[i]
-                    selected_bid = bids[i]
-                    new_selected_year = int(selected_month.split("-")[0])
-                    target_id = f"anchor-{selected_month}"
-                    
-                    selected_month_num = int(selected_month.split("-")[1])
-                    months_range = list(range(1, 13))
-                    month_groups = [months_range[i:i+4] for i in range(0, len(months_range), 4)]
-
-                    for idx, group in enumerate(month_groups):
-                        if selected_month_num in group:
-                            return selected_month, selected_bid, target_id, idx, new_selected_year
+            selected_month = bid_click["month"]
+            selected_bid = bid_click["bid"]
+            new_selected_year = int(selected_month.split("-")[0])
+            target_id = f"anchor-{selected_month}"
+            
+            # 월 그룹 (1~4, 5~8, 9~12) 중 선택된 월이 속한 페이지
+            selected_month_num = int(selected_month.split("-")[1])
+            month_view = (selected_month_num - 1) // 4
+            return selected_month, selected_bid, target_id, month_view, new_selected_year
         except Exception as e:
             print("선택 오류:", e)
 
@@ -768,7 +806,7 @@ def register_bid_selection_callbacks(app, df):
         Input("selected-bid", "data")
     )
 
-def register_utility_callbacks(app, df):
+def register_utility_callbacks(app, snapshots):
     # 기존 스크롤 콜백 유지
     app.clientside_callback(
         """
@@ -845,37 +883,152 @@ def register_utility_callbacks(app, df):
         Input("selected-year", "data")
     )
 
-def register_next_bid_navigation_callbacks(app, df):
-    @app.callback(
+def register_next_bid_navigation_callbacks(app, snapshots):
+    # 다음 예정 입찰 페이지 이동은 navigation-summary의 년월 목록으로 브라우저에서 계산
+    app.clientside_callback(
+        """
+        function(prevClicks, nextClicks, currentPage, selectedYear, summary) {
+            const ctx = dash_clientside.callback_context;
+            const triggered = (ctx.triggered || []).filter(function(t) { return t.prop_id !== '.'; });
+            if (triggered.length === 0) {
+                return currentPage;
+            }
+            
+            // 다음 달 1일 이후의 년월 목록
+            const today = new Date();
+            const nextMonthDate = new Date(today.getFullYear(), today.getMonth() + 1, 1);
+            const nextMonth = nextMonthDate.getFullYear() + '-' + String(nextMonthDate.getMonth() + 1).padStart(2, '0');
+            const months = ((summary && summary.upcoming_months) || []).filter(function(m) { return m >= nextMonth; });
+            const maxPage = months.length - 1;
+            
+            const buttonId = triggered[0].prop_id.split('.')[0];
+            if (buttonId === 'prev-page-btn' && prevClicks && currentPage > 0) {
+                return currentPage - 1;
+            } else if (buttonId === 'next-page-btn' && nextClicks && currentPage < maxPage) {
+                return currentPage + 1;
+            }
+            
+            return currentPage;
+        }
+        """,
         Output("current-page", "data"),
         [Input("prev-page-btn", "n_clicks"),
          Input("next-page-btn", "n_clicks")],
         [State("current-page", "data"),
-         State("selected-year", "data")]
+         State("selected-year", "data"),
+         State("navigation-summary", "data")]
     )
-    def update_next_bids_page(prev_clicks, next_clicks, current_page, selected_year):
-        ctx = callback_context
-        if not ctx.triggered:
-            return current_page
 
-        today = datetime.today()
-        next_month = datetime(today.year + (today.month == 12), (today.month % 12) + 1, 1)
-        
-        upcoming_df = df[df["예상_입찰일"] >= next_month].copy()
-        upcoming_df["예상_년월"] = upcoming_df["예상_입찰일"].dt.strftime("%Y-%m")
-        
-        월순서 = sorted(upcoming_df["예상_년월"].unique())
-        max_page = len(월순서) - 1
-        
-        button_id = ctx.triggered[0]["prop_id"].split(".")[0]
-        if button_id == "prev-page-btn" and prev_clicks and current_page > 0:
-            return current_page - 1
-        elif button_id == "next-page-btn" and next_clicks and current_page < max_page:
-            return current_page + 1
-        
-        return current_page
+# 전체 테이블 캐시: (데이터 버전, 연도) -> 표시용 데이터 프레임 (필터/정렬 전)
+full_table_cache = LRUCache(maxsize=16)
+
+# 전체 테이블 한 페이지에 보여줄 행 수
+FULL_TABLE_PAGE_SIZE = 50
+
+# 대소문자 구분 없이 검색하는 텍스트 컬럼
+FULL_TABLE_TEXT_COLUMNS = ["공고명", "실수요기관", "1순위 입찰업체"]
+
+
+# 전체 테이블 컬럼 (원래 컬럼명 -> 보여줄 컬럼명)
+FULL_TABLE_COLUMNS = {
+    "공고명": "공고명",
+    "실수요기관": "실수요기관",
+    "물동량 평균": "평균M/M",
+    "용역기간(개월)": "용역기간(개월)",
+    "계약 기간 내": "계약금액(원)",
+    "입찰결과_1순위": "1순위 입찰업체",
+    "입찰금액_1순위": "입찰금액(원)",
+    "bid_id": "bid_id"  # bid_id 포함 (숨겨진 컬럼)
+}
+
+
+def build_full_table_frame(snapshot, selected_year):
+    """선택한 연도의 전체 공고 테이블 데이터 생성 (컬럼명은 테이블 표시용)"""
+    year_view = snapshot.year(selected_year)
+    index = year_view.index
+
+    # 원본 데이터의 최대 연도 확인 (스냅샷 색인에 미리 계산된 값)
+    max_original_year = snapshot.index.max_original_year
+    print(f"원본 데이터 최대 연도: {max_original_year}, 선택 연도: {selected_year}")
+    
+    # 선택한 연도가 원본 데이터 최대 연도보다 크면 예측 데이터만 표시
+    if selected_year > max_original_year:
+        year_df = index.rows(selected_year, prediction=True)
+    else:
+        year_df = index.rows(selected_year)
+    
+    if year_df.empty:
+        return pd.DataFrame()
+    
+    # 테이블에 표시할 데이터 정렬
+    year_df = year_df.sort_values(by="예상_입찰일")
+    display = year_view.display.loc[year_df.index]
+    is_prediction = year_df["is_prediction"]
+
+    # 필요한 컬럼만 선택하고 이름 변경
+    available_columns = [col for col in FULL_TABLE_COLUMNS if col in year_df.columns]
+    table_df = year_df[available_columns].rename(columns=FULL_TABLE_COLUMNS)
+
+    # 날짜는 표시용 컬럼(연-월-일) 사용: 예측 공고는 원본 입찰일을 입찰게시로 표시
+    has_original_date = is_prediction & (display["표시_원본_입찰일"] != "")
+    table_df.insert(2, "입찰게시", display["표시_원본_입찰일"].where(has_original_date, display["표시_입찰일"]))
+    table_df.insert(3, "(예측)입찰게시", display["표시_예측_입찰일"].where(is_prediction))
+    
+    # 입찰업체가 "예측"인 경우 '-'로 변경
+    if "1순위 입찰업체" in table_df.columns:
+        winners = table_df["1순위 입찰업체"].astype(object)
+        table_df["1순위 입찰업체"] = winners.mask(winners == "예측", "-")
+    
+    return table_df
+
 
-def register_full_table_callbacks(app, df):
+def get_full_table_frame(snapshot, selected_year):
+    """스냅샷 버전과 연도 기준으로 캐시된 테이블 데이터 반환 (없으면 생성 후 저장)"""
+    return full_table_cache.get_or_build(
+        (snapshot.version, selected_year),
+        lambda: build_full_table_frame(snapshot, selected_year)
+    )
+
+
+def filter_full_table(table_df, sort_by, filter_query):
+    """
+    테이블 데이터에 필터/정렬 적용 (정렬 조건이 없으면 캐시된 예상_입찰일 순서 유지)
+
+    Returns:
+        pandas.DataFrame: 필터와 정렬을 적용한 테이블 데이터
+    """
+    mask = filter_query_mask(table_df, filter_query, FULL_TABLE_TEXT_COLUMNS)
+    return sort_frame(table_df[mask], sort_by)
+
+
+def query_full_table(table_df, page_current, page_size, sort_by, filter_query):
+    """
+    테이블 데이터에 필터/정렬을 적용하고 현재 페이지만 잘라서 반환
+
+    Returns:
+        tuple: (페이지 행 목록, 보정된 현재 페이지, 전체 페이지 수, 필터 결과 행 수)
+    """
+    filtered_df = filter_full_table(table_df, sort_by, filter_query)
+
+    total_rows = len(filtered_df)
+    page_count = max(1, math.ceil(total_rows / page_size))
+    page_current = min(max(page_current or 0, 0), page_count - 1)
+
+    page_df = filtered_df.iloc[page_current * page_size:(page_current + 1) * page_size]
+    return page_df.to_dict('records'), page_current, page_count, total_rows
+
+
+def build_tooltip_data(records):
+    """현재 페이지 행에 대한 tooltip_data 생성"""
+    return [
+        {
+            column: {'value': str(value), 'type': 'markdown'}
+            for column, value in row.items()
+        } for row in records
+    ]
+
+
+def register_full_table_callbacks(app, snapshots):
     @app.callback(
     [Output("full-table-container", "children"),
      Output("update-status-table", "children", allow_duplicate=True)],
@@ -883,85 +1036,15 @@ def register_full_table_callbacks(app, df):
     prevent_initial_call=True
     )
     def update_full_table(selected_year):
-        # 원본 데이터의 최대 연도 확인
-        max_original_year = df[~df["공고명"].str.contains("예측")]["예상_연도"].max() if not df[~df["공고명"].str.contains("예측")].empty else datetime.today().year
-        print(f"원본 데이터 최대 연도: {max_original_year}, 선택 연도: {selected_year}")
+        # 현재 데이터 스냅샷 기준 테이블 데이터 (버전/연도별 캐시)
+        table_df = get_full_table_frame(snapshot_for_year(snapshots, selected_year), selected_year)
         
-        # 선택한 연도가 원본 데이터 최대 연도보다 크면 예측 데이터만 표시
-        if selected_year > max_original_year:
-            year_df = df[(df["예상_연도"] == selected_year) & (df["공고명"].str.contains("예측", case=False))].copy()
-        else:
-            year_df = df[df["예상_연도"] == selected_year].copy()
-        
-        if year_df.empty:
+        if table_df.empty:
             return html.Div("선택한 연도에 해당하는 공고가 없습니다.", className="no-data-message"), no_update
         
-        # 테이블에 표시할 데이터 정렬
-        year_df = year_df.sort_values(by="예상_입찰일")
-        
-        # 현재 연도보다 이전 연도인지 확인 (과거 데이터)
-        current_year = datetime.today().year
-        is_past_data = selected_year < current_year
-        
-        # 미래 데이터 (예측 데이터)인지 확인
-        is_future_data = selected_year > max_original_year
-        
-        # 예측 데이터 처리
-        for idx, row in year_df.iterrows():
-            # 예측 공고인 경우
-            if "예측" in str(row["공고명"]):
-                # 원본_입찰일이 있는지 확인하고 없으면 계산
-                if "원본_입찰일" not in year_df.columns or pd.isna(row.get("원본_입찰일")):
-                    if pd.notna(row["용역기간(개월)"]) and row["용역기간(개월)"] > 0:
-                        # 예측일에서 용역기간을 빼서 원래 입찰일 계산
-                        original_date = row["예상_입찰일"] - pd.DateOffset(months=int(row["용역기간(개월)"]))
-                        if "원본_입찰일" not in year_df.columns:
-                            year_df["원본_입찰일"] = pd.NaT
-                        year_df.at[idx, "원본_입찰일"] = original_date
-                
-                # 입찰게시와 예측입찰게시 분리
-                if "예측_입찰일" not in year_df.columns:
-                    year_df["예측_입찰일"] = pd.NaT
-                    
-                # 용역기간 기반 예측 계산 (용역기간-1개월 적용)
-                if pd.notna(row["예상_입찰일"]) and pd.notna(row["용역기간(개월)"]) and row["용역기간(개월)"] > 0:
-                    # 용역기간에서 1개월 차감
-                    adjusted_period = max(1, int(row["용역기간(개월)"]) - 1)  # 최소 1개월 보장
-                    year_df.at[idx, "예측_입찰일"] = row["원본_입찰일"] + pd.DateOffset(months=adjusted_period)
-                else:
-                    year_df.at[idx, "예측_입찰일"] = row["예상_입찰일"]  # 원본 예측일 사용
-                
-                # 원본 입찰일이 있으면 예상_입찰일을 원본_입찰일로 교체
-                if "원본_입찰일" in year_df.columns and pd.notna(year_df.at[idx, "원본_입찰일"]):
-                    year_df.at[idx, "예상_입찰일"] = year_df.at[idx, "원본_입찰일"]
-        
-        # 컬럼 이름 매핑 (원래 컬럼명 -> 보여줄 컬럼명)
-        column_mapping = {
-            "공고명": "공고명",
-            "실수요기관": "실수요기관",
-            "예상_입찰일": "입찰게시",
-            "예측_입찰일": "(예측)입찰게시",
-            "물동량 평균": "평균M/M",
-            "용역기간(개월)": "용역기간(개월)",
-            "계약 기간 내": "계약금액(원)",
-            "입찰결과_1순위": "1순위 입찰업체",
-            "입찰금액_1순위": "입찰금액(원)",
-            "bid_id": "bid_id"  # bid_id 포함 (숨겨진 컬럼)
-        }
-        
-        # 필요한 컬럼만 선택하고 이름 변경
-        available_columns = [col for col in column_mapping.keys() if col in year_df.columns]
-        table_df = year_df[available_columns].copy()
-        table_df.columns = [column_mapping[col] for col in available_columns if col in column_mapping]
-        
-        # 입찰업체가 "예측"인 경우 빈 값으로 변경
-        if "1순위 입찰업체" in table_df.columns:
-            table_df["1순위 입찰업체"] = table_df["1순위 입찰업체"].apply(lambda x: "-" if x == "예측" else x)
-        
-        # 날짜 형식을 연-월-일로 변환
-        date_columns = [col for col in ["입찰게시", "(예측)입찰게시"] if col in table_df.columns]
-        for col in date_columns:
-            table_df[col] = pd.to_datetime(table_df[col], errors='coerce').dt.strftime('%Y-%m-%d')
+        # 첫 페이지만 전송 (이후 페이지/필터/정렬은 서버에서 처리, 기본은 예상_입찰일 순서)
+        page_data, _, page_count, _ = query_full_table(table_df, 0, FULL_TABLE_PAGE_SIZE, [], "")
+        note_rows(len(table_df), len(page_data))
         
         # 테이블 컬럼 설정
         columns = []
@@ -1023,7 +1106,7 @@ def register_full_table_callbacks(app, df):
         table = dash_table.DataTable(
             id='full-data-table',
             columns=columns,
-            data=table_df.to_dict('records'),
+            data=page_data,
             style_table={
                 'overflowX': 'auto',
                 'maxHeight': '600px',
@@ -1108,20 +1191,18 @@ def register_full_table_callbacks(app, df):
                 'border': '1px solid #ddd',
                 'padding': '4px'
             },
-            filter_action="native",
+            # 필터/정렬/페이지는 서버에서 처리하고 현재 페이지만 전송
+            filter_action="custom",
+            filter_query="",
             filter_options={"placeholder_text": "검색..."},
-            sort_action="native",
+            sort_action="custom",
             sort_mode="multi",
-            sort_by=[{"column_id": "입찰게시", "direction": "asc"}],
-            page_action='none',
-            export_format="csv",
-            export_headers="display",
-            tooltip_data=[
-                {
-                    column: {'value': str(value), 'type': 'markdown'}
-                    for column, value in row.items()
-                } for row in table_df.to_dict('records')
-            ],
+            sort_by=[],
+            page_action="custom",
+            page_current=0,
+            page_size=FULL_TABLE_PAGE_SIZE,
+            page_count=page_count,
+            tooltip_data=build_tooltip_data(page_data),
             tooltip_duration=None,
             # 테이블 전체는 편집 불가, 특정 셀만 편집 가능
             editable=False,
@@ -1136,7 +1217,11 @@ def register_full_table_callbacks(app, df):
             html.Button("빈 값만 보기 (용역기간)", id="filter-duration-btn", n_clicks=0,
                         style={"marginRight": "10px", "backgroundColor": "#e7f2fc", "border": "1px solid #ccc", "padding": "5px 10px"}),
             html.Button("모두 보기", id="filter-all-btn", n_clicks=0,
-                        style={"backgroundColor": "#e7f2fc", "border": "1px solid #ccc", "padding": "5px 10px"})
+                        style={"marginRight": "10px", "backgroundColor": "#e7f2fc", "border": "1px solid #ccc", "padding": "5px 10px"}),
+            # 페이지는 서버에서 나누므로 CSV는 필터/정렬을 적용한 전체 행을 서버에서 생성
+            html.Button("CSV 내보내기", id="full-table-export-btn", n_clicks=0,
+                        style={"backgroundColor": "#e7f2fc", "border": "1px solid #ccc", "padding": "5px 10px"}),
+            dcc.Download(id="full-table-download")
         ], style={"marginBottom": "15px"})
         
         # 공고 수 계산
@@ -1155,6 +1240,7 @@ def register_full_table_callbacks(app, df):
             html.Div([
                 html.P([
                     title_text,
+                    html.Span(id="full-table-row-count", style={"marginLeft": "10px"}),
                 ], className="table-summary-text"),
                 help_text
             ], className="table-summary-container"),
@@ -1162,6 +1248,64 @@ def register_full_table_callbacks(app, df):
             html.Div(table, className="table-container")
         ]), no_update
     
+    @app.callback(
+        [Output("full-data-table", "data"),
+         Output("full-data-table", "page_current"),
+         Output("full-data-table", "page_count"),
+         Output("full-data-table", "tooltip_data"),
+         Output("full-table-row-count", "children")],
+        [Input("full-data-table", "page_current"),
+         Input("full-data-table", "page_size"),
+         Input("full-data-table", "sort_by"),
+         Input("full-data-table", "filter_query")],
+        [State("selected-year", "data")],
+        prevent_initial_call=True
+    )
+    def update_full_table_page(page_current, page_size, sort_by, filter_query, selected_year):
+        table_df = get_full_table_frame(snapshots.current(), selected_year)
+        
+        # 필터가 바뀌면 첫 페이지부터 표시
+        ctx = callback_context
+        if ctx.triggered and ctx.triggered[0]["prop_id"].endswith(".filter_query"):
+            page_current = 0
+        
+        try:
+            page_data, page_current, page_count, total_rows = query_full_table(
+                table_df, page_current, page_size or FULL_TABLE_PAGE_SIZE, sort_by, filter_query
+            )
+        except FilterQueryError as e:
+            print(f"필터 해석 오류: {e}")
+            return [], 0, 1, [], f"(필터 오류: {e})"
+        
+        note_rows(len(table_df), len(page_data))
+        row_count_text = f"(필터 결과 {total_rows}건)" if filter_query else ""
+        return page_data, page_current, page_count, build_tooltip_data(page_data), row_count_text
+    
+    @app.callback(
+        Output("full-table-download", "data"),
+        Input("full-table-export-btn", "n_clicks"),
+        [State("full-data-table", "sort_by"),
+         State("full-data-table", "filter_query"),
+         State("selected-year", "data")],
+        prevent_initial_call=True
+    )
+    def export_full_table(n_clicks, sort_by, filter_query, selected_year):
+        if not n_clicks:
+            return no_update
+        table_df = get_full_table_frame(snapshots.current(), selected_year)
+        try:
+            export_df = filter_full_table(table_df, sort_by, filter_query)
+        except FilterQueryError as e:
+            print(f"필터 해석 오류: {e}")
+            return no_update
+        
+        # 숨긴 bid_id 컬럼은 제외 (엑셀에서 한글이 깨지지 않도록 BOM 포함)
+        export_df = export_df.drop(columns=["bid_id"], errors="ignore")
+        note_rows(len(table_df), len(export_df))
+        return dcc.send_data_frame(
+            export_df.to_csv, f"{selected_year}년_공고.csv", index=False, encoding="utf-8-sig"
+        )
+    
     @app.callback(
         Output("update-status-table", "children"),
         [Input("full-data-table", "data_timestamp")],
@@ -1172,8 +1316,9 @@ def register_full_table_callbacks(app, df):
         if timestamp is None or current_data is None or previous_data is None:
             return no_update
         
-        # 변경된 데이터 찾기
+        # 변경된 데이터 찾기 (bid_id별로 모아서 한 번에 저장)
         changes = []
+        edits = {}
         for i, (current_row, previous_row) in enumerate(zip(current_data, previous_data)):
             if current_row != previous_row:
                 # 변경 감지
@@ -1185,7 +1330,7 @@ def register_full_table_callbacks(app, df):
                 if current_row.get('평균M/M') != previous_row.get('평균M/M'):
                     try:
                         new_value = float(current_row.get('평균M/M', 0))
-                        app.update_firebase_data(bid_id, "물동량 평균", new_value)
+                        edits.setdefault(bid_id, {})["물동량 평균"] = new_value
                         changes.append(f"물동량 평균 변경: {previous_row.get('평균M/M')} → {current_row.get('평균M/M')}")
                     except (ValueError, TypeError) as e:
                         changes.append(f"물동량 평균 변경 오류: {e}")
@@ -1194,11 +1339,16 @@ def register_full_table_callbacks(app, df):
                 if current_row.get('용역기간(개월)') != previous_row.get('용역기간(개월)'):
                     try:
                         new_value = float(current_row.get('용역기간(개월)', 0))
-                        app.update_firebase_data(bid_id, "용역기간(개월)", new_value)
+                        edits.setdefault(bid_id, {})["용역기간(개월)"] = new_value
                         changes.append(f"용역기간 변경: {previous_row.get('용역기간(개월)')} → {current_row.get('용역기간(개월)')}")
                     except (ValueError, TypeError) as e:
                         changes.append(f"용역기간 변경 오류: {e}")
         
+        if edits:
+            success, message = app.update_firebase_batch(edits)
+            if not success:
+                changes.append(message)
+        
         if changes:
             return html.Div([
                 html.P("변경 내용이 저장되었습니다:", style={"fontWeight": "bold", "marginBottom": "8px"}),
@@ -1236,7 +1386,7 @@ def register_full_table_callbacks(app, df):
         # 기본값: 필터 없음
         return ""
         
-def register_edit_callbacks(app, df):
+def register_edit_callbacks(app, snapshots):
     @app.callback(
         [Output("edit-data-modal", "is_open"),
          Output("modal-bid-name", "children"),
@@ -1247,16 +1397,23 @@ def register_edit_callbacks(app, df):
         [State("selected-bid", "data")]
     )
     def open_edit_modal(n_clicks, selected_bid):
+        # 현재 데이터 스냅샷 (요청 처리 중 다른 버전으로 바뀌지 않음)
+        df = snapshots.current().df
+
         if not n_clicks or not selected_bid:
             return False, "", None, None, ""
         
-        # 선택된 입찰 정보 찾기
-        bid_info = df[df["공고명"] == selected_bid].iloc[0] if len(df[df["공고명"] == selected_bid]) > 0 else None
+        # 선택된 입찰 정보 찾기 (예측 공고는 연도별로 생성되므로 원본 공고에서 찾음)
+        matches = df[df["공고명"] == selected_bid]
+        if matches.empty:
+            base_name = re.sub(PREDICTION_SUFFIX_PATTERN, "", selected_bid)
+            matches = df[df["공고명"] == base_name]
+        bid_info = matches.iloc[0] if len(matches) > 0 else None
         
         if bid_info is None:
             return False, "", None, None, ""
         
-        return True, bid_info["공고명"], bid_info["물동량 평균"], bid_info["용역기간(개월)"], bid_info["bid_id"]
+        return True, selected_bid, bid_info["물동량 평균"], bid_info["용역기간(개월)"], bid_info["bid_id"]
     
     @app.callback(
         Output("edit-data-modal", "is_open", allow_duplicate=True),
@@ -1281,15 +1438,14 @@ def register_edit_callbacks(app, df):
         if not n_clicks or not bid_id:
             return no_update, no_update
         
-        # 물동량 평균 업데이트
-        mm_success, mm_message = app.update_firebase_data(bid_id, "물동량 평균", mm_value)
-        
-        # 용역기간 업데이트
-        duration_success, duration_message = app.update_firebase_data(bid_id, "용역기간(개월)", duration_value)
+        # 물동량 평균과 용역기간을 한 번에 업데이트
+        success, message = app.update_firebase_batch({
+            bid_id: {"물동량 평균": mm_value, "용역기간(개월)": duration_value}
+        })
         
-        if mm_success and duration_success:
+        if success:
             # 성공 시 모달 닫기
             return html.Div("저장이 완료되었습니다.", style={"color": "green"}), False
         else:
             # 실패 시 모달 유지하고 에러 표시
-            return html.Div(f"오류: {mm_message}, {duration_message}", style={"color": "red"}), True
+            return html.Div(f"오류: {message}", style={"color": "red"}), True
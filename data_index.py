@@ -0,0 +1,134 @@
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from bid_schema import prediction_mask
+
+_EMPTY_POSITIONS = np.array([], dtype=np.int64)
+
+
+class BidIndex:
+    """
+    데이터 버전마다 한 번 만드는 통합 데이터 프레임 색인
+
+    - (연도, 월, 예측 여부)별 행 위치
+    - 원본 데이터 최대 연도 등 미리 계산한 값
+
+    조회 결과는 항상 원래 데이터 프레임의 행 순서를 유지한다.
+    """
+
+    def __init__(self, df):
+        self.df = df
+        self.partitions = {}  # 연도 -> {(월, 예측 여부): 행 위치 배열}
+        self.is_prediction = np.zeros(len(df), dtype=bool)
+        self.max_original_year = datetime.today().year
+
+        if df.empty:
+            return
+
+        # 예측 여부 (스키마의 is_prediction 컬럼이 없으면 공고명의 예측 차수 표시로 판단)
+        if "is_prediction" in df.columns or "공고명" in df.columns:
+            self.is_prediction = prediction_mask(df)
+
+        # (연도, 월, 예측 여부)별 행 위치
+        if {"예상_연도", "예상_입찰월"} <= set(df.columns):
+            keys = pd.DataFrame({
+                "year": df["예상_연도"].to_numpy(),
+                "month": df["예상_입찰월"].to_numpy(),
+                "prediction": self.is_prediction,
+            })
+            for (year, month, prediction), positions in keys.groupby(["year", "month", "prediction"]).indices.items():
+                self.partitions.setdefault(int(year), {})[(int(month), bool(prediction))] = positions
+
+            original_years = df["예상_연도"].to_numpy()[~self.is_prediction]
+            original_years = original_years[pd.notna(original_years)]
+            if len(original_years):
+                self.max_original_year = int(original_years.max())
+
+    @property
+    def years(self):
+        """데이터가 있는 연도 목록 (오름차순)"""
+        return sorted(self.partitions)
+
+    def positions(self, year, months=None, prediction=None):
+        """
+        조건에 맞는 행 위치 배열 반환
+
+        Args:
+            year (int): 예상_연도
+            months (list, optional): 예상_입찰월 목록 (None이면 전체)
+            prediction (bool, optional): True=예측만, False=원본만, None=모두
+        """
+        year_partitions = self.partitions.get(year)
+        if not year_partitions:
+            return _EMPTY_POSITIONS
+
+        parts = [
+            positions for (month, is_prediction), positions in year_partitions.items()
+            if (months is None or month in months)
+            and (prediction is None or is_prediction == prediction)
+        ]
+        if not parts:
+            return _EMPTY_POSITIONS
+        return np.sort(np.concatenate(parts))
+
+    def rows(self, year, months=None, prediction=None):
+        """조건에 맞는 행만 담은 데이터 프레임 반환 (원래 행 순서 유지)"""
+        return self.df.iloc[self.positions(year, months, prediction)]
+
+
+class UpcomingBidsIndex:
+    """
+    다음 예정 입찰 화면용 색인 (데이터 버전마다 한 번 생성)
+
+    - 예상_입찰일 기준 년월 목록 (오름차순)
+    - 년월 -> 실수요기관(이름순) -> 입찰일 순 공고 목록
+    - 년월별 전체/예측 공고 수
+    """
+
+    def __init__(self, df, display):
+        self.months = []
+        self.groups = {}  # 년월 -> {실수요기관: [(공고명, 예측 여부, 원본 년월), ...]}
+        self.counts = {}  # 년월 -> (전체 공고 수, 예측 공고 수)
+
+        if df.empty or "표시_년월" not in display.columns or "실수요기관" not in df.columns:
+            return
+
+        is_prediction = pd.Series(prediction_mask(df), index=df.index)
+
+        frame = pd.DataFrame({
+            "month": display["표시_년월"],
+            "org": df["실수요기관"].astype(object),
+            "date": df["예상_입찰일"],
+            "is_prediction": is_prediction,
+            "name": df["공고명"].astype(str),
+            "original_month": display["표시_원본_년월"],
+        })
+        frame = frame[(frame["month"] != "") & frame["org"].notna()]
+
+        # 기관 안에서는 입찰일 순, 같은 날짜면 원본 공고 먼저 (그 다음은 원래 행 순서)
+        frame = frame.sort_values(["month", "org", "date", "is_prediction"], kind="mergesort")
+
+        # 정렬된 행을 한 번만 순회하면서 년월/기관별로 묶음 (기관 수가 많아도 그룹별 프레임을 만들지 않음)
+        rows = zip(
+            frame["month"].tolist(), frame["org"].tolist(), frame["name"].tolist(),
+            frame["is_prediction"].tolist(), frame["original_month"].tolist(),
+        )
+        for month, org, name, prediction, original_month in rows:
+            orgs = self.groups.get(month)
+            if orgs is None:
+                orgs = self.groups[month] = {}
+                self.months.append(month)
+                self.counts[month] = [0, 0]
+            orgs.setdefault(org, []).append((name, prediction, original_month))
+            self.counts[month][0] += 1
+            self.counts[month][1] += prediction
+        self.counts = {month: tuple(count) for month, count in self.counts.items()}
+
+    def months_from(self, start_month):
+        """start_month('YYYY-MM') 이후의 년월 목록"""
+        return [month for month in self.months if month >= start_month]
+
+    def months_in_year(self, year):
+        """해당 연도의 년월 목록"""
+        prefix = f"{year}-"
+        return [month for month in self.months if month.startswith(prefix)]
@@ -0,0 +1,346 @@
+import os
+import signal
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import firebase_admin
+from firebase_admin import credentials
+from firebase_admin import db
+from data_store import BidStore, SnapshotHolder
+from reload_scheduler import ReloadScheduler
+from snapshot_file import SnapshotPersister, start_from_snapshot
+from shared_snapshot import SharedSnapshotWriter
+
+# Firebase 초기화 함수
+def initialize_firebase():
+    try:
+        # 이미 초기화된 경우 새 앱 인스턴스 생성
+        firebase_admin.get_app()
+    except ValueError:
+        # 초기화되지 않은 경우 새로 초기화
+        import json
+
+        # 환경 변수에서 Firebase 인증 정보 가져오기
+        firebase_credentials = os.environ.get('FIREBASE_CREDENTIALS')
+
+        if firebase_credentials:
+            # 환경 변수에 저장된 JSON 문자열을 딕셔너리로 변환
+            cred_dict = json.loads(firebase_credentials)
+            cred = credentials.Certificate(cred_dict)
+        else:
+            # 로컬 개발 환경일 경우 파일 사용
+            try:
+                cred = credentials.Certificate('g2b-db-6aae9-firebase-adminsdk-fbsvc-0e3b1ce560.json')
+            except FileNotFoundError:
+                print("Firebase 인증 파일을 찾을 수 없습니다.")
+                raise
+
+        firebase_admin.initialize_app(cred, {
+            'databaseURL': 'https://g2b-db-6aae9-default-rtdb.asia-southeast1.firebasedatabase.app/'
+        })
+    print("Firebase 초기화 완료")
+
+
+# 첫 화면 전에 받을 연도 범위 (현재 연도 ± 이 값, 나머지 연도는 백그라운드에서 받음)
+PRIORITY_YEAR_RANGE = 1
+
+# 연도별 데이터를 동시에 받는 최대 작업 수
+YEAR_FETCH_WORKERS = 4
+
+# 연도 선택으로 아직 받지 않은 연도를 요청했을 때 기다리는 최대 시간(초)
+YEAR_REQUEST_TIMEOUT = 10.0
+
+# /bids에 새 연도 키가 생겼는지 얕은 조회로 확인하는 간격(초)
+YEAR_KEYS_REFRESH_INTERVAL = 300.0
+
+
+def order_year_keys(year_keys, current_year):
+    """
+    연도 키를 현재 연도에서 가까운 순서로 정렬 (같은 거리면 다음 연도 먼저)
+
+    Args:
+        year_keys (iterable): /bids 연도 키 ('2024' 형식)
+        current_year (int): 기준 연도
+
+    Returns:
+        list: 정렬된 연도 키 (숫자가 아닌 키는 마지막)
+    """
+    def distance(year):
+        if not str(year).isdigit():
+            return (float("inf"), 0)
+        return (abs(int(year) - current_year), -int(year))
+    return sorted(year_keys, key=distance)
+
+
+class FirebaseLoader:
+    """
+    Firebase /bids, /user_inputs 리스너를 열고 변경분을 BidStore에 반영한 뒤
+    SnapshotHolder에 새 스냅샷으로 게시하는 데이터 로더
+
+    /bids는 얕은 조회로 연도 키만 받은 뒤 연도별 리스너(/bids/{year})를 스레드 풀에서
+    나눠 연다. 현재 연도와 인접 연도를 먼저 받아 게시하므로 첫 화면까지의 시간은
+    전체 이력 크기와 관계없고, 나머지 연도는 백그라운드에서 받거나 연도 선택으로
+    조회할 때 먼저 받는다 (ensure_year).
+
+    단일 프로세스 실행에서는 app.py가 직접 사용하고, gunicorn 다중 작업자 실행에서는
+    로더 프로세스(python data_loader.py) 하나만 사용한다.
+    """
+
+    def __init__(self, snapshots, merge_window=0.5, listener_load_timeout=60.0, on_publish=None,
+                 year_fetch_workers=YEAR_FETCH_WORKERS):
+        """
+        Args:
+            snapshots (SnapshotHolder): 게시 대상 스냅샷 보관소
+            merge_window (float): 리스너 이벤트를 모아서 한 번에 게시하는 시간(초)
+            listener_load_timeout (float): 리스너 초기 이벤트를 기다리는 최대 시간(초)
+            on_publish (callable): 게시 후 on_publish(snapshot, 걸린 시간)을 호출
+            year_fetch_workers (int): 연도별 데이터를 동시에 받는 최대 작업 수
+        """
+        self.snapshots = snapshots
+        self.listener_load_timeout = listener_load_timeout
+        self.on_publish = on_publish
+        self.year_fetch_workers = year_fetch_workers
+        # 메모리 내 데이터 저장소 (리스너 이벤트의 변경분을 반영)
+        self.bid_store = BidStore()
+        # 리스너 이벤트가 몰려도 스냅샷 게시는 한 작업자가 모아서 한 번씩만 실행
+        self.reload_scheduler = ReloadScheduler(self.publish_store, merge_window=merge_window)
+        self._year_listeners = {}  # 연도 키 -> 리스너 등록 정보
+        self._year_lock = threading.Lock()
+        self._year_pool = ThreadPoolExecutor(max_workers=year_fetch_workers, thread_name_prefix="bids-year")
+
+    def list_year_keys(self):
+        """얕은 조회로 /bids의 연도 키 목록만 가져오기 (하위 데이터는 받지 않음)"""
+        return list(db.reference('/bids').get(shallow=True) or {})
+
+    # Firebase에서 데이터 로드하는 함수
+    def load_data_from_firebase(self):
+        print("Firebase에서 데이터 로드 중...")
+
+        # 연도 키 목록을 먼저 받고 연도별 데이터와 사용자 입력 데이터를 동시에 가져오기
+        year_keys = self.list_year_keys()
+        with ThreadPoolExecutor(max_workers=self.year_fetch_workers) as executor:
+            user_inputs = executor.submit(lambda: db.reference('/user_inputs').get() or {})
+            year_nodes = executor.map(lambda year: db.reference(f'/bids/{year}').get(), year_keys)
+            bids_data = {year: node for year, node in zip(year_keys, year_nodes) if node is not None}
+
+            # 원본 데이터 프레임 생성 (예측 데이터는 연도를 조회할 때 생성)
+            df = self.bid_store.reset(bids_data, user_inputs.result())
+
+        print(f"총 {len(self.bid_store.base_df)} 레코드 로드 완료 ({len(year_keys)}개 연도)")
+
+        # 연도별 데이터 수 확인
+        print(f"연도별 데이터 수:")
+        print(df.groupby("예상_연도")["공고명"].count())
+
+        return df
+
+    def publish_store(self):
+        """저장소의 현재 데이터를 새 스냅샷으로 게시 (사용자 입력과 일부 연도 이상을 받은 뒤에만)"""
+        if not self.bid_store.publishable:
+            return None
+
+        def build():
+            # 연도별로 받는 중이면 아직 받지 않은 연도는 현재 스냅샷(로컬 스냅샷 등)의 행을 유지
+            return self.bid_store.to_dataframe(self.snapshots.current().df)
+
+        start = time.perf_counter()
+        snapshot = self.snapshots.update(build)
+        if self.on_publish is not None:
+            self.on_publish(snapshot, time.perf_counter() - start)
+        print(f"데이터 업데이트 완료: 총 {len(snapshot.df)}건 (버전 {snapshot.version})")
+        return snapshot
+
+    def listen_year(self, year):
+        """
+        /bids/{year} 리스너를 열고 초기 이벤트(연도 전체 데이터)가 반영될 때까지 대기
+
+        이미 열린 연도는 반영을 기다리기만 한다. 초기 이벤트를 받지 못하면 직접 조회한다.
+        """
+        with self._year_lock:
+            year_keys = self.bid_store.year_keys
+            if year_keys is not None and year not in year_keys:
+                # 목록 확인에서 삭제된 연도
+                return
+            if year not in self._year_listeners:
+                self._year_listeners[year] = db.reference(f'/bids/{year}').listen(
+                    lambda event: self._on_year_change(year, event)
+                )
+        if not self.bid_store.wait_years([year], self.listener_load_timeout):
+            print(f"{year}년 리스너 초기 데이터를 받지 못해 직접 로드합니다.")
+            self.bid_store.apply_year_event(year, "put", "/", db.reference(f'/bids/{year}').get())
+            self.reload_scheduler.trigger()
+
+    def _listen_year_in_background(self, year):
+        try:
+            self.listen_year(year)
+        except Exception as e:
+            # 실패한 연도는 로컬 스냅샷의 행을 유지하고 연도 선택 시 다시 요청
+            print(f"{year}년 데이터 로드 오류: {e}")
+
+    def _on_year_change(self, year, event):
+        """연도별 입찰 데이터 변경 시 실행되는 콜백"""
+        print(f"Firebase 데이터 변경 감지: /{year}{event.path}")
+
+        # 변경된 입찰만 다시 반영
+        affected = self.bid_store.apply_year_event(year, event.event_type, event.path, event.data)
+        print(f"변경된 입찰: {len(affected)}건")
+
+        # 스냅샷 게시는 다시 로드 작업자가 모아서 한 번에 처리
+        self.reload_scheduler.trigger()
+
+    def ensure_year(self, year, timeout=YEAR_REQUEST_TIMEOUT):
+        """
+        연도 선택으로 조회하는 연도를 아직 받지 않았으면 먼저 받고 게시될 때까지 대기
+
+        SnapshotHolder.set_year_loader로 등록해서 콜백이 snapshots.ensure_year로 호출한다.
+        이미 받은 연도이거나 /bids에 없는 연도는 바로 반환한다.
+
+        Returns:
+            bool: 해당 연도 데이터가 게시되었으면 True
+        """
+        year = str(year)
+        year_keys = self.bid_store.year_keys
+        if year_keys is None or year not in year_keys or year in self.bid_store.loaded_years:
+            return True
+        # 백그라운드 대기열 순서와 관계없이 바로 요청 (이미 열렸으면 반영만 기다림)
+        threading.Thread(target=self._listen_year_in_background, args=(year,), name=f"bids-year-{year}", daemon=True).start()
+        if not self.bid_store.wait_years([year], timeout):
+            print(f"{year}년 데이터를 아직 받지 못했습니다.")
+            return False
+        return self.reload_scheduler.wait(self.reload_scheduler.trigger(), timeout)
+
+    # Firebase 실시간 리스너 설정
+    def setup_firebase_listeners(self):
+        """Firebase 실시간 리스너 설정 (/user_inputs, 연도 키 목록 확인)"""
+
+        def on_user_inputs_change(event):
+            """사용자 입력 데이터 변경 시 실행되는 콜백"""
+            print(f"사용자 입력 데이터 변경: {event.path}")
+
+            # 변경된 입찰만 다시 반영
+            affected = self.bid_store.apply_user_inputs_event(event.event_type, event.path, event.data)
+            print(f"변경된 입찰: {len(affected)}건")
+
+            # 스냅샷 게시는 다시 로드 작업자가 모아서 한 번에 처리
+            self.reload_scheduler.trigger()
+
+        # 사용자 입력 데이터 리스너
+        user_inputs_ref = db.reference('/user_inputs')
+        user_inputs_ref.listen(on_user_inputs_change)
+
+        # 입찰 데이터는 연도별 리스너로 받음 (연도 키 목록은 얕은 조회)
+        year_keys = self.list_year_keys()
+        self.bid_store.set_year_keys(year_keys)
+        print(f"Firebase 실시간 리스너 설정 완료 (/bids {len(year_keys)}개 연도)")
+        return year_keys
+
+    def close_year(self, year):
+        """삭제된 연도의 리스너를 닫고 저장소에서 그 연도의 행을 제거"""
+        with self._year_lock:
+            registration = self._year_listeners.pop(year, None)
+        if registration is not None:
+            registration.close()
+        self.bid_store.apply_year_event(year, "put", "/", None)
+
+    def refresh_year_keys(self):
+        """
+        연도 키 목록을 다시 확인해서 새 연도의 리스너를 열고 삭제된 연도는 닫기
+
+        Returns:
+            tuple: (새 연도 키 목록, 삭제된 연도 키 목록)
+        """
+        year_keys = set(self.list_year_keys())
+        known = self.bid_store.year_keys or set()
+        added = order_year_keys(year_keys - known, datetime.today().year)
+        removed = sorted(known - year_keys)
+        self.bid_store.set_year_keys(year_keys)
+        for year in removed:
+            print(f"삭제된 연도 감지: {year}")
+            self.close_year(year)
+        for year in added:
+            print(f"새 연도 감지: {year}")
+            self._year_pool.submit(self._listen_year_in_background, year)
+        if removed:
+            self.reload_scheduler.trigger()
+        return added, removed
+
+    def _refresh_year_keys(self):
+        """연도 키 목록을 주기적으로 다시 확인"""
+        while True:
+            time.sleep(YEAR_KEYS_REFRESH_INTERVAL)
+            try:
+                self.refresh_year_keys()
+            except Exception as e:
+                print(f"연도 목록 확인 오류: {e}")
+
+    def reconcile_with_firebase(self):
+        """
+        Firebase 리스너를 설정하고 첫 화면에 필요한 연도가 게시될 때까지 대기
+
+        연도별 리스너의 초기 이벤트가 그 연도 전체 데이터를 보내주므로 별도의 전체 로드는
+        하지 않는다. 현재 연도와 인접 연도를 받으면 게시하고, 나머지 연도는 현재 연도에서
+        가까운 순서로 백그라운드에서 받는다 (받을 때마다 게시).
+        """
+        current_year = datetime.today().year
+        year_keys = order_year_keys(self.setup_firebase_listeners(), current_year)
+        first_years = [
+            year for year in year_keys
+            if str(year).isdigit() and abs(int(year) - current_year) <= PRIORITY_YEAR_RANGE
+        ]
+        if not first_years:
+            # 현재 연도 근처에 데이터가 없으면 가장 가까운 연도로 첫 화면 게시
+            first_years = year_keys[:1]
+        # 스레드 풀은 제출 순서대로 실행하므로 우선 연도를 먼저 제출
+        first = [self._year_pool.submit(self.listen_year, year) for year in first_years]
+        for year in year_keys:
+            if year not in first_years:
+                self._year_pool.submit(self._listen_year_in_background, year)
+        threading.Thread(target=self._refresh_year_keys, name="bids-year-keys", daemon=True).start()
+
+        if not self.bid_store.wait_user_inputs(self.listener_load_timeout):
+            print("사용자 입력 리스너 초기 데이터를 받지 못해 직접 로드합니다.")
+            self.bid_store.apply_user_inputs_event("put", "/", db.reference('/user_inputs').get())
+        for future in first:
+            future.result()
+        # 리스너 이벤트의 요청과 합쳐져서 한 번만 게시됨
+        if not self.reload_scheduler.wait(self.reload_scheduler.trigger()):
+            print(f"첫 화면 연도 게시 실패: {', '.join(first_years) or '없음'} (다음 변경 때 다시 게시)")
+            return
+        print(f"첫 화면 연도 게시 완료: {', '.join(first_years) or '없음'} (나머지 {len(year_keys) - len(first_years)}개 연도는 백그라운드에서 로드)")
+
+
+def main():
+    """
+    gunicorn 다중 작업자용 로더 프로세스
+
+    Firebase 리스너는 이 프로세스에서만 열고, 게시되는 데이터 버전마다
+    SHARED_SNAPSHOT_DIR에 공유 스냅샷 파일을 쓴다. 작업자는 이 파일을 매핑해서 사용한다
+    (gunicorn.conf.py가 시작/종료를 관리).
+    """
+    shared_dir = os.environ.get('SHARED_SNAPSHOT_DIR', 'shared_snapshot')
+    snapshot_dir = os.environ.get('SNAPSHOT_DIR', 'snapshot_cache')
+
+    initialize_firebase()
+    snapshots = SnapshotHolder()
+    loader = FirebaseLoader(
+        snapshots,
+        merge_window=float(os.environ.get('RELOAD_MERGE_WINDOW', 0.5)),
+        listener_load_timeout=float(os.environ.get('LISTENER_LOAD_TIMEOUT', 60)),
+    )
+    snapshots.subscribe(SharedSnapshotWriter(shared_dir).schedule)
+    snapshots.subscribe(SnapshotPersister(snapshot_dir).schedule)
+
+    stopped = threading.Event()
+    signal.signal(signal.SIGTERM, lambda signum, frame: stopped.set())
+    signal.signal(signal.SIGINT, lambda signum, frame: stopped.set())
+
+    # 로컬 스냅샷이 있으면 바로 공유하고 Firebase 동기화는 백그라운드에서 진행
+    start_from_snapshot(snapshots, snapshot_dir, loader.reconcile_with_firebase)
+    print(f"데이터 로더 실행 중 (공유 디렉터리: {shared_dir}, 버전 {snapshots.version})")
+    stopped.wait()
+    print("데이터 로더 종료")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,604 @@
+import threading
+from datetime import datetime
+import numpy as np
+import pandas as pd
+from preprocess import predictions_for_year
+from reconcile import SUCCESSOR_COLUMN, successor_dates_of, with_successor_dates
+from cache import LRUCache
+from data_index import BidIndex, UpcomingBidsIndex
+from display_columns import build_display_frame
+from bid_schema import apply_bid_schema
+
+# Firebase 컬럼명 -> 앱 내부 컬럼명 매핑
+FIREBASE_TO_APP_COLUMNS = {
+    "낙찰금액": "입찰금액_1순위",
+    "사업금액": "계약 기간 내",
+    "채권자명": "실수요기관",
+    "개찰업체정보": "입찰결과_1순위",
+}
+
+# 앱 내부 컬럼명 -> Firebase 컬럼명 매핑
+APP_TO_FIREBASE_COLUMNS = {app_col: firebase_col for firebase_col, app_col in FIREBASE_TO_APP_COLUMNS.items()}
+
+
+def split_event_path(path):
+    """Firebase 이벤트 경로('/2024/03/bid_x')를 키 리스트로 변환"""
+    return [segment for segment in (path or "").split("/") if segment]
+
+
+# 사용자 입력에서 가져와 입찰 행에 덮어쓰는 컬럼
+USER_INPUT_COLUMNS = ["물동량 평균", "용역기간(개월)"]
+
+
+def _infer_column(values):
+    """파이썬 값 목록을 pandas가 추론한 타입의 Series로 변환"""
+    return pd.Series(values, dtype=object).infer_objects()
+
+
+def parse_bid_dates(values, years, months):
+    """
+    입찰일시 값들을 한 번에 datetime으로 변환
+
+    대부분의 값은 한 번의 to_datetime 호출로 변환되고, 형식이 다른 값만 다시
+    개별 형식으로 해석한다. 그래도 해석할 수 없는 값은 해당 연월 1일로 대체한다.
+
+    Args:
+        values (pandas.Series): 입찰일시 원본 값 (없으면 NaN)
+        years (pandas.Series): 연도 키
+        months (pandas.Series): 월 키
+
+    Returns:
+        pandas.Series: 예상_입찰일
+    """
+    dates = pd.to_datetime(values, errors="coerce")
+    failed = dates.isna() & values.notna()
+    if failed.any():
+        dates[failed] = pd.to_datetime(values[failed], errors="coerce", format="mixed")
+        failed = dates.isna() & values.notna()
+    if failed.any():
+        # 변환 실패 시 기본값 설정 (연월 1일)
+        dates[failed] = pd.to_datetime(years[failed] + "-" + months[failed] + "-01", errors="coerce")
+    return dates
+
+
+def build_bid_frame(entries, user_inputs):
+    """
+    Firebase 입찰 노드 목록을 앱에서 사용하는 데이터 프레임으로 변환하는 함수
+
+    행 단위로 dict를 복사하지 않고 컬럼별 리스트로 모은 뒤 한 번에 변환한다.
+
+    Args:
+        entries (list): (연도 키, 월 키, bid_id, /bids/{year}/{month}/{bid_id} 데이터) 목록
+        user_inputs (dict): /user_inputs 데이터 (bid_id 기준)
+
+    Returns:
+        pandas.DataFrame: 입찰 목록 순서대로 만든 원본 데이터 프레임
+    """
+    if not entries:
+        return pd.DataFrame()
+
+    years, months, bid_ids, infos = (list(values) for values in zip(*entries))
+
+    # 전체 노드에 등장하는 컬럼을 처음 등장한 순서대로 수집
+    source_columns = list(dict.fromkeys(key for info in infos for key in info))
+
+    # Firebase 컬럼명을 앱 내부 컬럼명으로 한 번에 매핑 (앱 컬럼명 -> 원본 컬럼명)
+    output_columns = {col: col for col in source_columns if col not in FIREBASE_TO_APP_COLUMNS}
+    for firebase_col, app_col in FIREBASE_TO_APP_COLUMNS.items():
+        if firebase_col in source_columns:
+            output_columns.pop(app_col, None)
+            output_columns[app_col] = firebase_col
+
+    missing = float("nan")
+    columns = {
+        app_col: [info.get(source_col, missing) for info in infos]
+        for app_col, source_col in output_columns.items()
+    }
+
+    # 사용자 입력 데이터를 bid_id 기준으로 결합 (입력이 있는 입찰은 없는 값을 0으로)
+    bid_index = pd.Index(bid_ids)
+    has_input = bid_index.isin(list(user_inputs.keys())) if user_inputs else None
+    if has_input is not None and has_input.any():
+        user_frame = pd.DataFrame.from_dict(
+            {bid_id: data or {} for bid_id, data in user_inputs.items()}, orient="index"
+        ).reindex(index=bid_index, columns=USER_INPUT_COLUMNS)
+        for col in USER_INPUT_COLUMNS:
+            user_values = user_frame[col].astype(object).where(user_frame[col].notna(), 0).to_numpy()
+            base_values = np.empty(len(bid_ids), dtype=object)
+            base_values[:] = columns.get(col, missing)
+            columns[col] = np.where(has_input, user_values, base_values)
+
+    df = pd.DataFrame({col: _infer_column(values) for col, values in columns.items()})
+
+    # 연도 및 월 정보 추가 (숫자 형태로)
+    year_keys = pd.Series(years, dtype=object).astype(str)
+    month_keys = pd.Series(months, dtype=object).astype(str)
+    df['예상_연도'] = year_keys.astype(int)
+    df['예상_입찰월'] = month_keys.astype(int)
+
+    # 입찰일시 전체를 한 번에 datetime으로 변환
+    if '입찰일시' in df.columns:
+        df['예상_입찰일'] = parse_bid_dates(df['입찰일시'], year_keys, month_keys)
+
+    # 예상_년월 추가
+    df['예상_년월'] = year_keys + "-" + month_keys
+
+    # bid_id 추가 (나중에 업데이트할 때 필요)
+    df['bid_id'] = bid_ids
+
+    return df
+
+
+def apply_user_input_overlay(df, edits):
+    """
+    데이터 프레임 복사본에 사용자 입력 수정을 직접 반영 (원본 df는 수정하지 않음)
+
+    정수 컬럼에 소수 값을 넣을 수 있도록 컬럼 단위로 새로 만든 뒤 스키마를 다시 적용한다.
+
+    Args:
+        df (pandas.DataFrame): 현재 통합 데이터 프레임
+        edits (dict): {bid_id: {앱 컬럼명: 값}}
+
+    Returns:
+        pandas.DataFrame: 수정을 반영한 데이터 프레임
+    """
+    df = df.copy()
+    values_by_field = {}
+    for bid_id, fields in edits.items():
+        for field, value in fields.items():
+            values_by_field.setdefault(field, {})[bid_id] = float(value)
+
+    bid_ids = df['bid_id'].astype(str)
+    for field, values in values_by_field.items():
+        updated = bid_ids.map(values)
+        if field in df.columns:
+            df[field] = df[field].where(updated.isna(), updated)
+        else:
+            df[field] = updated
+    return apply_bid_schema(df)
+
+
+def merge_pending_years(df, previous_df, loaded_years):
+    """
+    연도별로 받는 중인 저장소 데이터에 아직 받지 않은 연도의 이전 스냅샷 행을 합침
+
+    로컬 스냅샷으로 시작한 뒤 일부 연도만 받은 상태로 게시해도 나머지 연도가
+    화면에서 사라지지 않도록 한다 (모든 연도를 받으면 저장소 데이터만 게시).
+
+    Args:
+        df (pandas.DataFrame): 저장소의 원본 데이터 프레임
+        previous_df (pandas.DataFrame): 현재 게시된 스냅샷의 데이터 프레임
+        loaded_years (set): 전체 데이터를 받은 연도 키
+
+    Returns:
+        pandas.DataFrame: 합친 데이터 프레임 (스키마 적용)
+    """
+    if previous_df.empty or "예상_연도" not in previous_df.columns:
+        return df
+    loaded = [int(year) for year in loaded_years if str(year).isdigit()]
+    pending = previous_df[~previous_df["예상_연도"].isin(loaded)]
+    if pending.empty:
+        return df
+    # 저장소 행과 이전 행을 합치면 다음 입찰일이 달라질 수 있으므로 게시할 때 다시 계산
+    pending = pending.drop(columns=SUCCESSOR_COLUMN, errors="ignore")
+    frames = [frame for frame in (df, pending) if not frame.empty]
+    return apply_bid_schema(pd.concat(frames, ignore_index=True))
+
+
+def _set_path(tree, segments, value):
+    """중첩 dict의 segments 위치에 값을 설정 (None이면 삭제)"""
+    if not segments:
+        return value if isinstance(value, dict) else {}
+
+    node = tree
+    for segment in segments[:-1]:
+        child = node.get(segment)
+        if not isinstance(child, dict):
+            if value is None:
+                return tree
+            child = {}
+            node[segment] = child
+        node = child
+
+    if value is None:
+        node.pop(segments[-1], None)
+    else:
+        node[segments[-1]] = value
+    return tree
+
+
+def _get_path(tree, segments):
+    node = tree
+    for segment in segments:
+        if not isinstance(node, dict):
+            return None
+        node = node.get(segment)
+    return node
+
+
+def _iter_bid_locations(node, prefix):
+    """/bids 트리의 일부(prefix 위치의 node)에서 (연도, 월, bid_id) 목록을 추출"""
+    if len(prefix) >= 3:
+        yield prefix[0], prefix[1], prefix[2]
+        return
+    if not isinstance(node, dict):
+        return
+    for key, child in node.items():
+        yield from _iter_bid_locations(child, prefix + [key])
+
+
+class BidStore:
+    """
+    /bids, /user_inputs 데이터를 메모리에 보관하고 변경분만 반영하는 저장소
+
+    리스너 이벤트(event.path, event.data)를 받아 원본 트리를 갱신한 뒤,
+    영향을 받은 bid_id의 원본 행만 다시 생성한다.
+    예측 데이터는 스냅샷에서 연도별로 필요할 때 생성한다 (DataSnapshot.year).
+    """
+
+    def __init__(self):
+        self.bids_tree = {}
+        self.user_inputs = {}
+        self.bid_locations = {}  # bid_id -> (연도, 월)
+        self.base_df = pd.DataFrame()
+        # 두 트리 모두 전체 데이터를 한 번 이상 받은 뒤에만 게시할 수 있는 상태
+        self.bids_loaded = False
+        self.user_inputs_loaded = False
+        # 연도별로 나눠 받을 때: /bids의 연도 키 목록과 전체 데이터를 받은 연도
+        self.year_keys = None
+        self.loaded_years = set()
+        self._lock = threading.RLock()
+        self._loaded_changed = threading.Condition(self._lock)
+
+    @property
+    def loaded(self):
+        """/bids와 /user_inputs 전체 데이터가 모두 반영되었는지 여부"""
+        return self.bids_loaded and self.user_inputs_loaded
+
+    @property
+    def publishable(self):
+        """/user_inputs 전체와 /bids의 일부 연도 이상이 반영되어 게시할 수 있는지 여부"""
+        return self.user_inputs_loaded and (self.bids_loaded or bool(self.loaded_years))
+
+    def wait_user_inputs(self, timeout=None):
+        """/user_inputs 전체 데이터가 반영될 때까지 대기 (반영되면 True)"""
+        with self._loaded_changed:
+            return self._loaded_changed.wait_for(lambda: self.user_inputs_loaded, timeout)
+
+    def wait_years(self, years, timeout=None):
+        """지정한 연도 키의 전체 데이터가 모두 반영될 때까지 대기 (반영되면 True)"""
+        years = set(years)
+        with self._loaded_changed:
+            return self._loaded_changed.wait_for(lambda: years <= self.loaded_years, timeout)
+
+    def set_year_keys(self, year_keys):
+        """얕은 조회로 받은 /bids 연도 키 목록 등록 (모든 연도를 받으면 bids_loaded)"""
+        with self._lock:
+            self.year_keys = set(year_keys)
+            self._update_years_loaded()
+            self._loaded_changed.notify_all()
+
+    def reset(self, bids_data, user_inputs):
+        """전체 데이터로 저장소를 초기화하고 모든 원본 행을 다시 생성"""
+        with self._lock:
+            self.bids_tree = bids_data or {}
+            self.user_inputs = user_inputs or {}
+            self.bid_locations = {
+                bid_id: (year, month)
+                for year, month, bid_id in _iter_bid_locations(self.bids_tree, [])
+            }
+            self.base_df = pd.DataFrame()
+            self.bids_loaded = True
+            self.user_inputs_loaded = True
+            self.year_keys = set(self.bids_tree)
+            self.loaded_years = set(self.bids_tree)
+            self._rebuild(list(self.bid_locations))
+            self._loaded_changed.notify_all()
+            return self.to_dataframe()
+
+    def apply_bids_event(self, event_type, path, data):
+        """/bids 리스너 이벤트를 반영하고 변경된 bid_id 집합을 반환"""
+        with self._lock:
+            affected = set()
+            for segments, value in self._expand_event(event_type, path, data):
+                affected |= self._apply_bids_put(segments, value)
+                if not segments:
+                    self.bids_loaded = True
+                    self.year_keys = set(self.bids_tree)
+                    self.loaded_years = set(self.bids_tree)
+            self._rebuild(affected)
+            self._loaded_changed.notify_all()
+            return affected
+
+    def apply_year_event(self, year, event_type, path, data):
+        """
+        /bids/{year} 리스너 이벤트를 반영하고 변경된 bid_id 집합을 반환
+
+        연도 노드 전체를 받는 put 이벤트(리스너 초기 이벤트 또는 직접 조회)를 받으면
+        그 연도는 반영된 것으로 표시한다.
+        """
+        with self._lock:
+            affected = self.apply_bids_event(event_type, f"/{year}{path or ''}", data)
+            if event_type == "put" and not split_event_path(path):
+                self.loaded_years.add(year)
+                self._update_years_loaded()
+                self._loaded_changed.notify_all()
+            return affected
+
+    def apply_user_inputs_event(self, event_type, path, data):
+        """/user_inputs 리스너 이벤트를 반영하고 변경된 bid_id 집합을 반환"""
+        with self._lock:
+            affected = set()
+            for segments, value in self._expand_event(event_type, path, data):
+                if segments:
+                    affected.add(segments[0])
+                else:
+                    affected |= set(self.user_inputs) | set((value or {}).keys())
+                    self.user_inputs_loaded = True
+                self.user_inputs = _set_path(self.user_inputs, segments, value)
+            self._rebuild(affected)
+            self._loaded_changed.notify_all()
+            return affected
+
+    def to_dataframe(self, previous_df=None):
+        """
+        원본 데이터 프레임 반환 (스키마 적용)
+
+        Args:
+            previous_df (pandas.DataFrame): 현재 게시된 데이터 (주면 연도별로 받는 중에
+                아직 받지 않은 연도의 행을 유지)
+        """
+        with self._lock:
+            base_df = self.base_df
+            pending = None if self.bids_loaded else set(self.loaded_years)
+        df = pd.DataFrame() if base_df.empty else apply_bid_schema(base_df)
+        if previous_df is not None and pending is not None:
+            df = merge_pending_years(df, previous_df, pending)
+        return df
+
+    def _update_years_loaded(self):
+        if self.year_keys is not None and self.year_keys <= self.loaded_years:
+            self.bids_loaded = True
+
+    @staticmethod
+    def _expand_event(event_type, path, data):
+        """put/patch 이벤트를 (경로, 값) put 목록으로 변환"""
+        segments = split_event_path(path)
+        if event_type == "patch" and isinstance(data, dict):
+            return [(segments + split_event_path(key), value) for key, value in data.items()]
+        return [(segments, data)]
+
+    def _apply_bids_put(self, segments, value):
+        # 변경 전후로 해당 경로 아래에 있는 bid_id 모두 영향 받음
+        old_node = _get_path(self.bids_tree, segments)
+        if len(segments) >= 3:
+            touched = {tuple(segments[:3])}
+        else:
+            # 트리 순서를 유지 (bid_locations 순서가 곧 행 순서)
+            touched = dict.fromkeys(_iter_bid_locations(old_node, list(segments)))
+            touched.update(dict.fromkeys(_iter_bid_locations(value, list(segments))))
+
+        self.bids_tree = _set_path(self.bids_tree, segments, value)
+
+        affected = set()
+        for year, month, bid_id in touched:
+            if isinstance(_get_path(self.bids_tree, [year, month, bid_id]), dict):
+                self.bid_locations[bid_id] = (year, month)
+            elif self.bid_locations.get(bid_id) == (year, month):
+                del self.bid_locations[bid_id]
+            affected.add(bid_id)
+        return affected
+
+    def _rebuild(self, affected):
+        """영향 받은 bid_id의 원본 행만 다시 생성"""
+        if not affected:
+            return
+
+        # 이벤트 순서와 관계없이 항상 트리 순서(bid_locations 순서)로 행 생성
+        affected = set(affected)
+        entries = [
+            (year, month, bid_id, _get_path(self.bids_tree, [year, month, bid_id]))
+            for bid_id, (year, month) in self.bid_locations.items()
+            if bid_id in affected
+        ]
+        new_base_df = build_bid_frame(entries, self.user_inputs)
+        self.base_df = self._replace_bids(self.base_df, new_base_df, affected)
+
+    @staticmethod
+    def _replace_bids(frame, new_rows, affected):
+        if not frame.empty:
+            frame = frame[~frame["bid_id"].isin(affected)]
+        frames = [f for f in (frame, new_rows) if not f.empty]
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=True)
+
+
+# 연도별 예측 데이터를 만들 최대 연도 수 (현재 연도 기준, 생성은 연도를 조회할 때만이므로
+# 조회하지 않는 먼 연도는 비용이 없음)
+DEFAULT_PREDICTION_YEARS = 30
+
+# 연도별 데이터(원본 + 예측)를 보관할 최대 개수 ((데이터 버전, 연도) 단위)
+YEAR_CACHE_SIZE = 12
+
+
+class YearView:
+    """
+    한 연도의 통합 데이터 프레임(원본 + 예측)과 그 색인/표시용 컬럼
+
+    DataSnapshot.year(year)로 처음 조회할 때 만들어지고 (데이터 버전, 연도) 단위로 캐시된다.
+    """
+
+    __slots__ = ("year", "df", "index", "display", "upcoming")
+
+    def __init__(self, year, df):
+        self.year = year
+        self.df = df
+        self.index = BidIndex(df)
+        self.display = build_display_frame(df)
+        self.upcoming = UpcomingBidsIndex(df, self.display)
+
+
+class DataSnapshot:
+    """
+    특정 시점의 원본 데이터 프레임과 버전 번호, 그리고 그 버전의 색인
+
+    예측 데이터는 미리 만들지 않고 연도별로 조회할 때 생성하며, 이미 실제 입찰로
+    채워진 예측은 게시할 때 계산한 다음 입찰일 컬럼(SUCCESSOR_COLUMN)으로 제외한다.
+    게시된 이후에는 수정하지 않는다. 변경이 필요하면 새 데이터 프레임으로
+    새 스냅샷을 만들어 SnapshotHolder.publish로 교체한다.
+    """
+
+    __slots__ = ("df", "version", "created_at", "index", "max_prediction_year", "_year_cache")
+
+    def __init__(self, df, version, max_prediction_year=None, year_cache=None):
+        self.df = df
+        self.version = version
+        self.index = BidIndex(df)
+        if max_prediction_year is None:
+            max_prediction_year = datetime.today().year + DEFAULT_PREDICTION_YEARS
+        self.max_prediction_year = max_prediction_year
+        self._year_cache = year_cache if year_cache is not None else LRUCache(YEAR_CACHE_SIZE)
+        self.created_at = datetime.now()
+
+    @property
+    def last_year(self):
+        """데이터가 있을 수 있는 마지막 연도 (원본 최대 연도와 예측 최대 연도 중 큰 값)"""
+        return max(self.index.max_original_year, self.max_prediction_year)
+
+    @property
+    def successor_dates(self):
+        """
+        원본 행별 같은 기관의 비슷한 공고의 다음 실제 입찰일 (SnapshotHolder가 게시할 때 계산한 컬럼)
+
+        연도별 예측을 만들 때 이미 실제 입찰로 채워진 예측을 숨기는 데 사용한다.
+        """
+        return successor_dates_of(self.df)
+
+    def year(self, year):
+        """
+        해당 연도의 원본 행과 예측 행을 합친 YearView 반환 ((버전, 연도) 단위로 캐시)
+
+        Args:
+            year (int): 예상_연도
+
+        Returns:
+            YearView: 해당 연도 데이터 (행 순서: 원본 행, 예측 행(원본 행 순서, 차수 순))
+        """
+        return self._year_cache.get_or_build((self.version, year), lambda: self._build_year(year))
+
+    def _build_year(self, year):
+        # 이전 형식의 데이터에 예측 행이 남아 있어도 원본 행만 사용
+        frames = [self.index.rows(year, prediction=False)]
+        if year <= self.max_prediction_year:
+            frames.append(predictions_for_year(self.df, year, self.successor_dates))
+        frames = [frame for frame in frames if not frame.empty]
+        if not frames:
+            return YearView(year, pd.DataFrame())
+        return YearView(year, apply_bid_schema(pd.concat(frames, ignore_index=True)))
+
+    def upcoming_months_from(self, start_month, limit=None):
+        """
+        start_month('YYYY-MM') 이후 공고가 있는 년월 목록 (마지막 연도까지 연도별로 조회)
+
+        Args:
+            start_month (str): 시작 년월 ('YYYY-MM')
+            limit (int): 필요한 년월 수 (모이면 이후 연도는 만들지 않고 limit개만 반환)
+
+        Returns:
+            list: 'YYYY-MM' 목록
+        """
+        months = []
+        for year in range(int(start_month[:4]), self.last_year + 1):
+            months.extend(self.year(year).upcoming.months_from(start_month))
+            if limit is not None and len(months) >= limit:
+                return months[:limit]
+        return months
+
+
+class SnapshotHolder:
+    """
+    모든 콜백이 공유하는 현재 데이터 스냅샷 보관소
+
+    읽기(current)는 참조 하나를 읽기만 하므로 잠금 없이 동작하고,
+    새 스냅샷은 요청 경로 밖에서 완성된 뒤 참조 교체 한 번으로 게시된다.
+    연도별 데이터 캐시는 모든 버전이 공유하므로 이전 버전의 연도 데이터는 자연스럽게 밀려난다.
+    """
+
+    def __init__(self, df=None, prediction_years=DEFAULT_PREDICTION_YEARS, year_cache_size=YEAR_CACHE_SIZE):
+        """
+        Args:
+            df (pandas.DataFrame): 초기 원본 데이터 (없으면 빈 데이터)
+            prediction_years (int): 현재 연도부터 예측을 생성할 연도 수
+            year_cache_size (int): 캐시할 (버전, 연도) 데이터 수
+        """
+        self.prediction_years = prediction_years
+        self.year_cache = LRUCache(year_cache_size)
+        df = df if df is not None else pd.DataFrame()
+        self._snapshot = self._new_snapshot(with_successor_dates(df), 0)
+        self._write_lock = threading.RLock()
+        self._subscribers = []
+        self._year_loader = None
+
+    def _new_snapshot(self, df, version):
+        max_prediction_year = datetime.today().year + self.prediction_years
+        return DataSnapshot(df, version, max_prediction_year, self.year_cache)
+
+    def current(self):
+        """현재 스냅샷 반환"""
+        return self._snapshot
+
+    @property
+    def version(self):
+        return self._snapshot.version
+
+    def subscribe(self, callback):
+        """
+        새 스냅샷이 게시될 때마다 callback(snapshot)을 호출하도록 등록
+
+        callback은 게시 잠금 안에서 호출되므로 오래 걸리는 작업은 별도 스레드로 넘긴다.
+        """
+        self._subscribers.append(callback)
+
+    def set_year_loader(self, loader):
+        """
+        연도별로 나눠 받는 로더 등록
+
+        ensure_year(year)가 loader(year)를 호출해서 아직 받지 않은 연도를 먼저 받게 한다.
+        """
+        self._year_loader = loader
+
+    def ensure_year(self, year):
+        """조회할 연도의 원본 데이터를 아직 받지 않았으면 로더에 요청하고 게시될 때까지 대기"""
+        if self._year_loader is not None:
+            self._year_loader(year)
+
+    def publish(self, df):
+        """
+        완성된 데이터 프레임을 다음 버전의 스냅샷으로 게시
+
+        다음 실제 입찰일 컬럼(SUCCESSOR_COLUMN)이 없으면 여기서 한 번 계산해서 추가한다
+        (사용자 입력만 바뀌었으면 현재 스냅샷의 값을 그대로 사용). 컬럼은 로컬 Parquet
+        스냅샷과 공유 Arrow 파일에도 저장되므로 작업자와 다시 시작한 서버는 계산하지 않는다.
+        """
+        with self._write_lock:
+            if SUCCESSOR_COLUMN not in df.columns:
+                df = with_successor_dates(df, self._snapshot.df)
+            snapshot = self._new_snapshot(df, self._snapshot.version + 1)
+            self._snapshot = snapshot
+            for callback in self._subscribers:
+                try:
+                    callback(snapshot)
+                except Exception as e:
+                    print(f"스냅샷 게시 후 처리 오류: {e}")
+            return snapshot
+
+    def update(self, build):
+        """
+        build()로 새 데이터 프레임을 만들어 게시
+
+        쓰기 작업끼리는 순서대로 실행되므로 늦게 시작한 변경이 먼저 게시된
+        결과를 덮어쓰지 않는다. 읽기는 이 잠금을 기다리지 않는다.
+        """
+        with self._write_lock:
+            return self.publish(build())
@@ -0,0 +1,148 @@
+import numpy as np
+import pandas as pd
+from preprocess import add_months
+from bid_schema import prediction_mask
+
+# 예측 공고명의 차수 표시 (예: "공고명 (3차 예측)")
+PREDICTION_LABEL_PATTERN = r'(\d+차 예측)'
+PREDICTION_SUFFIX_PATTERN = r' \(\d+차 예측\)| \(예측\)'
+
+
+# 세 자리 숫자 문자열 표: 0~999는 앞자리 없이, 1000~1999는 0으로 채운 세 자리 ("007")
+_DIGIT_GROUPS = pd.array([str(i) for i in range(1000)] + [f"{i:03d}" for i in range(1000)], dtype="str")
+
+
+def group_thousands(numbers):
+    """
+    정수 배열을 천 단위 쉼표 문자열로 변환
+
+    세 자리씩 나눈 값을 문자열 표에서 꺼내 열 단위 문자열 연산으로 합친다
+    (행마다 Python 포맷팅을 하지 않음).
+
+    Args:
+        numbers (numpy.ndarray): int64 배열
+
+    Returns:
+        pandas.Series: "1,234,567" 형식 문자열
+    """
+    rest = np.abs(numbers)
+    text = None
+    while text is None or (rest > 0).any():
+        # 앞에 자리가 더 있는 세 자리는 0으로 채운 문자열 사용
+        higher = rest // 1000
+        group = pd.Series(_DIGIT_GROUPS.take(rest % 1000 + 1000 * (higher > 0)))
+        text = group if text is None else text.where(rest == 0, group + "," + text)
+        rest = higher
+    return text.where(~(numbers < 0), "-" + text)
+
+
+def format_amounts(series, suffix=""):
+    """
+    숫자 컬럼 전체를 천 단위 쉼표 문자열로 변환 (0/빈 값은 '-')
+
+    쉼표가 포함된 문자열도 숫자로 해석하고, 숫자로 해석할 수 없는 값은 그대로 표시한다.
+
+    Args:
+        series (pandas.Series): 금액/인원 등 숫자 컬럼
+        suffix (str): 숫자 뒤에 붙일 단위 (예: "원", "명")
+
+    Returns:
+        pandas.Series: 표시용 문자열
+    """
+    unit = f" {suffix}" if suffix else ""
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        numbers = series.astype("float64")
+        blank = numbers.isna() | (numbers == 0)
+        formatted = pd.Series("-", index=series.index, dtype="str")
+    else:
+        # 이전 형식 데이터: 쉼표가 포함된 문자열 (문자열은 0과 같지 않으므로 "0"은 그대로 표시)
+        values = series.astype(object)
+        blank = values.isna() | (values == 0) | (values == "")
+        text = values.astype(str)
+        numbers = pd.to_numeric(text.str.replace(",", "", regex=False), errors="coerce")
+        # 변환 실패 시 원본 값 그대로 표시
+        formatted = (text + unit).str.strip()
+
+    valid = (numbers.notna() & ~blank).to_numpy()
+    grouped = group_thousands(numbers.to_numpy()[valid].astype(np.int64))
+    formatted[valid] = (grouped + unit).to_numpy()
+    formatted[blank.to_numpy()] = "-"
+    return formatted
+
+
+def format_dates(series, date_format, empty="-"):
+    """날짜 컬럼 전체를 문자열로 변환 (NaT는 empty)"""
+    return pd.to_datetime(series, errors="coerce").dt.strftime(date_format).fillna(empty)
+
+
+def _column(df, name):
+    """컬럼이 없으면 NaN으로 채운 Series 반환"""
+    if name in df.columns:
+        return df[name]
+    return pd.Series(float("nan"), index=df.index, dtype=object)
+
+
+def build_display_frame(df):
+    """
+    통합 데이터 프레임의 모든 행에 대해 화면 표시용 컬럼을 한 번에 생성
+
+    콜백에서 행마다 반복하던 숫자/날짜 포맷팅과 공고명 정리를 데이터 버전마다
+    한 번만 수행한다. 결과는 df와 같은 인덱스를 가지므로 df.loc[행 인덱스]와
+    같은 방식으로 필요한 컬럼만 골라 쓸 수 있다.
+
+    Args:
+        df (pandas.DataFrame): 통합 데이터 프레임 (원본 + 예측)
+
+    Returns:
+        pandas.DataFrame: 표시용 컬럼 (표시_*)
+    """
+    display = pd.DataFrame(index=df.index)
+    if df.empty:
+        return display
+
+    names = df["공고명"].astype(str)
+    is_prediction = pd.Series(prediction_mask(df), index=df.index)
+    duration = _column(df, "용역기간(개월)")
+    numeric_duration = pd.to_numeric(duration, errors="coerce")
+    has_duration = numeric_duration.notna() & (numeric_duration > 0)
+    bid_dates = pd.to_datetime(_column(df, "예상_입찰일"), errors="coerce")
+
+    # 공고명: 예측 차수 표시를 분리
+    labels = names.str.extract(PREDICTION_LABEL_PATTERN, expand=False)
+    display["표시_공고명"] = names.str.replace(PREDICTION_SUFFIX_PATTERN, "", regex=True).where(is_prediction, names)
+    display["표시_예측_차수"] = (" (" + labels + ")").fillna(" (예측)").where(is_prediction, "")
+
+    # 날짜: YYYY-MM-DD / YYYY-MM
+    display["표시_입찰일"] = format_dates(bid_dates, "%Y-%m-%d")
+    display["표시_년월"] = format_dates(bid_dates, "%Y-%m", empty="")
+
+    # 예측 공고: 원본 입찰일 (없으면 예측일에서 용역기간을 빼서 계산)
+    if "원본_입찰일" in df.columns:
+        original_dates = pd.to_datetime(df["원본_입찰일"], errors="coerce")
+    else:
+        months_back = -numeric_duration.where(has_duration & is_prediction).fillna(0).astype(int)
+        original_dates = add_months(bid_dates, months_back.where(has_duration & is_prediction))
+    display["표시_원본_입찰일"] = format_dates(original_dates, "%Y-%m-%d", empty="")
+    display["표시_원본_년월"] = format_dates(original_dates, "%Y-%m")
+
+    # (예측)입찰게시: 원본 공고는 입찰일, 예측 공고는 원본 입찰일 기준으로
+    # 용역기간-1개월(최소 1개월) 뒤 날짜 (용역기간이 없으면 예측 공고는 예측일 그대로)
+    adjusted_period = (numeric_duration.where(has_duration).fillna(0).astype(int) - 1).clip(lower=1)
+    base_dates = bid_dates.where(~is_prediction, original_dates)
+    next_dates = add_months(base_dates, adjusted_period.where(has_duration & bid_dates.notna()))
+    next_dates = next_dates.where(~is_prediction | (has_duration & bid_dates.notna()), bid_dates)
+    display["표시_예측_입찰일"] = format_dates(next_dates, "%Y-%m-%d")
+
+    # 숫자: 천 단위 쉼표
+    display["표시_물동량"] = format_amounts(_column(df, "물동량 평균"), "명")
+    display["표시_계약금액"] = format_amounts(_column(df, "계약 기간 내"), "원")
+    display["표시_입찰금액"] = format_amounts(_column(df, "입찰금액_1순위"), "원")
+    display["표시_용역기간"] = (duration.astype(str) + " 개월").where(duration != 0, "-")
+
+    # 빈 값/예측 값은 '-'로 표시
+    organizations = _column(df, "실수요기관").astype(object)
+    display["표시_실수요기관"] = organizations.where(organizations.notna() & (organizations != ""), "-").astype(str)
+    winners = _column(df, "입찰결과_1순위").astype(object)
+    display["표시_입찰업체"] = winners.where(winners.notna() & (winners != "") & (winners != "예측"), "-").astype(str)
+
+    return display
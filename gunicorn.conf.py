@@ -0,0 +1,50 @@
+# gunicorn 설정 (gunicorn app:server 실행 시 현재 디렉터리의 이 파일을 자동으로 읽음)
+#
+# 작업자가 2개 이상이면 Firebase 리스너와 데이터 로드는 로더 프로세스(data_loader.py) 하나만
+# 담당하고, 작업자는 로더가 게시한 공유 스냅샷 파일을 메모리 매핑해서 사용한다.
+# 작업자가 1개이거나 SHARED_SNAPSHOT=0이면 기존처럼 작업자가 직접 로드한다.
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+_loader = None
+
+
+def _shared_enabled(server):
+    if os.environ.get("SHARED_SNAPSHOT", "1") == "0":
+        return False
+    # preload_app이면 마스터에서 이미 app을 import 했으므로 사용할 수 없음
+    return server.cfg.workers > 1 and not server.cfg.preload_app
+
+
+def _start_loader(server):
+    global _loader
+    _loader = subprocess.Popen([sys.executable, os.path.join(ROOT, "data_loader.py")], cwd=ROOT)
+    server.log.info("데이터 로더 프로세스 시작 (pid %s)", _loader.pid)
+
+
+def on_starting(server):
+    if not _shared_enabled(server):
+        return
+    # 작업자는 마스터의 환경 변수를 물려받아 공유 스냅샷 모드로 실행됨
+    os.environ.setdefault("SHARED_SNAPSHOT_DIR", os.path.join(ROOT, "shared_snapshot"))
+    _start_loader(server)
+
+
+def pre_fork(server, worker):
+    # 작업자를 새로 띄울 때 로더가 종료되어 있으면 다시 시작
+    if _loader is not None and _loader.poll() is not None:
+        server.log.warning("데이터 로더 프로세스가 종료되어 다시 시작합니다 (종료 코드 %s)", _loader.returncode)
+        _start_loader(server)
+
+
+def on_exit(server):
+    if _loader is None or _loader.poll() is not None:
+        return
+    _loader.terminate()
+    try:
+        _loader.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        _loader.kill()
@@ -107,7 +107,9 @@ def create_layout(initial_state):
         dcc.Store(id="current-page", data=0),
         dcc.Store(id="selected-month", data=None),
         dcc.Store(id="selected-bid", data=None),
+        dcc.Store(id="bid-click", data=None),
         dcc.Store(id="current-month-view", data=initial_state["month_page"]),
+        dcc.Store(id="navigation-summary", data=initial_state.get("navigation_summary")),
         
         html.Div(id="scroll-target-display", style={"display": "none"}),
         html.Div(id="scroll-trigger-result", style={"display": "none"}),
@@ -2,10 +2,17 @@ import pandas as pd
 import firebase_admin
 from firebase_admin import credentials
 from firebase_admin import db
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import argparse
+import copy
+import hashlib
+import json
 import sys
-import re
+import threading
+import time
 import os
+import re
 
 def clean_firebase_key(key):
     """
@@ -51,129 +58,617 @@ CREDENTIAL_FILE = 'g2b-db-6aae9-firebase-adminsdk-fbsvc-0e3b1ce560.json'
 CSV_FILE = 'DB/2324List.csv'
 DATABASE_URL = 'https://g2b-db-6aae9-default-rtdb.asia-southeast1.firebasedatabase.app/'
 
-# 파일 존재 확인
-if not os.path.exists(CREDENTIAL_FILE):
-    print(f"오류: 인증 파일 '{CREDENTIAL_FILE}'을 찾을 수 없습니다.")
-    sys.exit(1)
-
-if not os.path.exists(CSV_FILE):
-    print(f"오류: CSV 파일 '{CSV_FILE}'을 찾을 수 없습니다.")
-    sys.exit(1)
-
-try:
-    # Firebase 초기화
-    cred = credentials.Certificate(CREDENTIAL_FILE)
-    firebase_admin.initialize_app(cred, {
-        'databaseURL': DATABASE_URL
-    })
-    print("Firebase 초기화 성공")
-    
-    # CSV 파일 로드
-    print(f"'{CSV_FILE}' 파일 로드 중...")
-    df = pd.read_csv(CSV_FILE)
-    print(f"총 {len(df)} 개의 레코드 로드 완료")
-    
-    # 입찰일시 컬럼에서 연도와 월 추출
-    try:
-        df['입찰일시'] = pd.to_datetime(df['입찰일시'])
-        df['연도'] = df['입찰일시'].dt.year
-        df['월'] = df['입찰일시'].dt.month
-        print("날짜 데이터 처리 완료")
-    except Exception as e:
-        print(f"날짜 처리 중 오류 발생: {e}")
-        print("오류가 발생했지만 계속 진행합니다...")
-    
-    # NaN 값 처리
-    df = df.fillna('')
-    
-    # 기본 데이터와 사용자 입력 데이터 분리
-    bids_data = {}
-    user_inputs = {}
-    
-    # 진행 상황 표시
-    total_rows = len(df)
-    print("데이터 처리 중...")
-    
-    for index, row in df.iterrows():
-        if index % 50 == 0:
-            print(f"진행 중: {index}/{total_rows} 레코드 처리 완료 ({index/total_rows*100:.1f}%)")
-        
-        # 데이터 정리
-        bid_data = row.to_dict()
-        
-        # Firebase 키 생성 시 안전한 값 사용
-        year = clean_firebase_key(str(row['연도']))
-        month = clean_firebase_key(str(row['월']).zfill(2))
-        
-        # 고유 ID 생성 (UUID 또는 공고명 기반)
-        # 공고명에 특수문자가 있을 수 있으므로 안전하게 처리
-        safe_name = ''.join(c if c.isalnum() else '_' for c in str(row['공고명']))
-        safe_name = clean_firebase_key(safe_name)
-        bid_id = f"bid_{index}_{safe_name[:20]}"
-        
-        # 기본 API 데이터는 bids에 저장
-        if year not in bids_data:
-            bids_data[year] = {}
-        
-        if month not in bids_data[year]:
-            bids_data[year][month] = {}
-        
-        # 기본 정보만 포함 (사용자 입력 데이터 제외)
-        base_data = {}
-        for k, v in bid_data.items():
-            if k not in ['물동량 평균', '용역기간(개월)', '연도', '월']:
-                # datetime 객체는 JSON으로 직렬화할 수 없으므로 문자열로 변환
-                if isinstance(v, pd.Timestamp):
-                    base_data[k] = v.strftime('%Y-%m-%d %H:%M:%S')
-                else:
-                    # Firebase는 . 이 포함된 키를 허용하지 않으므로 변환
-                    safe_key = clean_firebase_key(k)
-                    base_data[safe_key] = v
-        
-        bids_data[year][month][bid_id] = base_data
-        
-        # 사용자 입력 데이터는 별도 노드에 저장
-        user_inputs[bid_id] = {
-            '물동량 평균': safe_float_convert(row['물동량 평균']),
-            '용역기간(개월)': safe_float_convert(row['용역기간(개월)']),
-            '마지막_수정일': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            '수정자': 'initial_import'
+# 중단된 업로드를 이어서 진행하기 위한 진행 상황 파일
+CHECKPOINT_FILE = 'migrate_checkpoint.json'
+
+# 마지막으로 업로드한 입찰별 내용 해시 (증분 동기화에서 원격 데이터 대신 비교)
+MANIFEST_FILE = 'migrate_manifest.json'
+MANIFEST_FORMAT = 1
+
+# 내용 기반 입찰 ID 형식 (bid_ + 해시 16자리, 같은 기관/공고명/입찰일시가 반복되면 _번호)
+STABLE_ID_PATTERN = re.compile(r"^bid_[0-9a-f]{16}(_\d+)?$")
+
+# 이전 ID 형식 (bid_{CSV 행 번호}_{공고명 앞 20자})
+LEGACY_ID_PATTERN = re.compile(r"^bid_(\d+)_")
+
+# CSV를 한 번에 읽는 행 수, 한 번의 update()에 담는 입찰 수, 동시에 전송하는 작업 수
+CHUNK_SIZE = 5000
+BATCH_SIZE = 500
+UPLOAD_WORKERS = 4
+
+# 실패한 배치 재시도 횟수와 첫 대기 시간(초, 재시도마다 두 배)
+MAX_RETRIES = 5
+RETRY_DELAY = 1.0
+
+# bids에 저장하지 않는 컬럼 (사용자 입력 데이터와 파생 컬럼)
+USER_INPUT_COLUMNS = ['물동량 평균', '용역기간(개월)']
+DERIVED_COLUMNS = ['연도', '월']
+
+
+class InMemoryDatabase:
+    """
+    dry-run용 Firebase Realtime Database 대역 (메모리 내 JSON 트리)
+
+    db.reference와 같은 방식으로 reference(path)를 받아 get/set/update/delete를 지원하며,
+    update()의 다중 경로 키("bids/2024/01/bid_1")도 Firebase와 같이 처리한다.
+    """
+
+    def __init__(self):
+        self.tree = {}
+        self.updates = 0
+        self._lock = threading.Lock()
+
+    def reference(self, path='/'):
+        return _InMemoryReference(self, path)
+
+    @staticmethod
+    def _segments(path):
+        return [segment for segment in str(path).split('/') if segment]
+
+    def _get(self, segments):
+        node = self.tree
+        for segment in segments:
+            if not isinstance(node, dict) or segment not in node:
+                return None
+            node = node[segment]
+        return node
+
+    def _set(self, segments, value):
+        if not segments:
+            self.tree = copy.deepcopy(value) if isinstance(value, dict) else {}
+            return
+        node = self.tree
+        for segment in segments[:-1]:
+            child = node.get(segment)
+            if not isinstance(child, dict):
+                child = node[segment] = {}
+            node = child
+        if value is None:
+            node.pop(segments[-1], None)
+        else:
+            node[segments[-1]] = copy.deepcopy(value)
+
+
+class _InMemoryReference:
+    def __init__(self, database, path):
+        self._database = database
+        self._segments = InMemoryDatabase._segments(path)
+
+    def get(self):
+        with self._database._lock:
+            return copy.deepcopy(self._database._get(self._segments))
+
+    def set(self, value):
+        with self._database._lock:
+            self._database._set(self._segments, value)
+
+    def update(self, value):
+        with self._database._lock:
+            self._database.updates += 1
+            for key, child in value.items():
+                self._database._set(self._segments + InMemoryDatabase._segments(key), child)
+
+    def delete(self):
+        self.set(None)
+
+
+def stable_bid_id(organization, name, bid_datetime):
+    """
+    실수요기관, 공고명, 입찰일시로 만든 입찰 ID (CSV 행 순서가 바뀌어도 같은 값)
+
+    Args:
+        organization (str): 실수요기관
+        name (str): 공고명
+        bid_datetime (str): 입찰일시 ('%Y-%m-%d %H:%M:%S')
+
+    Returns:
+        str: bid_ + SHA-1 해시 앞 16자리
+    """
+    key = "|".join(str(value).strip() for value in (organization, name, bid_datetime))
+    return "bid_" + hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+
+def legacy_row_number(bid_id):
+    """이전 형식 ID를 CSV 행 번호 순서로 정렬하는 키 (형식이 다른 ID는 맨 뒤)"""
+    match = LEGACY_ID_PATTERN.match(bid_id)
+    if match is None:
+        return (1, 0, bid_id)
+    return (0, int(match.group(1)), bid_id)
+
+
+def _hash_value(value):
+    # Firebase에서 다시 읽으면 3.0이 3으로 돌아오므로 정수인 실수는 정수로 비교
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def content_hash(data):
+    """레코드 내용(키 순서 무관)의 SHA-1 해시"""
+    normalized = {key: _hash_value(value) for key, value in data.items()}
+    text = json.dumps(normalized, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def user_input_hash(user_data):
+    """사용자 입력 중 CSV에서 온 값(물동량 평균, 용역기간)만의 해시 (수정일/수정자 제외)"""
+    return content_hash({col: user_data.get(col) for col in USER_INPUT_COLUMNS})
+
+
+def infer_column_dtypes(csv_file, chunk_size=CHUNK_SIZE):
+    """
+    CSV 전체를 한 번에 읽었을 때와 같은 컬럼 타입을 청크 단위로 읽으면서 계산
+
+    청크마다 타입을 추론하면 같은 컬럼이 청크에 따라 숫자/문자열로 달라지므로,
+    모든 청크의 추론 결과를 합쳐 한 가지 타입으로 정한다
+    (모두 정수면 정수, 정수/실수만 섞이면 실수, 그 외에는 문자열).
+
+    Returns:
+        dict: 컬럼명 -> read_csv dtype
+    """
+    kinds = {}
+    for chunk in pd.read_csv(csv_file, chunksize=chunk_size):
+        for col, dtype in chunk.dtypes.items():
+            kinds.setdefault(col, set()).add(dtype.kind)
+    dtypes = {}
+    for col, found in kinds.items():
+        if found == {'i'}:
+            dtypes[col] = 'int64'
+        elif found <= {'i', 'f'}:
+            dtypes[col] = 'float64'
+        elif found == {'b'}:
+            dtypes[col] = 'bool'
+        else:
+            dtypes[col] = 'str'
+    return dtypes
+
+
+def iter_bid_records(csv_file, chunk_size=CHUNK_SIZE):
+    """
+    CSV를 chunk_size 행씩 읽어 (bid_id, 연도, 월, bids 데이터, user_inputs 데이터)를 차례로 반환
+
+    전체 트리를 메모리에 만들지 않고 한 청크씩만 변환한다.
+    컬럼 타입은 먼저 파일 전체를 한 번 훑어서 정한다 (infer_column_dtypes).
+    """
+    modified_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    dtypes = infer_column_dtypes(csv_file, chunk_size)
+    occurrences = {}  # 내용 기반 ID -> 지금까지 나온 횟수
+    for chunk in pd.read_csv(csv_file, chunksize=chunk_size, dtype=dtypes):
+        # 입찰일시 컬럼에서 연도와 월 추출
+        chunk['입찰일시'] = pd.to_datetime(chunk['입찰일시'])
+        years = chunk['입찰일시'].dt.year.astype(str).map(clean_firebase_key).tolist()
+        months = chunk['입찰일시'].dt.month.astype(str).str.zfill(2).map(clean_firebase_key).tolist()
+        # datetime 객체는 JSON으로 직렬화할 수 없으므로 문자열로 변환
+        chunk['입찰일시'] = chunk['입찰일시'].dt.strftime('%Y-%m-%d %H:%M:%S')
+
+        # NaN 값 처리
+        chunk = chunk.fillna('')
+        user_inputs = chunk[USER_INPUT_COLUMNS].to_dict('records')
+        base = chunk.drop(columns=USER_INPUT_COLUMNS + [col for col in DERIVED_COLUMNS if col in chunk.columns])
+        # Firebase는 . 이 포함된 키를 허용하지 않으므로 변환
+        base.columns = [clean_firebase_key(col) for col in base.columns]
+
+        for year, month, base_data, user_input in zip(years, months, base.to_dict('records'), user_inputs):
+            # 고유 ID 생성 (행 순서와 무관하게 기관/공고명/입찰일시 기반)
+            # 같은 내용이 반복되면 나온 순서대로 번호를 붙임
+            bid_id = stable_bid_id(base_data['실수요기관'], base_data['공고명'], base_data['입찰일시'])
+            count = occurrences.get(bid_id, 0)
+            occurrences[bid_id] = count + 1
+            if count:
+                bid_id = f"{bid_id}_{count}"
+
+            # 사용자 입력 데이터는 별도 노드에 저장
+            user_data = {
+                '물동량 평균': safe_float_convert(user_input['물동량 평균']),
+                '용역기간(개월)': safe_float_convert(user_input['용역기간(개월)']),
+                '마지막_수정일': modified_at,
+                '수정자': 'initial_import'
+            }
+            yield bid_id, year, month, base_data, user_data
+
+
+def iter_batches(records, batch_size=BATCH_SIZE):
+    """
+    입찰을 연도/월별로 모아 batch_size개씩 다중 경로 update payload로 반환
+
+    같은 CSV와 batch_size이면 항상 같은 배치 키("연도/월#번호")가 만들어지므로
+    진행 상황 파일에 완료된 배치 키만 기록해도 이어서 업로드할 수 있다.
+
+    Yields:
+        tuple: (배치 키, {"bids/연도/월/bid_id": 데이터, "user_inputs/bid_id": 데이터})
+    """
+    pending = {}  # (연도, 월) -> payload
+    sequence = {}  # (연도, 월) -> 다음 배치 번호
+
+    def take(month_key):
+        number = sequence.get(month_key, 0)
+        sequence[month_key] = number + 1
+        return f"{month_key[0]}/{month_key[1]}#{number}", pending.pop(month_key)
+
+    for bid_id, year, month, base_data, user_data in records:
+        month_key = (year, month)
+        payload = pending.setdefault(month_key, {})
+        payload[f"bids/{year}/{month}/{bid_id}"] = base_data
+        payload[f"user_inputs/{bid_id}"] = user_data
+        if len(payload) >= batch_size * 2:
+            yield take(month_key)
+    for month_key in sorted(pending):
+        yield take(month_key)
+
+
+class Checkpoint:
+    """
+    완료된 배치 키를 기록하는 진행 상황 파일
+
+    CSV 파일(크기, 수정 시각)이나 batch_size가 바뀌면 이전 기록은 사용하지 않는다.
+    배치가 끝날 때마다 임시 파일에 쓴 뒤 교체하므로 중단되어도 파일이 깨지지 않는다.
+    path가 None이면 파일 없이 메모리에만 기록한다 (dry-run).
+    """
+
+    def __init__(self, path, csv_file, batch_size):
+        self.path = path
+        stat = os.stat(csv_file)
+        self.source = {
+            'csv': os.path.abspath(csv_file),
+            'size': stat.st_size,
+            'mtime': stat.st_mtime,
+            'batch_size': batch_size,
         }
-    
-    print(f"모든 {total_rows} 레코드 처리 완료")
-    print("Firebase에 데이터 업로드 중...")
-    
-    # Firebase에 데이터 업로드
-    bids_ref = db.reference('/bids')
-    user_inputs_ref = db.reference('/user_inputs')
-    
-    # 기존 데이터 삭제 확인
-    confirm = input("기존 데이터를 모두 삭제하고 새로운 데이터를 업로드하시겠습니까? (y/n): ")
-    if confirm.lower() == 'y':
-        print("기존 데이터 삭제 중...")
-        bids_ref.delete()
-        user_inputs_ref.delete()
-        print("기존 데이터 삭제 완료")
-    else:
-        print("기존 데이터를 유지하고 새 데이터를 추가합니다.")
-    
-    # 새 데이터 업로드
-    print("bids 데이터 업로드 중...")
-    bids_ref.set(bids_data)
-    print("bids 데이터 업로드 완료")
-    
-    print("user_inputs 데이터 업로드 중...")
-    user_inputs_ref.set(user_inputs)
-    print("user_inputs 데이터 업로드 완료")
-    
+        self.completed = set()
+        self._lock = threading.Lock()
+
+    def load(self):
+        """이전 진행 상황을 읽어 완료된 배치 수 반환 (없거나 다른 파일이면 0)"""
+        if self.path is None:
+            return 0
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return 0
+        if saved.get('source') != self.source:
+            print("진행 상황 파일이 현재 CSV/배치 크기와 달라 처음부터 업로드합니다.")
+            return 0
+        self.completed = set(saved.get('completed', []))
+        return len(self.completed)
+
+    def mark_done(self, key):
+        with self._lock:
+            self.completed.add(key)
+            if self.path is None:
+                return
+            with open(self.path + '.tmp', 'w', encoding='utf-8') as f:
+                json.dump({'source': self.source, 'completed': sorted(self.completed)}, f, ensure_ascii=False)
+            os.replace(self.path + '.tmp', self.path)
+
+    def remove(self):
+        if self.path is None:
+            return
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+class Manifest:
+    """
+    마지막으로 업로드한 입찰별 위치(연도/월)와 내용 해시를 보관하는 로컬 파일
+
+    증분 동기화는 원격 데이터를 다시 내려받지 않고 이 파일과 CSV를 비교한다.
+    파일이 없거나 원격 데이터가 바뀐 것으로 의심되면 from_remote로 다시 만든다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.records = {}  # bid_id -> {"path": "연도/월", "hash": 기본 정보 해시, "input_hash": 사용자 입력 해시}
+        self.legacy_inputs = {}  # 내용 기반 ID -> 이전 ID 형식 입찰의 원격 user_inputs
+
+    def add(self, bid_id, year, month, base_data, user_data):
+        self.records[bid_id] = {
+            'path': f"{year}/{month}",
+            'hash': content_hash(base_data),
+            'input_hash': user_input_hash(user_data),
+        }
+
+    def load(self):
+        """manifest 파일을 읽음 (없거나 형식이 다르면 False)"""
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if saved.get('format') != MANIFEST_FORMAT:
+            return False
+        self.records = saved.get('records', {})
+        return True
+
+    def save(self):
+        with open(self.path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump({'format': MANIFEST_FORMAT, 'records': self.records}, f, ensure_ascii=False)
+        os.replace(self.path + '.tmp', self.path)
+
+    @classmethod
+    def from_remote(cls, path, bids_tree, user_inputs):
+        """
+        원격 /bids, /user_inputs 트리로 manifest 생성
+
+        이전 형식의 ID(bid_{행 번호}_{공고명})로 저장된 입찰은 내용 기반 ID를 함께 기록해서,
+        동기화할 때 새 ID로 옮기면서 대시보드에서 수정한 사용자 입력을 그대로 가져간다.
+        """
+        manifest = cls(path)
+        legacy = []  # (이전 ID, 기본 정보, 사용자 입력)
+        for year, months in (bids_tree or {}).items():
+            for month, bids in (months or {}).items():
+                for bid_id, base_data in (bids or {}).items():
+                    user_data = (user_inputs or {}).get(bid_id) or {}
+                    manifest.add(bid_id, year, month, base_data, user_data)
+                    if user_data.get('수정자') != 'initial_import':
+                        # 대시보드에서 수정된 값은 CSV 값과 비교하지 않음 (CSV 값이 바뀔 때만 덮어씀)
+                        manifest.records[bid_id]['input_hash'] = None
+                    if not STABLE_ID_PATTERN.match(bid_id):
+                        legacy.append((bid_id, base_data, user_data))
+
+        # 같은 내용이 반복되는 입찰의 번호는 iter_bid_records와 같이 CSV 행 순서대로 붙임
+        # (원격 키 순서는 문자열 순서라 bid_10_이 bid_2_보다 앞에 옴)
+        legacy.sort(key=lambda item: legacy_row_number(item[0]))
+        occurrences = {}
+        for bid_id, base_data, user_data in legacy:
+            stable_id = stable_bid_id(base_data.get('실수요기관', ''), base_data.get('공고명', ''), base_data.get('입찰일시', ''))
+            count = occurrences.get(stable_id, 0)
+            occurrences[stable_id] = count + 1
+            if count:
+                stable_id = f"{stable_id}_{count}"
+            manifest.records[bid_id]['stable_id'] = stable_id
+            if user_data:
+                manifest.legacy_inputs[stable_id] = user_data
+        return manifest
+
+
+def plan_sync(records, manifest):
+    """
+    CSV 입찰과 manifest를 비교해서 추가/변경/삭제할 경로 목록과 새 manifest 생성
+
+    - 새 입찰: bids와 user_inputs 모두 추가 (이전 ID로 저장된 입찰이면 그 사용자 입력을 옮김)
+    - 기본 정보가 바뀐 입찰: bids 노드만 교체
+    - CSV의 물동량 평균/용역기간이 바뀐 입찰: user_inputs 교체
+      (CSV 값이 그대로면 대시보드에서 수정한 값을 덮어쓰지 않음)
+    - CSV에 없는 입찰(이전 ID 포함): bids와 user_inputs 삭제
+
+    Returns:
+        tuple: ([(경로, 값 또는 삭제는 None)], 새 Manifest, {"inserted", "changed", "deleted", "unchanged"})
+    """
+    changes = []
+    updated = Manifest(manifest.path)
+    counts = {'inserted': 0, 'changed': 0, 'deleted': 0, 'unchanged': 0}
+
+    for bid_id, year, month, base_data, user_data in records:
+        updated.add(bid_id, year, month, base_data, user_data)
+        entry = updated.records[bid_id]
+        previous = manifest.records.get(bid_id)
+        if previous is None:
+            counts['inserted'] += 1
+            changes.append((f"bids/{year}/{month}/{bid_id}", base_data))
+            changes.append((f"user_inputs/{bid_id}", manifest.legacy_inputs.get(bid_id, user_data)))
+            continue
+        changed = False
+        if previous['path'] != entry['path']:
+            changes.append((f"bids/{previous['path']}/{bid_id}", None))
+        if previous['path'] != entry['path'] or previous['hash'] != entry['hash']:
+            changes.append((f"bids/{year}/{month}/{bid_id}", base_data))
+            changed = True
+        if previous['input_hash'] is not None and previous['input_hash'] != entry['input_hash']:
+            changes.append((f"user_inputs/{bid_id}", user_data))
+            changed = True
+        counts['changed' if changed else 'unchanged'] += 1
+
+    for bid_id, previous in manifest.records.items():
+        if bid_id in updated.records:
+            continue
+        counts['deleted'] += 1
+        changes.append((f"bids/{previous['path']}/{bid_id}", None))
+        changes.append((f"user_inputs/{bid_id}", None))
+
+    return changes, updated, counts
+
+
+def iter_change_batches(changes, batch_size=BATCH_SIZE):
+    """변경 경로 목록을 batch_size개 입찰(경로 2개씩) 단위의 다중 경로 update payload로 반환"""
+    for number, start in enumerate(range(0, len(changes), batch_size * 2)):
+        yield f"sync#{number}", dict(changes[start:start + batch_size * 2])
+
+
+def iter_with_manifest(records, manifest):
+    """업로드하는 입찰을 manifest에도 기록하면서 그대로 반환"""
+    for record in records:
+        manifest.add(*record)
+        yield record
+
+
+def send_batch(root_ref, payload, max_retries=MAX_RETRIES, retry_delay=RETRY_DELAY):
+    """다중 경로 update 한 번으로 배치 전송 (실패하면 점점 긴 간격으로 재시도)"""
+    for attempt in range(max_retries + 1):
+        try:
+            root_ref.update(payload)
+            return
+        except Exception as e:
+            if attempt == max_retries:
+                raise
+            delay = retry_delay * (2 ** attempt)
+            print(f"배치 전송 실패, {delay:.1f}초 후 다시 시도합니다: {e}")
+            time.sleep(delay)
+
+
+def upload(root_ref, batches, checkpoint, workers=UPLOAD_WORKERS, max_retries=MAX_RETRIES, retry_delay=RETRY_DELAY):
+    """
+    배치를 스레드 풀로 전송하고 완료될 때마다 진행 상황 파일에 기록
+
+    전송 대기 중인 배치는 작업 수의 두 배까지만 만들어 두므로
+    CSV 크기와 관계없이 메모리 사용량이 일정하다.
+    실패한 배치는 send_batch가 max_retries번까지 retry_delay부터 두 배씩 기다리며 재시도한다.
+
+    Returns:
+        tuple: (전송한 배치 수, 건너뛴 배치 수, 전송한 입찰 수(삭제 포함))
+    """
+    slots = threading.BoundedSemaphore(workers * 2)
+    errors = []
+    sent = [0, 0]  # 배치 수, 입찰 수
+    skipped = 0
+    counter_lock = threading.Lock()
+
+    def run(key, payload):
+        try:
+            send_batch(root_ref, payload, max_retries, retry_delay)
+            checkpoint.mark_done(key)
+            with counter_lock:
+                sent[0] += 1
+                sent[1] += sum(1 for path in payload if path.startswith('bids/'))
+                if sent[0] % 10 == 0:
+                    print(f"진행 중: {sent[0]}개 배치, {sent[1]}개 입찰 업로드 완료")
+        except Exception as e:
+            errors.append((key, e))
+        finally:
+            slots.release()
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for key, payload in batches:
+            if errors:
+                break
+            if key in checkpoint.completed:
+                skipped += 1
+                continue
+            slots.acquire()
+            executor.submit(run, key, payload)
+
+    if errors:
+        key, error = errors[0]
+        raise RuntimeError(f"배치 {key} 업로드 실패 (완료된 배치는 진행 상황 파일에 기록됨): {error}")
+    return sent[0], skipped, sent[1]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="CSV 입찰 목록을 Firebase로 업로드 (중단되면 이어서 진행)")
+    parser.add_argument("--csv", default=CSV_FILE, help="업로드할 CSV 파일")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="update() 한 번에 담는 입찰 수")
+    parser.add_argument("--workers", type=int, default=UPLOAD_WORKERS, help="동시에 전송하는 배치 수")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="CSV를 한 번에 읽는 행 수")
+    parser.add_argument("--checkpoint", default=CHECKPOINT_FILE, help="진행 상황 파일 경로")
+    parser.add_argument("--max-retries", type=int, default=MAX_RETRIES, help="실패한 배치 재시도 횟수")
+    parser.add_argument("--retry-delay", type=float, default=RETRY_DELAY, help="첫 재시도 대기 시간(초, 재시도마다 두 배)")
+    parser.add_argument("--dry-run", action="store_true", help="Firebase 대신 메모리 내 데이터베이스에 업로드")
+    parser.add_argument("--sync", action="store_true", help="manifest와 비교해서 추가/변경/삭제된 입찰만 업로드")
+    parser.add_argument("--manifest", default=MANIFEST_FILE, help="입찰별 내용 해시 파일 경로")
+    parser.add_argument("--rebuild-manifest", action="store_true", help="동기화 전에 원격 데이터로 manifest를 다시 만듦")
+    return parser.parse_args(argv)
+
+
+def run_full_upload(args, reference):
+    """CSV 전체 업로드 (중단되면 진행 상황 파일로 이어서 진행, 끝나면 manifest 저장)"""
+    # dry-run은 실제 업로드의 진행 상황 파일에 영향을 주지 않도록 메모리에만 기록
+    checkpoint = Checkpoint(None if args.dry_run else args.checkpoint, args.csv, args.batch_size)
+    resumed = checkpoint.load()
+    if resumed:
+        print(f"이전 업로드를 이어서 진행합니다 (완료된 배치 {resumed}개 건너뜀)")
+    elif not args.dry_run:
+        # 기존 데이터 삭제 확인 (처음 시작할 때만)
+        confirm = input("기존 데이터를 모두 삭제하고 새로운 데이터를 업로드하시겠습니까? (y/n): ")
+        if confirm.lower() == 'y':
+            print("기존 데이터 삭제 중...")
+            reference('/bids').delete()
+            reference('/user_inputs').delete()
+            print("기존 데이터 삭제 완료")
+        else:
+            print("기존 데이터를 유지하고 새 데이터를 추가합니다.")
+            print("(이전 데이터를 정리하려면 이후 --sync --rebuild-manifest로 동기화하세요)")
+
+    # CSV를 청크 단위로 읽으면서 연도/월별 배치로 업로드
+    print(f"'{args.csv}' 파일 업로드 중...")
+    manifest = Manifest(args.manifest)
+    records = iter_with_manifest(iter_bid_records(args.csv, args.chunk_size), manifest)
+    batches = iter_batches(records, args.batch_size)
+    sent, skipped, total_bids = upload(
+        reference('/'), batches, checkpoint, args.workers, args.max_retries, args.retry_delay
+    )
+
+    # 모두 끝났으면 다음 실행은 처음부터 시작
+    checkpoint.remove()
+    if not args.dry_run:
+        manifest.save()
+
     print("\n데이터 업로드 성공!")
-    print(f"총 {total_rows}개의 레코드가 Firebase에 업로드되었습니다.")
-    print(f"- 연도 수: {len(bids_data)}")
-    print(f"- 사용자 입력 데이터 수: {len(user_inputs)}")
-    
-except Exception as e:
-    print(f"\n오류 발생: {e}")
-    print("데이터 업로드에 실패했습니다.")
-    import traceback
-    traceback.print_exc()
-    sys.exit(1)
\ No newline at end of file
+    print(f"- 업로드한 배치 수: {sent} (이전 실행에서 완료되어 건너뛴 배치 {skipped})")
+    print(f"- 업로드한 입찰 수: {total_bids}")
+
+
+def run_sync(args, reference):
+    """manifest와 CSV를 비교해서 바뀐 입찰만 업로드하고 manifest 갱신"""
+    manifest = Manifest(args.manifest)
+    if args.rebuild_manifest or not manifest.load():
+        # manifest가 없으면 원격 데이터로 만듦 (이전 ID 형식의 입찰도 여기서 확인)
+        print("원격 데이터로 manifest를 만드는 중...")
+        manifest = Manifest.from_remote(args.manifest, reference('/bids').get(), reference('/user_inputs').get())
+    print(f"manifest 입찰 수: {len(manifest.records)}")
+
+    changes, updated, counts = plan_sync(iter_bid_records(args.csv, args.chunk_size), manifest)
+    print(f"추가 {counts['inserted']}건, 변경 {counts['changed']}건, 삭제 {counts['deleted']}건, 변경 없음 {counts['unchanged']}건")
+
+    if changes:
+        batches = iter_change_batches(changes, args.batch_size)
+        sent, _, _ = upload(
+            reference('/'), batches, Checkpoint(None, args.csv, args.batch_size),
+            args.workers, args.max_retries, args.retry_delay,
+        )
+        print(f"- 업로드한 배치 수: {sent}")
+    if not args.dry_run:
+        updated.save()
+    print("\n동기화 완료!")
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    # 파일 존재 확인
+    if not args.dry_run and not os.path.exists(CREDENTIAL_FILE):
+        print(f"오류: 인증 파일 '{CREDENTIAL_FILE}'을 찾을 수 없습니다.")
+        sys.exit(1)
+
+    if not os.path.exists(args.csv):
+        print(f"오류: CSV 파일 '{args.csv}'을 찾을 수 없습니다.")
+        sys.exit(1)
+
+    try:
+        if args.dry_run:
+            database = InMemoryDatabase()
+            reference = database.reference
+            print("dry-run: 메모리 내 데이터베이스에 업로드합니다.")
+        else:
+            # Firebase 초기화
+            cred = credentials.Certificate(CREDENTIAL_FILE)
+            firebase_admin.initialize_app(cred, {
+                'databaseURL': DATABASE_URL
+            })
+            reference = db.reference
+            print("Firebase 초기화 성공")
+
+        if args.sync:
+            run_sync(args, reference)
+        else:
+            run_full_upload(args, reference)
+
+        if args.dry_run:
+            bids = database.tree.get('bids', {})
+            print(f"- 연도 수: {len(bids)}")
+            print(f"- 입찰 수: {sum(len(month) for year in bids.values() for month in year.values())}")
+            print(f"- 사용자 입력 데이터 수: {len(database.tree.get('user_inputs', {}))}")
+            print(f"- update() 호출 수: {database.updates}")
+
+    except Exception as e:
+        print(f"\n오류 발생: {e}")
+        print("데이터 업로드에 실패했습니다.")
+        if not args.dry_run and not args.sync:
+            print(f"다시 실행하면 '{args.checkpoint}'에 기록된 완료 배치 이후부터 이어서 업로드합니다.")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
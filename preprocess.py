@@ -1,70 +1,117 @@
 import pandas as pd
 import numpy as np
-import re
 from datetime import datetime
+from reconcile import SUCCESSOR_COLUMN, fulfilled_predictions, successor_dates_of
+from bid_schema import prediction_mask
+
+# preprocess_bid_data가 CSV에서 읽는 컬럼과 읽기 타입 (나머지 컬럼은 읽지 않음)
+#  - 금액/물동량은 "143,930,000" 같은 문자열이므로 문자열로 읽은 뒤 한 번에 변환
+CSV_COLUMN_DTYPES = {
+    "입찰일시": "str",
+    "실수요기관": "str",
+    "공고명": "str",
+    "물동량 평균": "str",
+    "용역기간(개월)": "float64",
+    "계약 기간 내": "str",
+    "입찰결과_1순위": "str",
+    "입찰금액_1순위": "str",
+}
+
+# 금액/물동량 컬럼 (쉼표, 원 등 숫자 외 문자를 제거하고 정수로 변환)
+NUMERIC_TEXT_COLUMNS = ["물동량 평균", "계약 기간 내", "입찰금액_1순위"]
+
+# 텍스트 컬럼 (빈 값은 "", 앞뒤 공백 제거)
+TEXT_COLUMNS = ["실수요기관", "공고명", "입찰결과_1순위"]
+
+PROCESSED_COLUMNS = [
+    "실수요기관", "공고명", "물동량 평균",
+    "용역기간(개월)", "계약 기간 내", "입찰결과_1순위", "입찰금액_1순위",
+    "예상_입찰일", "예상_연도", "예상_입찰월", "예상_입찰일자",
+    "예상_년월", "예상_년월일"
+]
+
+
+def parse_amounts(series):
+    """
+    "143,930,000" 같은 금액 문자열 컬럼을 한 번에 정수로 변환 (빈 값/숫자가 없는 값은 0)
+
+    숫자와 소수점 외의 문자(쉼표, 원 등)를 제거한 뒤 변환하며, 소수점 이하는 버린다.
+    """
+    if pd.api.types.is_numeric_dtype(series):
+        return series.fillna(0).astype(np.int64)
+    cleaned = series.str.replace(r"[^\d.]", "", regex=True)
+    return pd.to_numeric(cleaned, errors="coerce").fillna(0).astype(np.int64)
+
+
+def clean_bid_rows(df):
+    """
+    CSV에서 읽은 원본 행(CSV_COLUMN_DTYPES 컬럼)을 화면용 컬럼으로 정리
+
+    Args:
+        df (pandas.DataFrame): CSV_COLUMN_DTYPES 컬럼만 읽은 데이터 프레임 (청크 가능)
+
+    Returns:
+        pandas.DataFrame: PROCESSED_COLUMNS 컬럼의 데이터 프레임
+    """
+    processed = pd.DataFrame(index=df.index)
+    for col in TEXT_COLUMNS:
+        processed[col] = df[col].fillna("").str.strip()
+
+    # 입찰일시의 날짜 부분을 예상 입찰일로 사용 (시각은 버림)
+    bid_dates = pd.to_datetime(df["입찰일시"]).dt.normalize().astype("datetime64[s]")
+    processed["예상_입찰일"] = bid_dates
+    # 입찰일시가 빈 행이 있으면 연/월/일은 결측값을 담을 수 있는 실수형
+    part_dtype = np.int64 if bid_dates.notna().all() else np.float64
+    processed["예상_연도"] = bid_dates.dt.year.astype(part_dtype)
+    processed["예상_입찰월"] = bid_dates.dt.month.astype(part_dtype)
+    processed["예상_입찰일자"] = bid_dates.dt.day.astype(part_dtype)  # 일자 정보 추가
+    # 날짜 문자열은 행마다 strftime 대신 numpy로 한 번에 변환 (빈 날짜는 결측값)
+    date_text = pd.Series(np.datetime_as_string(bid_dates.to_numpy(), unit="D"), index=df.index, dtype="str")
+    date_text = date_text.where(bid_dates.notna())
+    processed["예상_년월"] = date_text.str[:7]
+    processed["예상_년월일"] = date_text
 
-def preprocess_bid_data(input_csv: str, prediction_years: int = 30) -> pd.DataFrame:
-    # CSV 파일 로딩
-    df = pd.read_csv(input_csv)
-    
-    # 입찰일시 컬럼에서 날짜 정보 추출
-    df["입찰일시"] = pd.to_datetime(df["입찰일시"])
-    
-    # 예상_입찰일 설정 (입찰일시에서 추출)
-    df["예상_입찰일"] = df["입찰일시"].dt.date.apply(lambda x: pd.Timestamp(x))
-    
-    # 예상 연도와 월 컬럼 추가 (정렬 및 필터링용)
-    df["예상_연도"] = df["예상_입찰일"].dt.year
-    df["예상_입찰월"] = df["예상_입찰일"].dt.month
-    df["예상_입찰일자"] = df["예상_입찰일"].dt.day  # 일자 정보 추가
-    
-    # 예상_년월 컬럼 추가 (YYYY-MM 형식)
-    df["예상_년월"] = df["예상_입찰일"].dt.strftime('%Y-%m')
-    
-    # 예상_년월일 컬럼 추가 (YYYY-MM-DD 형식)
-    df["예상_년월일"] = df["예상_입찰일"].dt.strftime('%Y-%m-%d')
-    
     # 용역기간 정수형으로 변환
-    df["용역기간(개월)"] = df["용역기간(개월)"].fillna(0).astype(int)
-    
-    # 숫자 데이터 정리 함수
-    def clean_numeric(value):
-        if pd.isna(value):
-            return 0
-        if isinstance(value, (int, float)):
-            return value
-        # 쉼표, 원, 기타 문자 제거 후 숫자만 추출
-        cleaned = re.sub(r'[^\d.]', '', str(value))
-        return float(cleaned) if cleaned else 0
-    
-    # 금액 컬럼 숫자로 변환 - 정수형으로 변환
-    df["계약 기간 내"] = df["계약 기간 내"].apply(clean_numeric).astype(int)
-    df["입찰금액_1순위"] = df["입찰금액_1순위"].apply(clean_numeric).astype(int)
-    
-    # 물동량 평균 숫자로 변환 - 정수형으로 변환
-    df["물동량 평균"] = df["물동량 평균"].apply(clean_numeric).astype(int)
-    
-    # 텍스트 컬럼 정리
-    df["실수요기관"] = df["실수요기관"].fillna("").astype(str).str.strip()
-    df["공고명"] = df["공고명"].fillna("").astype(str).str.strip()
-    df["입찰결과_1순위"] = df["입찰결과_1순위"].fillna("").astype(str).str.strip()
-    
-    # 필요한 컬럼만 선택
-    df_processed = df[[
-        "실수요기관", "공고명", "물동량 평균",
-        "용역기간(개월)", "계약 기간 내", "입찰결과_1순위", "입찰금액_1순위",
-        "예상_입찰일", "예상_연도", "예상_입찰월", "예상_입찰일자", 
-        "예상_년월", "예상_년월일"
-    ]]
-    
-    # NaN 값 처리
-    numeric_columns = ["물동량 평균", "용역기간(개월)", "계약 기간 내", "입찰금액_1순위"]
-    for col in numeric_columns:
-        df_processed[col] = df_processed[col].fillna(0)
-    
-    text_columns = ["실수요기관", "공고명", "입찰결과_1순위"]
-    for col in text_columns:
-        df_processed[col] = df_processed[col].fillna("")
+    processed["용역기간(개월)"] = df["용역기간(개월)"].fillna(0).astype(np.int64)
+
+    # 금액/물동량 컬럼 숫자로 변환 - 정수형으로 변환
+    for col in NUMERIC_TEXT_COLUMNS:
+        processed[col] = parse_amounts(df[col])
+
+    return processed[PROCESSED_COLUMNS]
+
+
+def read_bid_chunks(input_csv, chunksize):
+    """
+    CSV를 chunksize 행씩 읽어 정리된 청크를 차례로 반환하는 제너레이터
+
+    한 번에 한 청크의 원본 문자열만 메모리에 올라가므로 아주 큰 파일도
+    원본 크기와 관계없이 일정한 메모리로 읽을 수 있다.
+    """
+    reader = pd.read_csv(input_csv, usecols=list(CSV_COLUMN_DTYPES), dtype=CSV_COLUMN_DTYPES, chunksize=chunksize)
+    for chunk in reader:
+        yield clean_bid_rows(chunk)
+
+
+def preprocess_bid_data(input_csv: str, prediction_years: int = 30, chunksize=None) -> pd.DataFrame:
+    """
+    입찰 목록 CSV를 읽어 원본 데이터와 예측 데이터를 합친 데이터 프레임 생성
+
+    Args:
+        input_csv (str): 입찰 목록 CSV 경로
+        prediction_years (int): 현재 연도부터 예측을 생성할 연도 수
+        chunksize (int): 지정하면 이 행 수씩 나눠 읽음 (큰 파일의 최대 메모리 제한)
+
+    Returns:
+        pandas.DataFrame: 원본 + 예측 데이터
+    """
+    # CSV 파일 로딩 (필요한 컬럼만 지정한 타입으로 읽음)
+    if chunksize:
+        df_processed = pd.concat(read_bid_chunks(input_csv, chunksize), ignore_index=True)
+    else:
+        df = pd.read_csv(input_csv, usecols=list(CSV_COLUMN_DTYPES), dtype=CSV_COLUMN_DTYPES)
+        df_processed = clean_bid_rows(df)
+        del df
     
     # 현재 데이터 확인 - 연도별 데이터 개수 출력
     연도별_데이터수 = df_processed.groupby("예상_연도")["공고명"].count()
@@ -91,19 +138,300 @@ def preprocess_bid_data(input_csv: str, prediction_years: int = 30) -> pd.DataFr
     return df_combined
 
 
-def generate_prediction_data(df, prediction_years=5):
+def _days_in_month(years, months):
+    """연/월 배열에 대해 각 월의 일수를 계산 (윤년 반영)"""
+    month_start = ((years - 1970) * 12 + (months - 1)).astype("datetime64[M]")
+    next_month_start = month_start + np.timedelta64(1, "M")
+    return (next_month_start.astype("datetime64[D]") - month_start.astype("datetime64[D]")).astype(np.int64)
+
+
+def add_months(dates, months):
+    """
+    날짜 배열에 행별 개월 수를 한 번에 더하는 함수 (pd.DateOffset(months=n)과 동일한 말일 보정)
+
+    Args:
+        dates (pandas.Series): 기준 날짜 (NaT 허용)
+        months (pandas.Series): 더할 개월 수 (음수 허용, NaN이면 결과도 NaT)
+
+    Returns:
+        pandas.Series: 계산된 날짜 (입력과 같은 인덱스)
+    """
+    dates = pd.to_datetime(dates)
+    valid = dates.notna() & months.notna()
+    result = pd.Series(pd.NaT, index=dates.index, dtype=dates.dtype)
+    if not valid.any():
+        return result
+
+    base = pd.DatetimeIndex(dates[valid])
+    offsets = months[valid].to_numpy(dtype=np.int64)
+    month_index = base.year.to_numpy(dtype=np.int64) * 12 + (base.month.to_numpy(dtype=np.int64) - 1) + offsets
+    target_years = month_index // 12
+    target_months = month_index % 12 + 1
+    target_days = np.minimum(base.day.to_numpy(dtype=np.int64), _days_in_month(target_years, target_months))
+
+    target_dates = (
+        ((target_years - 1970) * 12 + (target_months - 1)).astype("datetime64[M]").astype("datetime64[D]")
+        + (target_days - 1).astype("timedelta64[D]")
+    )
+    time_of_day = (base - base.normalize()).to_numpy()
+    result[valid] = pd.to_datetime(target_dates).as_unit(dates.dt.unit) + time_of_day
+    return result
+
+
+def compute_prediction_cycles(original_dates, service_months, max_prediction_year):
+    """
+    입찰일과 용역기간 배열로부터 모든 예측 차수의 날짜를 한 번에 계산하는 함수
+
+    pd.DateOffset(months=n)을 반복해서 더한 결과와 동일하도록 말일 보정을 누적 적용함
+    (예: 1/31 → 2/28 → 3/28)
+
+    Args:
+        original_dates (pandas.DatetimeIndex): 원본 입찰일 (NaT 없음)
+        service_months (numpy.ndarray): 입찰별 반복 주기 (개월, 1 이상)
+        max_prediction_year (int): 예측할 마지막 연도
+
+    Returns:
+        tuple: (원본 행 위치, 예측 차수, 예측 날짜) 배열
+    """
+    service_months = np.asarray(service_months, dtype=np.int64)
+    years = original_dates.year.to_numpy(dtype=np.int64)
+    months = original_dates.month.to_numpy(dtype=np.int64)
+    days = original_dates.day.to_numpy(dtype=np.int64)
+    time_of_day = (original_dates - original_dates.normalize()).to_numpy()
+
+    # 입찰별 예측 차수 개수: 예측 연도가 max_prediction_year를 넘지 않는 마지막 차수까지
+    base_month_index = years * 12 + (months - 1)
+    last_month_index = max_prediction_year * 12 + 11
+    cycle_counts = np.maximum((last_month_index - base_month_index) // service_months, 0)
+
+    bid_positions = np.repeat(np.arange(len(original_dates)), cycle_counts)
+    group_starts = np.repeat(np.cumsum(cycle_counts) - cycle_counts, cycle_counts)
+    cycle_numbers = np.arange(len(bid_positions)) - group_starts + 1
+
+    month_index = base_month_index[bid_positions] + cycle_numbers * service_months[bid_positions]
+    cycle_years = month_index // 12
+    cycle_months = month_index % 12 + 1
+
+    # DateOffset을 반복 적용하면 이전 차수의 말일 보정이 다음 차수로 이어지므로 누적 최소값 사용
+    month_days = pd.Series(_days_in_month(cycle_years, cycle_months))
+    clipped_days = month_days.groupby(bid_positions).cummin().to_numpy()
+    cycle_days = np.minimum(days[bid_positions], clipped_days)
+
+    cycle_dates = (
+        (month_index - 1970 * 12).astype("datetime64[M]").astype("datetime64[D]")
+        + (cycle_days - 1).astype("timedelta64[D]")
+        + time_of_day[bid_positions]
+    )
+
+    return bid_positions, cycle_numbers, cycle_dates
+
+
+def _is_leap_year(years):
+    return ((years % 4 == 0) & (years % 100 != 0)) | (years % 400 == 0)
+
+
+def _clipped_cycle_days(base_month_index, service_months, days, cycle_numbers):
+    """
+    k차 예측의 일자 계산: DateOffset을 k번 반복 적용했을 때의 말일 보정 결과
+
+    1~k차 예측 월 중 가장 짧은 달의 일수로 원본 일자가 잘리므로, 이전 차수를
+    모두 계산하지 않고 주기 안에서 처음 나오는 월(최대 12개)과 2월의 윤년 여부만 확인한다.
+
+    Args:
+        base_month_index (numpy.ndarray): 원본 입찰 년월 (연도 * 12 + 월 - 1)
+        service_months (numpy.ndarray): 반복 주기 (개월)
+        days (numpy.ndarray): 원본 입찰 일자
+        cycle_numbers (numpy.ndarray): 예측 차수 k (1 이상)
+
+    Returns:
+        numpy.ndarray: 예측 일자
+    """
+    result = days.copy()
+    # 28일 이하는 어느 달에서도 잘리지 않음
+    needs_clip = np.flatnonzero(days > 28)
+    if len(needs_clip) == 0:
+        return result
+
+    base = base_month_index[needs_clip]
+    step = service_months[needs_clip]
+    k = cycle_numbers[needs_clip]
+    period = 12 // np.gcd(step, 12)  # 월(1~12월)이 반복되는 차수 간격
+
+    shortest = np.full(len(needs_clip), 31, dtype=np.int64)
+    first_february = np.zeros(len(needs_clip), dtype=np.int64)  # 처음 2월이 되는 차수 (없으면 0)
+    for j in range(1, 13):
+        reached = (j <= period) & (j <= k)
+        month = (base + j * step) % 12 + 1
+        thirty = reached & np.isin(month, (4, 6, 9, 11))
+        shortest[thirty] = np.minimum(shortest[thirty], 30)
+        february = reached & (month == 2) & (first_february == 0)
+        first_february[february] = j
+
+    # 2월이 된 차수들의 연도 중 평년이 하나라도 있으면 28일, 모두 윤년이면 29일
+    has_february = first_february > 0
+    if has_february.any():
+        fb = np.flatnonzero(has_february)
+        first_year = (base[fb] + first_february[fb] * step[fb]) // 12
+        year_step = period[fb] * step[fb] // 12  # 2월 사이의 연도 간격
+        count = (k[fb] - first_february[fb]) // period[fb] + 1
+        last_year = first_year + (count - 1) * year_step
+
+        common_year = ~_is_leap_year(first_year) | ((count >= 2) & (year_step % 4 != 0))
+        # 4의 배수 간격이면 100으로 나누어떨어지는(400 제외) 연도를 지나는지 확인
+        for century in range(int(first_year.min()) // 100 * 100, int(last_year.max()) + 1, 100):
+            if century % 400 == 0:
+                continue
+            common_year |= (
+                (century >= first_year) & (century <= last_year)
+                & ((century - first_year) % np.maximum(year_step, 1) == 0)
+            )
+        shortest[fb] = np.minimum(shortest[fb], np.where(common_year, 28, 29))
+
+    result[needs_clip] = np.minimum(days[needs_clip], shortest)
+    return result
+
+
+def compute_year_cycles(original_dates, service_months, year):
+    """
+    특정 연도에 해당하는 예측 차수만 바로 계산하는 함수
+
+    입찰별로 해당 연도 안에 들어가는 첫 차수와 마지막 차수를 나눗셈으로 구하므로
+    이전 차수를 모두 만들지 않는다. 날짜는 compute_prediction_cycles와 동일하다.
+
+    Args:
+        original_dates (pandas.DatetimeIndex): 원본 입찰일 (NaT 없음)
+        service_months (numpy.ndarray): 입찰별 반복 주기 (개월, 1 이상)
+        year (int): 예측할 연도
+
+    Returns:
+        tuple: (원본 행 위치, 예측 차수, 예측 날짜) 배열
+    """
+    service_months = np.asarray(service_months, dtype=np.int64)
+    years = original_dates.year.to_numpy(dtype=np.int64)
+    months = original_dates.month.to_numpy(dtype=np.int64)
+    days = original_dates.day.to_numpy(dtype=np.int64)
+    time_of_day = (original_dates - original_dates.normalize()).to_numpy()
+
+    # 연도 안에 들어가는 차수 범위: year*12 <= base + k*주기 <= year*12 + 11 (k >= 1)
+    base_month_index = years * 12 + (months - 1)
+    first_cycle = np.maximum(-((base_month_index - year * 12) // service_months), 1)
+    last_cycle = (year * 12 + 11 - base_month_index) // service_months
+    cycle_counts = np.maximum(last_cycle - first_cycle + 1, 0)
+
+    bid_positions = np.repeat(np.arange(len(original_dates)), cycle_counts)
+    group_starts = np.repeat(np.cumsum(cycle_counts) - cycle_counts, cycle_counts)
+    cycle_numbers = first_cycle[bid_positions] + np.arange(len(bid_positions)) - group_starts
+
+    month_index = base_month_index[bid_positions] + cycle_numbers * service_months[bid_positions]
+    cycle_days = _clipped_cycle_days(
+        base_month_index[bid_positions], service_months[bid_positions], days[bid_positions], cycle_numbers
+    )
+
+    cycle_dates = (
+        (month_index - 1970 * 12).astype("datetime64[M]").astype("datetime64[D]")
+        + (cycle_days - 1).astype("timedelta64[D]")
+        + time_of_day[bid_positions]
+    )
+
+    return bid_positions, cycle_numbers, cycle_dates
+
+
+def _prediction_sources(df):
+    """
+    예측 대상 입찰 선택: 용역기간과 입찰일이 있는 원본 입찰 (예측공고 제외)
+
+    Returns:
+        tuple: (대상 행, df 안의 대상 행 위치, 원본 입찰일, 반복 주기) - 대상이 없으면 대상 행이 빈 데이터 프레임
+    """
+    is_source = (df["용역기간(개월)"] > 0) & ~prediction_mask(df)
+
+    # 입찰일이 없는 입찰은 예측 대상에서 제외
+    is_source = (is_source & df["예상_입찰일"].notna()).to_numpy(dtype=bool)
+    source_positions = np.flatnonzero(is_source)
+    valid_bids = df.iloc[source_positions]
+    original_dates = pd.DatetimeIndex(valid_bids["예상_입찰일"])
+
+    # 용역기간 그대로 사용 (1개월 차감하지 않음)
+    service_months = np.maximum(1, valid_bids["용역기간(개월)"].to_numpy(dtype=np.float64).astype(np.int64))
+    return valid_bids, source_positions, original_dates, service_months
+
+
+def _drop_fulfilled(cycles, successor_dates):
+    """
+    이미 실제 입찰로 채워진 예측 차수 제외 (reconcile.fulfilled_predictions)
+
+    Args:
+        cycles (tuple): (대상 행 위치, 예측 차수, 예측 날짜) 배열
+        successor_dates (numpy.ndarray): 대상 행별 다음 실제 입찰일
+
+    Returns:
+        tuple: 남길 예측 차수만 고른 (대상 행 위치, 예측 차수, 예측 날짜) 배열
+    """
+    bid_positions, cycle_numbers, cycle_dates = cycles
+    keep = ~fulfilled_predictions(cycle_dates, successor_dates[bid_positions])
+    return bid_positions[keep], cycle_numbers[keep], cycle_dates[keep]
+
+
+def _build_prediction_rows(valid_bids, original_dates, bid_positions, cycle_numbers, cycle_dates):
+    """원본 행을 예측 차수만큼 복제한 뒤 컬럼 단위로 예측 값 설정"""
+    prediction_df = valid_bids.iloc[bid_positions].drop(columns=SUCCESSOR_COLUMN, errors="ignore")
+    cycle_dates = pd.DatetimeIndex(cycle_dates).as_unit(original_dates.unit)
+    
+    # 예측 표시 추가 (n차 예측 표시)
+    prediction_df["공고명"] = [
+        f"{name} ({count}차 예측)"
+        for name, count in zip(prediction_df["공고명"].tolist(), cycle_numbers.tolist())
+    ]
+    
+    # 원본 입찰일을 저장
+    prediction_df["원본_입찰일"] = original_dates[bid_positions]
+    
+    # 예측 날짜 설정
+    prediction_df["예상_입찰일"] = cycle_dates
+    prediction_df["예측_입찰일"] = cycle_dates
+    
+    # 연도 및 월 정보 업데이트
+    prediction_df["예상_연도"] = cycle_dates.year.to_numpy(dtype=np.int64)
+    prediction_df["예상_입찰월"] = cycle_dates.month.to_numpy(dtype=np.int64)
+    prediction_df["예상_년월"] = cycle_dates.strftime("%Y-%m")
+    
+    # 입찰 결과 데이터 초기화 (예측이므로 결과는 없음)
+    prediction_df["입찰결과_1순위"] = "예측"
+    prediction_df["입찰금액_1순위"] = np.zeros(len(prediction_df), dtype=np.int64)
+    
+    # 예측 플래그와 원본 입찰 연결 (공고명의 "예측" 표시로 판단하지 않음)
+    prediction_df["is_prediction"] = True
+    prediction_df["prediction_count"] = cycle_numbers
+    if "bid_id" in prediction_df.columns:
+        prediction_df["base_bid_id"] = valid_bids["bid_id"].to_numpy()[bid_positions]
+    
+    # 행 단위 복사 방식과 동일한 dtype이 되도록 숫자 컬럼은 64비트로, object 컬럼은 타입 추론
+    for col in prediction_df.columns:
+        if pd.api.types.is_bool_dtype(prediction_df[col]):
+            continue
+        if pd.api.types.is_integer_dtype(prediction_df[col]):
+            prediction_df[col] = prediction_df[col].astype(np.int64)
+        elif pd.api.types.is_float_dtype(prediction_df[col]):
+            prediction_df[col] = prediction_df[col].astype(np.float64)
+    return prediction_df.infer_objects()
+
+
+def generate_prediction_data(df, prediction_years=5, successor_dates=None):
     """
     기존 입찰 데이터를 기반으로 예측 데이터를 생성하는 함수
+
+    같은 기관의 비슷한 공고가 실제로 다시 입찰된 경우 그 시점까지의 예측은 만들지 않는다
+    (reconcile.find_successor_dates, df에 SUCCESSOR_COLUMN이 있으면 그 값 사용).
     
     Args:
         df (pandas.DataFrame): 원본 입찰 데이터
         prediction_years (int): 예측할 연도 수 (기본값: 5년)
+        successor_dates (numpy.ndarray): df 행별 다음 실제 입찰일 (없으면 SUCCESSOR_COLUMN 또는 계산)
         
     Returns:
         pandas.DataFrame: 생성된 예측 데이터
     """
-    # 원본 데이터에서 용역기간이 있는 입찰 데이터만 선택 (예측공고 제외)
-    valid_bids = df[(df["용역기간(개월)"] > 0) & (~df["공고명"].str.contains("예측", na=False))]
+    valid_bids, source_positions, original_dates, service_months = _prediction_sources(df)
     
     if valid_bids.empty:
         print("용역기간이 설정된 입찰 데이터가 없어 예측을 생성할 수 없습니다.")
@@ -113,80 +441,24 @@ def generate_prediction_data(df, prediction_years=5):
     current_date = datetime.today()
     current_year = current_date.year
     
-    # 예측 데이터를 저장할 리스트
-    predictions = []
-    
     # 원본 데이터의 최대 연도 확인 (로그용)
-    max_original_year = df[~df["공고명"].str.contains("예측", na=False)]["예상_연도"].max() if not df.empty else current_year
+    max_original_year = df[~prediction_mask(df)]["예상_연도"].max() if not df.empty else current_year
     print(f"원본 데이터 최대 연도: {max_original_year}")
     
-    # 각 입찰에 대해 예측 수행
-    for _, bid in valid_bids.iterrows():
-        # 기본 정보 복사
-        original_date = bid["예상_입찰일"] if pd.notna(bid["예상_입찰일"]) else pd.NaT
-        
-        if pd.isna(original_date):
-            continue
-            
-        # 용역기간이 없으면 건너뜀
-        if pd.isna(bid["용역기간(개월)"]) or bid["용역기간(개월)"] <= 0:
-            continue
-            
-        # 용역기간 그대로 사용 (1개월 차감하지 않음)
-        service_months = max(1, int(bid["용역기간(개월)"]))
-        
-        # 첫 예측 시작 시점 계산
-        next_date = original_date + pd.DateOffset(months=service_months)
-        
-        # 최대 예측 연도 설정
-        max_prediction_year = current_year + prediction_years
-        
-        # 예측 차수 계산용 카운터
-        prediction_count = 1
-        
-        # 예측 루프 - 주어진 연도 범위 내에서 반복 예측
-        # 첫 예측부터 시작 (최대 연도 제한 없음) - 모든 연도에 예측 데이터 생성
-        while next_date.year <= max_prediction_year:
-            prediction = bid.copy()
-            
-            # 예측 표시 추가 (n차 예측 표시)
-            prediction["공고명"] = f"{bid['공고명']} ({prediction_count}차 예측)"
-            
-            # 원본 입찰일을 저장
-            prediction["원본_입찰일"] = original_date
-            
-            # 예측 날짜 설정
-            prediction["예상_입찰일"] = next_date
-            prediction["예측_입찰일"] = next_date
-            
-            # 연도 및 월 정보 업데이트
-            prediction["예상_연도"] = next_date.year
-            prediction["예상_입찰월"] = next_date.month
-            prediction["예상_년월"] = f"{next_date.year}-{next_date.month:02d}"
-            
-            # 입찰 결과 데이터 초기화 (예측이므로 결과는 없음)
-            prediction["입찰결과_1순위"] = "예측"
-            prediction["입찰금액_1순위"] = 0
-            
-            # 예측 플래그 추가
-            prediction["is_prediction"] = True
-            prediction["prediction_count"] = prediction_count
-            
-            # 예측 데이터 추가
-            predictions.append(prediction)
-            
-            # 다음 예측일 계산 (용역기간 주기로 반복)
-            next_date += pd.DateOffset(months=service_months)
-            
-            # 예측 차수 증가
-            prediction_count += 1
+    # 최대 예측 연도까지 모든 입찰의 예측 차수를 한 번에 계산
+    max_prediction_year = current_year + prediction_years
+    cycles = compute_prediction_cycles(original_dates, service_months, max_prediction_year)
+
+    # 실제 입찰로 이미 채워진 예측 제외
+    if successor_dates is None:
+        successor_dates = successor_dates_of(df)
+    bid_positions, cycle_numbers, cycle_dates = _drop_fulfilled(cycles, successor_dates[source_positions])
     
     # 예측 데이터가 없으면 빈 데이터프레임 반환
-    if not predictions:
+    if len(bid_positions) == 0:
         return pd.DataFrame()
     
-    # 예측 데이터를 데이터프레임으로 변환
-    prediction_df = pd.DataFrame(predictions)
+    prediction_df = _build_prediction_rows(valid_bids, original_dates, bid_positions, cycle_numbers, cycle_dates)
     
     print(f"총 {len(prediction_df)}개의 예측 데이터 생성 완료")
     if not prediction_df.empty:
@@ -194,4 +466,37 @@ def generate_prediction_data(df, prediction_years=5):
         print(f"예측 데이터 연도별 개수:")
         print(prediction_df.groupby("예상_연도")["공고명"].count())
     
-    return prediction_df
\ No newline at end of file
+    return prediction_df
+
+
+def predictions_for_year(df, year, successor_dates=None):
+    """
+    원본 입찰 데이터에서 특정 연도의 예측 데이터만 생성하는 함수
+
+    generate_prediction_data 결과에서 해당 연도 행만 고른 것과 같은 행을 같은 순서로 반환한다.
+    예측 기간(연도 수)과 관계없이 해당 연도의 행만 만들므로 먼 연도도 비용이 같다.
+
+    Args:
+        df (pandas.DataFrame): 원본 입찰 데이터
+        year (int): 예측할 연도
+        successor_dates (numpy.ndarray): df 행별 다음 실제 입찰일 (없으면 SUCCESSOR_COLUMN 또는 계산,
+            스냅샷은 게시할 때 계산한 값을 전달)
+
+    Returns:
+        pandas.DataFrame: 해당 연도의 예측 데이터 (없으면 빈 데이터 프레임)
+    """
+    if df.empty or not {"용역기간(개월)", "예상_입찰일", "공고명"} <= set(df.columns):
+        return pd.DataFrame()
+
+    valid_bids, source_positions, original_dates, service_months = _prediction_sources(df)
+    if valid_bids.empty:
+        return pd.DataFrame()
+
+    if successor_dates is None:
+        successor_dates = successor_dates_of(df)
+    bid_positions, cycle_numbers, cycle_dates = _drop_fulfilled(
+        compute_year_cycles(original_dates, service_months, year), successor_dates[source_positions]
+    )
+    if len(bid_positions) == 0:
+        return pd.DataFrame()
+    return _build_prediction_rows(valid_bids, original_dates, bid_positions, cycle_numbers, cycle_dates)
@@ -0,0 +1,305 @@
+import re
+import numpy as np
+import pandas as pd
+from bid_schema import prediction_mask
+
+# 예측일 기준으로 실제 입찰을 같은 공고로 인정하는 범위(일): 실제 입찰일 <= 예측일 + 이 값이면 예측 숨김
+MATCH_TOLERANCE_DAYS = 90
+
+# 같은 공고로 판단하는 공고명 유사도 (정규화한 공고명의 문자 n-gram 자카드 유사도)
+NAME_SIMILARITY = 0.6
+
+# 공고명 비교에 사용하는 문자 n-gram 길이
+NGRAM_SIZE = 2
+
+# 유사도 기준 비교의 부동소수점 오차 허용값 (0.6 * 5 = 3.0000000000000004 등)
+_EPSILON = 1e-9
+
+# 게시할 때 계산해서 데이터 프레임에 함께 담는 원본 행별 다음 실제 입찰일 컬럼
+# (로컬 Parquet 스냅샷과 공유 Arrow 파일에도 그대로 저장되어 다시 계산하지 않음)
+SUCCESSOR_COLUMN = "다음_입찰일"
+
+# 다음 실제 입찰일 계산에 사용하는 컬럼 (이 값들이 같으면 이전 계산 결과를 그대로 사용)
+MATCH_COLUMNS = ["실수요기관", "공고명", "예상_입찰일", "is_prediction"]
+
+# 공고명 비교 전에 지우는 부분: 연도 표기(2024년, 2024년도), 재공고/긴급 표시, 공백과 기호
+_IGNORED_NAME_PATTERN = re.compile(r"(?:19|20)\d{2}\s*년?\s*도?|재공고|긴급|입찰공고|[\W_]+")
+
+
+def normalize_bid_names(names):
+    """
+    공고명을 비교용 문자열로 정규화 (연도 표기, 재공고 표시, 공백/기호 제거)
+
+    Args:
+        names (pandas.Series): 공고명
+
+    Returns:
+        pandas.Series: 정규화한 공고명
+    """
+    return names.astype(str).str.replace(_IGNORED_NAME_PATTERN, "", regex=True).str.lower()
+
+
+def name_ngram_codes(names, size=NGRAM_SIZE):
+    """
+    공고명 목록의 문자 n-gram을 정수 번호로 변환 (이름별로 중복 제거)
+
+    이름보다 n-gram이 길면 이름 전체를 하나의 n-gram으로 사용하고, 빈 이름은 n-gram이 없다.
+
+    Args:
+        names (list): 정규화한 공고명
+        size (int): n-gram 길이 (3 이하)
+
+    Returns:
+        tuple: (이름 번호, n-gram 번호) 배열과 n-gram 종류 수 - (이름, n-gram) 순서로 정렬
+    """
+    lengths = np.fromiter(map(len, names), dtype=np.int64, count=len(names))
+    chars = np.frombuffer("".join(names).encode("utf-32-le"), dtype=np.uint32).astype(np.int64)
+    if len(chars) == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), 0
+
+    # 이름별 n-gram 시작 위치를 펼쳐서 문자 코드를 n-gram 하나의 정수로 합침
+    counts = np.where(lengths >= size, lengths - size + 1, (lengths > 0).astype(np.int64))
+    owners = np.repeat(np.arange(len(names)), counts)
+    offsets = np.arange(len(owners)) - np.repeat(np.cumsum(counts) - counts, counts)
+    starts = (np.cumsum(lengths) - lengths)[owners] + offsets
+    codes = np.zeros(len(owners), dtype=np.int64)
+    for k in range(size):
+        inside = offsets + k < lengths[owners]
+        codes = codes * 0x110000 + np.where(inside, chars[np.minimum(starts + k, len(chars) - 1)], 0)
+
+    grams, gram_values = pd.factorize(codes)
+    keys = np.sort(owners * len(gram_values) + grams)
+    keys = keys[np.append(True, keys[1:] != keys[:-1])]
+    return keys // len(gram_values), keys % len(gram_values), len(gram_values)
+
+
+def similar_name_pairs(group_orgs, group_names, similarity=NAME_SIMILARITY):
+    """
+    같은 기관 안에서 n-gram 자카드 유사도가 similarity 이상인 공고명 그룹 쌍 찾기
+
+    모든 쌍을 비교하지 않고 (기관, n-gram) 색인으로 후보만 고른다. 이름마다 n-gram을
+    전체 빈도가 낮은 순서로 정렬해서 앞부분(prefix)만 색인하면, 유사도가 기준 이상인
+    두 이름은 반드시 앞부분 n-gram을 하나 이상 공유하므로 빠지는 쌍 없이 후보가
+    드문 n-gram을 공유하는 그룹으로 줄어든다. 공고명 그룹이 하나뿐인 기관은 비교하지 않는다.
+
+    Args:
+        group_orgs (numpy.ndarray): 그룹별 기관 번호
+        group_names (list): 그룹별 정규화한 공고명
+        similarity (float): 자카드 유사도 기준
+
+    Returns:
+        tuple: 유사한 (그룹, 그룹) 쌍 배열 (N x 2, 자기 자신 제외, 한 방향만)과 쌍별 유사도 배열
+    """
+    no_pairs = np.zeros((0, 2), dtype=np.int64), np.zeros(0)
+    groups = np.flatnonzero(np.bincount(group_orgs)[group_orgs] > 1)
+    if len(groups) < 2:
+        return no_pairs
+    owners, grams, gram_count = name_ngram_codes([group_names[group] for group in groups])
+    if len(owners) == 0:
+        return no_pairs
+    sizes = np.bincount(owners, minlength=len(groups))
+    gram_starts = np.cumsum(sizes) - sizes
+
+    # n-gram 번호를 빈도가 낮은 순서로 다시 매기면 (그룹, n-gram) 정렬 순서가 곧 이름별 색인 순서
+    frequency = np.bincount(grams, minlength=gram_count)
+    gram_ranks = np.empty(gram_count, dtype=np.int64)
+    gram_ranks[np.argsort(frequency, kind="stable")] = np.arange(gram_count)
+    member_keys = np.sort(owners * gram_count + gram_ranks[grams])
+    grams = member_keys % gram_count
+
+    # 이름별 앞부분 n-gram만 (기관, n-gram) 버킷에 색인 (버킷 안은 그룹 번호 순)
+    prefix_sizes = sizes - np.ceil(similarity * sizes - _EPSILON).astype(np.int64) + 1
+    in_prefix = np.arange(len(owners)) - gram_starts[owners] < prefix_sizes[owners]
+    entry_owners = owners[in_prefix]
+    bucket_keys = group_orgs[groups][entry_owners] * gram_count + grams[in_prefix]
+    bucket_order = np.argsort(bucket_keys, kind="stable")
+    bucket_keys, entry_owners = bucket_keys[bucket_order], entry_owners[bucket_order]
+
+    # 같은 버킷에 들어간 그룹끼리 후보 쌍 생성
+    new_bucket = np.ones(len(entry_owners), dtype=bool)
+    new_bucket[1:] = bucket_keys[1:] != bucket_keys[:-1]
+    bucket_ids = np.cumsum(new_bucket) - 1
+    bucket_ends = np.append(np.flatnonzero(new_bucket)[1:], len(entry_owners))[bucket_ids]
+    partner_counts = bucket_ends - np.arange(len(entry_owners)) - 1
+    first = np.repeat(np.arange(len(entry_owners)), partner_counts)
+    second = first + 1 + np.arange(len(first)) - np.repeat(np.cumsum(partner_counts) - partner_counts, partner_counts)
+    if len(first) == 0:
+        return no_pairs
+    candidates = np.sort(entry_owners[first] * len(groups) + entry_owners[second])
+    candidates = candidates[np.append(True, candidates[1:] != candidates[:-1])]
+    a, b = candidates // len(groups), candidates % len(groups)
+
+    # 길이 차이가 크면 유사도 기준을 넘을 수 없음
+    possible = (similarity * sizes[a] <= sizes[b] + _EPSILON) & (similarity * sizes[b] <= sizes[a] + _EPSILON)
+    a, b = a[possible], b[possible]
+    if len(a) == 0:
+        return no_pairs
+
+    # a의 n-gram이 b에도 있는지 (그룹, n-gram) 정렬 키에서 이진 탐색으로 확인
+    pair_index = np.repeat(np.arange(len(a)), sizes[a])
+    offsets = np.arange(len(pair_index)) - np.repeat(np.cumsum(sizes[a]) - sizes[a], sizes[a])
+    query = b[pair_index] * gram_count + grams[gram_starts[a][pair_index] + offsets]
+    found = member_keys[np.minimum(np.searchsorted(member_keys, query), len(member_keys) - 1)] == query
+    shared = np.bincount(pair_index, weights=found, minlength=len(a))
+    scores = shared / (sizes[a] + sizes[b] - shared)
+    similar = shared + _EPSILON >= similarity * (sizes[a] + sizes[b] - shared)
+    return np.column_stack((groups[a[similar]], groups[b[similar]])), scores[similar]
+
+
+def find_successor_dates(df, similarity=NAME_SIMILARITY):
+    """
+    원본 입찰마다 같은 실수요기관의 비슷한 공고명을 가진 다음 실제 입찰의 입찰일 계산
+
+    같은 (기관, 정규화한 공고명) 그룹으로 먼저 묶고, 유사도는 같은 기관의 그룹끼리만
+    비교한다 (similar_name_pairs). 다른 그룹의 입찰은 그 입찰보다 먼저 있었던 그룹 중
+    가장 비슷한 그룹의 다음 입찰로만 인정하므로, 한 기관이 동시에 진행하는 비슷한 이름의
+    여러 공고(1권역/2권역 등)가 서로의 다음 입찰이 되지 않는다.
+    입찰일이 같은 입찰은 다음 입찰로 보지 않는다.
+
+    Args:
+        df (pandas.DataFrame): 원본 입찰 데이터 (예측 행이 있으면 제외하고 계산)
+        similarity (float): 같은 공고로 판단하는 공고명 유사도
+
+    Returns:
+        numpy.ndarray: df 행 순서의 다음 실제 입찰일 (datetime64[ns], 없으면 NaT)
+    """
+    successors = np.full(len(df), np.datetime64("NaT"), dtype="datetime64[ns]")
+    if df.empty or not {"실수요기관", "공고명", "예상_입찰일"} <= set(df.columns):
+        return successors
+
+    is_prediction = prediction_mask(df)
+    dates = pd.to_datetime(df["예상_입찰일"]).to_numpy(dtype="datetime64[ns]")
+    positions = np.flatnonzero(~is_prediction & ~np.isnat(dates) & df["실수요기관"].notna().to_numpy())
+
+    # 입찰이 하나뿐인 기관은 다음 입찰이 없으므로 제외
+    org_codes, _ = pd.factorize(df["실수요기관"].iloc[positions].astype(str))
+    repeated = np.bincount(org_codes)[org_codes] > 1 if len(positions) else np.zeros(0, dtype=bool)
+    positions, org_codes = positions[repeated], org_codes[repeated]
+    if len(positions) == 0:
+        return successors
+
+    # (기관, 정규화한 공고명) 그룹으로 묶기
+    names = normalize_bid_names(df["공고명"].iloc[positions]).to_numpy(dtype=object)
+    group_codes, group_keys = pd.factorize(pd.Series(org_codes.astype(str)) + "\x00" + names)
+    first_rows = np.unique(group_codes, return_index=True)[1]
+    group_orgs = org_codes[first_rows]
+
+    # 그룹과 입찰일 순위로 정렬한 키: 키 하나의 이진 탐색으로 "그룹에서 더 늦은 첫 입찰" 조회
+    row_dates = dates[positions]
+    date_ranks = np.unique(row_dates, return_inverse=True)[1].reshape(-1)
+    keys = group_codes.astype(np.int64) * (len(row_dates) + 1) + date_ranks
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    sorted_groups = group_codes[order]
+    group_starts = np.searchsorted(sorted_groups, np.arange(len(group_keys)))
+    group_sizes = np.bincount(group_codes, minlength=len(group_keys))
+    first_dates = row_dates[order[group_starts]]
+
+    def next_rows(rows, target_groups):
+        """rows 각각보다 늦은 target_groups의 첫 입찰 행 (없으면 -1)"""
+        query = target_groups.astype(np.int64) * (len(row_dates) + 1) + date_ranks[rows]
+        next_index = np.searchsorted(sorted_keys, query, side="right")
+        in_range = next_index < len(order)
+        next_index = np.minimum(next_index, len(order) - 1)
+        return np.where(in_range & (sorted_groups[next_index] == target_groups), order[next_index], -1)
+
+    def group_rows(groups):
+        """그룹 목록의 행을 펼친 (그룹 목록 위치, 행) 배열"""
+        counts = group_sizes[groups]
+        list_index = np.repeat(np.arange(len(groups)), counts)
+        offsets = np.arange(len(list_index)) - np.repeat(np.cumsum(counts) - counts, counts)
+        return list_index, order[group_starts[groups][list_index] + offsets]
+
+    # 같은 그룹 안의 다음 입찰 (입찰일을 정수로 다뤄 행별 최솟값 계산, 없으면 최댓값)
+    no_successor = np.iinfo(np.int64).max
+    rows = np.arange(len(row_dates))
+    successor_rows = next_rows(rows, group_codes)
+    best = np.where(successor_rows >= 0, row_dates[successor_rows].view(np.int64), no_successor)
+
+    # 비슷한 공고명 그룹의 다음 입찰 (같은 기관에 그룹이 둘 이상일 때만 비교)
+    pairs, pair_scores = similar_name_pairs(group_orgs, names[first_rows].tolist(), similarity)
+    if len(pairs):
+        sources = np.concatenate([pairs[:, 0], pairs[:, 1]])
+        targets = np.concatenate([pairs[:, 1], pairs[:, 0]])
+        pair_scores = np.concatenate([pair_scores, pair_scores])
+
+        # 입찰마다 더 이른 입찰이 있는 그룹 중 가장 비슷한 그룹의 유사도 (같은 그룹에 이전 입찰이 있으면 1)
+        predecessor_scores = np.where(row_dates > first_dates[group_codes], 1.0, 0.0)
+        pair_index, target_rows = group_rows(targets)
+        earlier = first_dates[sources[pair_index]] < row_dates[target_rows]
+        np.maximum.at(predecessor_scores, target_rows[earlier], pair_scores[pair_index[earlier]])
+
+        # 다른 그룹의 다음 입찰은 그 입찰의 가장 비슷한 이전 그룹일 때만 인정
+        pair_index, source_rows = group_rows(sources)
+        successor_rows = next_rows(source_rows, targets[pair_index])
+        found = successor_rows >= 0
+        found[found] = pair_scores[pair_index[found]] + _EPSILON >= predecessor_scores[successor_rows[found]]
+        np.minimum.at(best, source_rows[found], row_dates[successor_rows[found]].view(np.int64))
+
+    successors[positions] = np.where(best == no_successor, np.datetime64("NaT"), best.view("datetime64[ns]"))
+    return successors
+
+
+def _same_values(left, right):
+    """두 컬럼의 값이 행 순서까지 같은지 확인 (범주 목록이 달라도 값으로 비교)"""
+    if left.dtype == right.dtype:
+        return left.equals(right)
+    return left.astype(object).equals(right.astype(object))
+
+
+def with_successor_dates(df, previous_df=None):
+    """
+    다음 실제 입찰일 컬럼(SUCCESSOR_COLUMN)을 추가한 데이터 프레임 반환
+
+    사용자 입력만 바뀐 게시처럼 previous_df와 행 수와 매칭 컬럼(MATCH_COLUMNS)이 같으면
+    이전 값을 그대로 사용하고, 그렇지 않으면 find_successor_dates로 다시 계산한다.
+
+    Args:
+        df (pandas.DataFrame): 게시할 원본 입찰 데이터
+        previous_df (pandas.DataFrame): 현재 게시된 데이터 (없으면 항상 계산)
+
+    Returns:
+        pandas.DataFrame: SUCCESSOR_COLUMN을 추가한 데이터 프레임 (빈 데이터면 그대로)
+    """
+    if df.empty:
+        return df
+    columns = [col for col in MATCH_COLUMNS if col in df.columns]
+    reusable = (
+        previous_df is not None
+        and SUCCESSOR_COLUMN in previous_df.columns
+        and len(previous_df) == len(df)
+        and all(col in previous_df.columns and _same_values(df[col], previous_df[col]) for col in columns)
+    )
+    if reusable:
+        successors = previous_df[SUCCESSOR_COLUMN].to_numpy(dtype="datetime64[ns]")
+    else:
+        successors = find_successor_dates(df)
+    return df.assign(**{SUCCESSOR_COLUMN: successors})
+
+
+def successor_dates_of(df):
+    """df의 SUCCESSOR_COLUMN 값 (컬럼이 없으면 계산)"""
+    if SUCCESSOR_COLUMN in df.columns:
+        return df[SUCCESSOR_COLUMN].to_numpy(dtype="datetime64[ns]")
+    return find_successor_dates(df)
+
+
+def fulfilled_predictions(cycle_dates, successor_dates, tolerance_days=MATCH_TOLERANCE_DAYS):
+    """
+    예측 행 중 이미 실제 입찰로 채워진 예측 여부
+
+    원본 입찰 이후 같은 공고의 실제 입찰이 예측일 + tolerance_days 이전에 있으면
+    그 예측은 실제 입찰로 이루어졌거나(날짜 차이가 허용 범위 안), 더 늦은 차수라서
+    실제 입찰에서 만든 예측과 겹치므로 숨긴다.
+
+    Args:
+        cycle_dates (numpy.ndarray): 예측 날짜
+        successor_dates (numpy.ndarray): 예측 행별 원본 입찰의 다음 실제 입찰일 (없으면 NaT)
+        tolerance_days (int): 날짜 허용 범위(일)
+
+    Returns:
+        numpy.ndarray: 숨길 예측이면 True
+    """
+    successor_dates = np.asarray(successor_dates, dtype="datetime64[ns]")
+    limit = np.asarray(cycle_dates, dtype="datetime64[ns]") + np.timedelta64(tolerance_days, "D")
+    return ~np.isnat(successor_dates) & (successor_dates <= limit)
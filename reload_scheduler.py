@@ -0,0 +1,108 @@
+import threading
+import time
+
+
+class ReloadScheduler:
+    """
+    데이터 다시 로드(스냅샷 게시) 요청을 모아서 실행하는 단일 작업자
+
+    짧은 시간(merge_window) 안에 들어온 요청은 한 번의 reload로 합쳐지고,
+    reload는 항상 작업자 스레드 하나에서만 실행되므로 동시에 두 번 실행되지 않는다.
+    요청마다 generation이 1씩 증가하며, reload가 끝나면 그 reload가 시작되기 전까지
+    받은 generation까지 처리된 것으로 기록한다. reload가 실패하면 그 generation은
+    다음 요청의 reload가 성공할 때까지 반영되지 않은 것으로 본다 (wait가 False).
+    """
+
+    def __init__(self, reload, merge_window=0.5):
+        """
+        Args:
+            reload (callable): 실제 다시 로드 작업 (작업자 스레드에서 호출)
+            merge_window (float): 첫 요청 후 추가 요청을 모으는 시간(초)
+        """
+        self._reload = reload
+        self.merge_window = merge_window
+        self.generation = 0  # 지금까지 받은 요청 번호
+        self.completed_generation = 0  # reload가 끝난(성공 또는 실패) 요청 번호
+        self.succeeded_generation = 0  # 성공한 reload로 반영된 요청 번호
+        self.triggers_received = 0
+        self.reloads_run = 0
+        self.reloads_failed = 0
+        self.running = False
+        self._cond = threading.Condition()
+        self._thread = None
+
+    def trigger(self):
+        """다시 로드 요청 후 요청 번호 반환 (실제 작업은 작업자 스레드에서 실행)"""
+        with self._cond:
+            self.generation += 1
+            self.triggers_received += 1
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="reload-scheduler", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+            return self.generation
+
+    def wait(self, generation=None, timeout=None):
+        """
+        generation 번 요청까지 reload로 반영될 때까지 대기
+
+        Args:
+            generation (int): 기다릴 요청 번호 (없으면 현재까지 받은 모든 요청)
+            timeout (float): 최대 대기 시간(초)
+
+        Returns:
+            bool: 반영이 끝났으면 True, 시간 초과이거나 그 요청을 처리한 reload가 실패했으면 False
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            if generation is None:
+                generation = self.generation
+            while self.completed_generation < generation:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return self.succeeded_generation >= generation
+
+    def stats(self):
+        """요청/실행/실패 횟수 통계 (reloads_run은 성공한 reload만 셈)"""
+        with self._cond:
+            return {
+                "triggers_received": self.triggers_received,
+                "reloads_run": self.reloads_run,
+                "reloads_failed": self.reloads_failed,
+                "generation": self.generation,
+                "completed_generation": self.completed_generation,
+                "succeeded_generation": self.succeeded_generation,
+                "running": self.running,
+            }
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self.completed_generation >= self.generation:
+                    self._cond.wait()
+
+            # 짧은 시간 동안 들어오는 요청을 모아서 한 번에 처리
+            time.sleep(self.merge_window)
+
+            with self._cond:
+                target = self.generation
+                self.running = True
+
+            try:
+                self._reload()
+                failed = False
+            except Exception as e:
+                print(f"데이터 다시 로드 오류 (요청 {target}까지 반영 안 됨): {e}")
+                failed = True
+
+            with self._cond:
+                if failed:
+                    self.reloads_failed += 1
+                else:
+                    self.reloads_run += 1
+                    self.succeeded_generation = target
+                self.running = False
+                self.completed_generation = target
+                self._cond.notify_all()
@@ -0,0 +1,234 @@
+import json
+import os
+import threading
+import time
+from datetime import datetime
+import pandas as pd
+from snapshot_file import _to_storable
+
+# 공유 스냅샷 파일 형식 버전 (파일 구조가 바뀌면 증가)
+SHARED_FORMAT = 1
+
+MARKER_FILE = "current.json"
+
+# 작업자가 아직 매핑하고 있을 수 있으므로 최근 파일 몇 개는 남겨둠
+KEEP_FILES = 3
+
+
+def write_shared_snapshot(directory, df, data_version):
+    """
+    데이터 프레임을 메모리 매핑용 Arrow IPC 파일(압축 없음)로 저장하고 버전 표시 파일 교체
+
+    데이터 파일을 모두 쓴 뒤 마지막에 current.json을 교체하므로 작업자는
+    항상 완성된 파일만 읽는다. 오래된 파일은 최근 KEEP_FILES개만 남기고 삭제한다
+    (이미 매핑한 작업자는 파일이 삭제되어도 계속 읽을 수 있음).
+
+    Args:
+        directory (str): 공유 디렉터리
+        df (pandas.DataFrame): 게시할 통합 데이터 프레임 (스키마 적용 상태)
+        data_version (int): 로더 프로세스의 스냅샷 버전
+
+    Returns:
+        dict: 버전 표시 정보
+    """
+    import pyarrow as pa
+    from pyarrow import feather
+
+    os.makedirs(directory, exist_ok=True)
+    published_at = datetime.now().strftime("%Y%m%d%H%M%S%f")
+    file_name = f"{published_at}_v{data_version}.arrow"
+    path = os.path.join(directory, file_name)
+    # 압축하지 않고 레코드 배치 하나로 써야 작업자가 컬럼을 이어 붙이지 않고 매핑한 영역을 그대로 사용
+    # (pandas의 str 컬럼은 여러 조각으로 나뉘어 있을 수 있으므로 먼저 합침)
+    table = pa.Table.from_pandas(_to_storable(df), preserve_index=False).combine_chunks()
+    feather.write_feather(table, path + ".tmp", compression="uncompressed", chunksize=max(table.num_rows, 1))
+    os.replace(path + ".tmp", path)
+
+    marker = {
+        "format": SHARED_FORMAT,
+        "file": file_name,
+        "data_version": data_version,
+        "published_at": published_at,
+        "rows": len(df),
+    }
+    marker_path = os.path.join(directory, MARKER_FILE)
+    with open(marker_path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(marker, f, ensure_ascii=False)
+    os.replace(marker_path + ".tmp", marker_path)
+
+    # 이전 파일 정리 (파일명이 게시 시각 순으로 정렬됨)
+    data_files = sorted(name for name in os.listdir(directory) if name.endswith(".arrow"))
+    for name in data_files[:-KEEP_FILES]:
+        try:
+            os.remove(os.path.join(directory, name))
+        except OSError:
+            pass
+    return marker
+
+
+def read_shared_marker(directory):
+    """현재 공유 스냅샷의 버전 표시 정보 반환 (없거나 형식이 다르면 None)"""
+    try:
+        with open(os.path.join(directory, MARKER_FILE), encoding="utf-8") as f:
+            marker = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if marker.get("format") != SHARED_FORMAT:
+        return None
+    return marker
+
+
+def _mapped_category(column):
+    """
+    사전(dictionary) 컬럼을 매핑된 영역을 사용하는 category 컬럼으로 변환
+
+    코드 배열과 범주 문자열을 파이썬 객체로 복사하지 않는다 (범주는 Arrow 기반 str).
+    범주 중복 확인용 해시 색인만 작업자마다 새로 만든다.
+    """
+    import pyarrow as pa
+
+    column = column.combine_chunks() if column.num_chunks != 1 else column.chunk(0)
+    dictionary = column.dictionary
+    if not (pa.types.is_string(dictionary.type) or pa.types.is_large_string(dictionary.type)):
+        return None
+    categories = pd.Index(pd.array(dictionary, dtype="str"))
+    indices = column.indices
+    if indices.null_count:
+        indices = indices.fill_null(-1)
+    codes = indices.to_numpy(zero_copy_only=False)
+    dtype = pd.CategoricalDtype(categories, ordered=column.type.ordered)
+    return pd.Categorical.from_codes(codes, dtype=dtype, validate=False)
+
+
+def map_shared_snapshot(directory, marker):
+    """
+    공유 스냅샷 파일을 메모리 매핑해서 데이터 프레임으로 반환
+
+    숫자, 날짜, 문자열 컬럼과 category 컬럼의 코드/범주 문자열은 매핑된 파일 영역을
+    그대로 사용하므로, 이 데이터는 작업자 수와 관계없이 운영체제 페이지 캐시에 한 번만
+    올라간다. 작업자마다 따로 갖는 것은 category 범주의 해시 색인과, 이 데이터로 만드는
+    연도별 데이터(YearView, 화면 표시 컬럼, 예측 행)이다.
+    컬럼 타입은 파일에 저장된 pandas 정보로 복원된다 (apply_bid_schema 불필요).
+    """
+    import pyarrow as pa
+    from pyarrow import feather
+
+    table = feather.read_table(os.path.join(directory, marker["file"]), memory_map=True)
+    categories = {}
+    for field in table.schema:
+        if pa.types.is_dictionary(field.type):
+            category = _mapped_category(table[field.name])
+            if category is not None:
+                categories[field.name] = category
+    df = table.drop_columns(list(categories)).to_pandas(split_blocks=True)
+    for name, category in categories.items():
+        df[name] = category
+    return df[table.column_names]
+
+
+class SharedSnapshotWriter:
+    """
+    로더 프로세스에서 게시된 스냅샷을 공유 디렉터리에 쓰는 백그라운드 작업
+
+    짧은 시간에 여러 번 게시되면 마지막 스냅샷만 쓴다.
+    SnapshotHolder.subscribe(writer.schedule)로 연결해서 사용한다.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self._latest = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def schedule(self, snapshot):
+        if snapshot.df.empty:
+            return
+        with self._lock:
+            self._latest = snapshot
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._write, name="shared-snapshot-writer", daemon=True)
+                self._thread.start()
+
+    def _write(self):
+        while True:
+            with self._lock:
+                snapshot, self._latest = self._latest, None
+                if snapshot is None:
+                    self._thread = None
+                    return
+            try:
+                marker = write_shared_snapshot(self.directory, snapshot.df, snapshot.version)
+                print(f"공유 스냅샷 게시 완료: {marker['rows']}건 (버전 {snapshot.version})")
+            except Exception as e:
+                print(f"공유 스냅샷 쓰기 오류: {e}")
+
+
+class SharedSnapshotFollower:
+    """
+    gunicorn 작업자에서 공유 스냅샷의 버전 표시 파일을 확인하고,
+    새 파일이 게시되면 매핑해서 SnapshotHolder에 게시하는 작업
+
+    작업자는 Firebase 리스너를 열지 않고 로더 프로세스가 게시한 데이터만 사용한다.
+    한 작업자에서 수정한 사용자 입력은 그 작업자의 스냅샷에만 바로 반영되고, 다른 작업자는
+    로더가 Firebase 변경을 받아 새 파일을 게시한 뒤에 보게 된다 (보통 몇 초 이내).
+    """
+
+    def __init__(self, directory, snapshots, interval=1.0, on_switch=None):
+        """
+        Args:
+            directory (str): 공유 디렉터리
+            snapshots (SnapshotHolder): 작업자의 스냅샷 보관소
+            interval (float): 버전 표시 파일 확인 간격(초)
+            on_switch (callable): 새 스냅샷으로 바꾼 뒤 on_switch(marker, 걸린 시간)을 호출
+        """
+        self.directory = directory
+        self.snapshots = snapshots
+        self.interval = interval
+        self.on_switch = on_switch
+        self.current_file = None
+        self.switches = 0
+        self._thread = None
+
+    def poll(self):
+        """새로 게시된 파일이 있으면 매핑해서 게시 (바꿨으면 True)"""
+        marker = read_shared_marker(self.directory)
+        if marker is None or marker["file"] == self.current_file:
+            return False
+        start = time.perf_counter()
+        try:
+            df = map_shared_snapshot(self.directory, marker)
+        except (OSError, ValueError) as e:
+            # 표시 파일을 읽은 뒤 데이터 파일이 정리된 경우 다음 확인 때 다시 시도
+            print(f"공유 스냅샷을 읽을 수 없습니다: {e}")
+            return False
+        self.snapshots.publish(df)
+        self.current_file = marker["file"]
+        self.switches += 1
+        if self.on_switch is not None:
+            self.on_switch(marker, time.perf_counter() - start)
+        print(f"공유 스냅샷으로 전환: {marker['rows']}건 (로더 버전 {marker['data_version']}, 작업자 버전 {self.snapshots.version})")
+        return True
+
+    def wait_first(self, timeout):
+        """첫 공유 스냅샷을 게시할 때까지 최대 timeout초 대기 (게시되면 True)"""
+        deadline = time.monotonic() + timeout
+        while not self.poll():
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(min(self.interval, 0.2))
+        return True
+
+    def start(self):
+        """백그라운드에서 주기적으로 새 버전 확인"""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="shared-snapshot-follower", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            time.sleep(self.interval)
+            try:
+                self.poll()
+            except Exception as e:
+                print(f"공유 스냅샷 확인 오류: {e}")
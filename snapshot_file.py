@@ -0,0 +1,191 @@
+import json
+import os
+import threading
+from datetime import datetime
+import pandas as pd
+from bid_schema import apply_bid_schema, prediction_mask
+
+# 로컬 스냅샷 파일 형식 버전 (파일 구조가 바뀌면 증가)
+# 3: 예측은 연도별로 조회할 때 만들므로 원본 행만 한 파일로 저장
+SNAPSHOT_FORMAT = 3
+
+BASE_FILE = "bids.parquet"
+META_FILE = "snapshot.json"
+
+
+def _to_storable(df):
+    """
+    Parquet으로 저장할 수 있도록 컬럼 타입 정리
+
+    Firebase 원본 값은 한 컬럼에 숫자와 빈 문자열이 섞여 있을 수 있으므로,
+    여러 타입이 섞인 object 컬럼만 문자열로 저장한다 (결측값은 유지).
+    """
+    df = df.reset_index(drop=True).copy()
+    for col in df.columns:
+        if df[col].dtype != object:
+            continue
+        types = {type(value) for value in df[col].dropna()}
+        if len(types) > 1:
+            df[col] = df[col].map(lambda value: value if pd.isna(value) else str(value))
+    return df
+
+
+def _saved_files(directory):
+    """현재 버전 정보가 가리키는 데이터 파일 목록 (이전 형식 포함, 정리용)"""
+    try:
+        with open(os.path.join(directory, META_FILE), encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return []
+    return list(meta.get("files", {}).values())
+
+
+def save_snapshot(directory, df, data_version):
+    """
+    원본 데이터 프레임을 로컬 Parquet 파일로 저장
+
+    예측 행은 연도별로 조회할 때 원본 행에서 다시 만들므로 원본 행만 저장한다
+    (이전 형식 데이터에 남은 예측 행도 제외).
+    데이터 파일을 쓴 뒤 마지막에 버전 정보(snapshot.json)를 교체하므로,
+    저장 도중 중단되어도 이전 스냅샷은 그대로 남는다.
+
+    Args:
+        directory (str): 저장 디렉터리
+        df (pandas.DataFrame): 게시된 스냅샷의 데이터 프레임
+        data_version (int): 저장하는 데이터의 스냅샷 버전
+
+    Returns:
+        dict: 저장된 버전 정보
+    """
+    os.makedirs(directory, exist_ok=True)
+    saved_at = datetime.now().strftime("%Y%m%d%H%M%S%f")
+
+    base = df[~prediction_mask(df)] if not df.empty else df
+    # 버전별 파일명으로 쓰고 메타 정보가 교체된 뒤에만 사용됨
+    file_name = f"{saved_at}_{BASE_FILE}"
+    _to_storable(base).to_parquet(os.path.join(directory, file_name), index=False)
+    files = {BASE_FILE: file_name}
+
+    meta = {
+        "format": SNAPSHOT_FORMAT,
+        "data_version": data_version,
+        "saved_at": saved_at,
+        "rows": len(base),
+        "files": files,
+    }
+    meta_path = os.path.join(directory, META_FILE)
+    with open(meta_path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False)
+    previous = _saved_files(directory)
+    os.replace(meta_path + ".tmp", meta_path)
+
+    # 이전 스냅샷 파일 정리 (이전 형식의 예측 파일 포함)
+    for previous_file in previous:
+        if previous_file not in files.values():
+            try:
+                os.remove(os.path.join(directory, previous_file))
+            except OSError:
+                pass
+    return meta
+
+
+def read_snapshot_meta(directory):
+    """저장된 스냅샷의 버전 정보 반환 (없거나 형식이 다르면 None)"""
+    try:
+        with open(os.path.join(directory, META_FILE), encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if meta.get("format") != SNAPSHOT_FORMAT:
+        return None
+    return meta
+
+
+def load_snapshot(directory):
+    """
+    로컬 스냅샷 파일에서 통합 데이터 프레임을 읽어옴
+
+    Returns:
+        tuple: (데이터 프레임, 버전 정보) 또는 스냅샷이 없으면 (None, None)
+    """
+    meta = read_snapshot_meta(directory)
+    if meta is None:
+        return None, None
+    try:
+        df = pd.read_parquet(os.path.join(directory, meta["files"][BASE_FILE]))
+    except (OSError, ImportError, ValueError, KeyError) as e:
+        print(f"로컬 스냅샷을 읽을 수 없습니다: {e}")
+        return None, None
+    df = apply_bid_schema(df) if not df.empty else pd.DataFrame()
+    return df, meta
+
+
+class SnapshotPersister:
+    """
+    게시된 스냅샷을 로컬 파일로 저장하는 백그라운드 작업
+
+    짧은 시간에 여러 번 게시되면 마지막 스냅샷만 저장한다.
+    SnapshotHolder.subscribe(persister.schedule)로 연결해서 사용한다.
+    """
+
+    def __init__(self, directory, delay=5.0):
+        self.directory = directory
+        self.delay = delay
+        self._latest = None
+        self._timer = None
+        self._lock = threading.Lock()
+        self.enabled = True
+
+    def schedule(self, snapshot):
+        if not self.enabled or snapshot.df.empty:
+            return
+        with self._lock:
+            self._latest = snapshot
+            if self._timer is None:
+                self._timer = threading.Timer(self.delay, self._save)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _save(self):
+        with self._lock:
+            snapshot, self._latest, self._timer = self._latest, None, None
+        try:
+            meta = save_snapshot(self.directory, snapshot.df, snapshot.version)
+            print(f"로컬 스냅샷 저장 완료: {meta['rows']}건 (버전 {snapshot.version})")
+        except ImportError as e:
+            # pyarrow가 없는 환경에서는 로컬 스냅샷 기능 사용 안 함
+            print(f"로컬 스냅샷 저장 기능을 사용할 수 없습니다: {e}")
+            self.enabled = False
+        except Exception as e:
+            print(f"로컬 스냅샷 저장 오류: {e}")
+
+
+def start_from_snapshot(snapshots, directory, reconcile):
+    """
+    로컬 스냅샷이 있으면 즉시 게시하고 Firebase 동기화는 백그라운드에서 실행
+
+    Args:
+        snapshots (SnapshotHolder): 콜백이 공유하는 스냅샷 보관소
+        directory (str): 로컬 스냅샷 디렉터리
+        reconcile (callable): Firebase에서 최신 데이터를 받아 게시하는 함수
+
+    Returns:
+        dict: 사용한 로컬 스냅샷의 버전 정보 (없으면 None, 이 경우 reconcile을 바로 실행)
+    """
+    df, meta = load_snapshot(directory)
+    if df is None or df.empty:
+        reconcile()
+        return None
+
+    snapshots.publish(df)
+    print(f"로컬 스냅샷으로 시작: {len(df)}건 (저장 시각 {meta['saved_at']}, 버전 {meta['data_version']})")
+
+    def run_reconcile():
+        try:
+            reconcile()
+        except Exception as e:
+            # 네트워크가 없어도 로컬 스냅샷으로 계속 서비스
+            print(f"Firebase 동기화 실패, 로컬 스냅샷으로 계속 서비스합니다: {e}")
+
+    threading.Thread(target=run_reconcile, name="firebase-reconcile", daemon=True).start()
+    return meta
@@ -0,0 +1,222 @@
+import re
+import numpy as np
+import pandas as pd
+
+# DataTable filter_query 문법을 pandas 마스크로 변환하는 모듈
+# 예: '{평균M/M} = 0 || {평균M/M} is blank', '{공고명} icontains 콜센터 && {용역기간(개월)} >= 12'
+
+_TOKEN_RE = re.compile(r"""
+    \s*(?:
+        (?P<column>\{(?:[^{}]|\\[{}])*\})
+      | (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*'|`(?:[^`\\]|\\.)*`)
+      | (?P<logical>&&|\|\|)
+      | (?P<paren>[()])
+      | (?P<operator>>=|<=|!=|=|>|<|!)
+      | (?P<word>[^\s(){}"'`]+)
+    )
+""", re.VERBOSE)
+
+_RELATIONAL_OPERATORS = {
+    "=": "eq", "eq": "eq",
+    "!=": "ne", "ne": "ne",
+    "<": "lt", "lt": "lt",
+    "<=": "le", "le": "le",
+    ">": "gt", "gt": "gt",
+    ">=": "ge", "ge": "ge",
+    "contains": "contains",
+    "datestartswith": "datestartswith",
+}
+
+_UNARY_OPERATORS = ("blank", "nil", "bool", "even", "odd", "num", "object", "str")
+
+
+class FilterQueryError(ValueError):
+    """filter_query를 해석할 수 없을 때 발생"""
+
+
+def _tokenize(query):
+    tokens = []
+    position = 0
+    query = query.strip()
+    while position < len(query):
+        match = _TOKEN_RE.match(query, position)
+        if not match or match.end() == position:
+            raise FilterQueryError(f"해석할 수 없는 필터: {query[position:]}")
+        position = match.end()
+        kind = match.lastgroup
+        tokens.append((kind, match.group(kind)))
+    return tokens
+
+
+def _unquote(value):
+    if len(value) >= 2 and value[0] in "\"'`" and value[-1] == value[0]:
+        return re.sub(r"\\(.)", r"\1", value[1:-1])
+    return value
+
+
+class _Parser:
+    def __init__(self, df, tokens, case_insensitive_columns):
+        self.df = df
+        self.tokens = tokens
+        self.position = 0
+        self.case_insensitive_columns = set(case_insensitive_columns)
+
+    def peek(self):
+        return self.tokens[self.position] if self.position < len(self.tokens) else (None, None)
+
+    def take(self):
+        token = self.peek()
+        self.position += 1
+        return token
+
+    def parse(self):
+        mask = self.parse_or()
+        if self.position < len(self.tokens):
+            raise FilterQueryError(f"필터 끝에 해석할 수 없는 부분: {self.tokens[self.position][1]}")
+        return mask
+
+    def parse_or(self):
+        mask = self.parse_and()
+        while self._is_logical("||", "or"):
+            self.take()
+            mask = mask | self.parse_and()
+        return mask
+
+    def parse_and(self):
+        mask = self.parse_unary()
+        while self._is_logical("&&", "and"):
+            self.take()
+            mask = mask & self.parse_unary()
+        return mask
+
+    def _is_logical(self, symbol, word):
+        kind, value = self.peek()
+        return (kind == "logical" and value == symbol) or (kind == "word" and value.lower() == word)
+
+    def parse_unary(self):
+        kind, value = self.peek()
+        if (kind == "operator" and value == "!") or (kind == "word" and value.lower() == "not"):
+            self.take()
+            return ~self.parse_unary()
+        if kind == "paren" and value == "(":
+            self.take()
+            mask = self.parse_or()
+            if self.take() != ("paren", ")"):
+                raise FilterQueryError("괄호가 닫히지 않았습니다.")
+            return mask
+        return self.parse_relational()
+
+    def parse_relational(self):
+        kind, value = self.take()
+        if kind != "column":
+            raise FilterQueryError(f"컬럼이 필요합니다: {value}")
+        column = value[1:-1].replace("\\{", "{").replace("\\}", "}")
+        if column not in self.df.columns:
+            raise FilterQueryError(f"알 수 없는 컬럼: {column}")
+        series = self.df[column]
+
+        kind, operator = self.take()
+        if operator is None:
+            raise FilterQueryError(f"연산자가 필요합니다: {column}")
+
+        if operator.lower() == "is":
+            _, unary = self.take()
+            return self._unary(series, (unary or "").lower())
+
+        operator = operator.lower()
+        case = None
+        if operator not in _RELATIONAL_OPERATORS and operator[:1] in ("i", "s"):
+            case, operator = operator[0], operator[1:]
+        if operator not in _RELATIONAL_OPERATORS:
+            raise FilterQueryError(f"지원하지 않는 연산자: {operator}")
+
+        value_kind, raw_value = self.take()
+        if raw_value is None:
+            raise FilterQueryError(f"비교할 값이 필요합니다: {column}")
+        case_insensitive = case == "i" or (case is None and column in self.case_insensitive_columns)
+        return self._relational(series, _RELATIONAL_OPERATORS[operator], _unquote(raw_value),
+                                value_kind == "string", case_insensitive)
+
+    @staticmethod
+    def _unary(series, unary):
+        if unary == "blank":
+            return (series.isna() | (series.astype(str).str.strip() == "")).to_numpy()
+        if unary == "nil":
+            return series.isna().to_numpy()
+        numbers = pd.to_numeric(series, errors="coerce")
+        if unary == "num":
+            return numbers.notna().to_numpy()
+        if unary == "str":
+            return series.map(lambda value: isinstance(value, str)).to_numpy()
+        if unary == "bool":
+            return series.map(lambda value: isinstance(value, (bool, np.bool_))).to_numpy()
+        if unary == "object":
+            return series.map(lambda value: isinstance(value, (dict, list))).to_numpy()
+        if unary in ("even", "odd"):
+            remainder = 0 if unary == "even" else 1
+            return (numbers.notna() & (numbers % 2 == remainder)).to_numpy()
+        raise FilterQueryError(f"지원하지 않는 조건: is {unary}")
+
+    @staticmethod
+    def _relational(series, operator, value, quoted, case_insensitive):
+        if operator in ("contains", "datestartswith"):
+            text = series.astype(str).where(series.notna(), "")
+            if case_insensitive:
+                text, value = text.str.lower(), value.lower()
+            if operator == "contains":
+                return text.str.contains(value, regex=False).to_numpy()
+            return text.str.startswith(value).to_numpy()
+
+        # 숫자 컬럼이고 값도 숫자면 숫자로 비교, 그렇지 않으면 문자열로 비교
+        number = pd.to_numeric(pd.Series([value]), errors="coerce").iloc[0]
+        if pd.api.types.is_numeric_dtype(series) and pd.notna(number) and not quoted:
+            left, right = series, number
+        else:
+            left = series.astype(str).where(series.notna(), "")
+            right = value
+            if case_insensitive:
+                left, right = left.str.lower(), right.lower()
+
+        if operator == "eq":
+            mask = left == right
+        elif operator == "ne":
+            mask = left != right
+        elif operator == "lt":
+            mask = left < right
+        elif operator == "le":
+            mask = left <= right
+        elif operator == "gt":
+            mask = left > right
+        else:
+            mask = left >= right
+        return mask.fillna(False).to_numpy(dtype=bool)
+
+
+def filter_query_mask(df, query, case_insensitive_columns=()):
+    """
+    DataTable filter_query 문자열을 df 행에 대한 boolean 마스크로 변환
+
+    Args:
+        df (pandas.DataFrame): 필터링할 데이터 (컬럼명은 테이블 컬럼 id)
+        query (str): DataTable filter_query ('&&', '||', '!', 괄호, 'is blank' 등 지원)
+        case_insensitive_columns (iterable): 대소문자 구분 없이 비교할 컬럼 목록
+
+    Returns:
+        numpy.ndarray: 조건을 만족하는 행은 True
+    """
+    if not query or not query.strip():
+        return np.ones(len(df), dtype=bool)
+    return np.asarray(_Parser(df, _tokenize(query), case_insensitive_columns).parse(), dtype=bool)
+
+
+def sort_frame(df, sort_by):
+    """DataTable sort_by([{'column_id': ..., 'direction': 'asc'|'desc'}])로 정렬 (빈 값은 마지막)"""
+    sort_by = [item for item in (sort_by or []) if item.get("column_id") in df.columns]
+    if not sort_by:
+        return df
+    return df.sort_values(
+        by=[item["column_id"] for item in sort_by],
+        ascending=[item.get("direction", "asc") == "asc" for item in sort_by],
+        kind="mergesort",
+        na_position="last",
+    )
@@ -0,0 +1,82 @@
+import pandas as pd
+
+from data_store import BidStore, SnapshotHolder, apply_user_input_overlay
+from preprocess import predictions_for_year
+
+
+def make_year(year, names):
+    return {
+        "01": {
+            f"bid_{year}_{i}": {
+                "공고명": name,
+                "채권자명": "기관A",
+                "입찰일시": f"{year}-01-15 10:00:00",
+                "용역기간(개월)": 12,
+            }
+            for i, name in enumerate(names)
+        }
+    }
+
+
+def test_year_events_publish_before_all_years_loaded():
+    store = BidStore()
+    store.set_year_keys(["2023", "2024", "2025"])
+    store.apply_user_inputs_event("put", "/", None)
+    assert not store.publishable
+
+    store.apply_year_event("2024", "put", "/", make_year(2024, ["콜센터 위탁 운영 용역"]))
+    assert store.publishable and not store.bids_loaded
+
+    # 아직 받지 않은 연도는 이전 스냅샷의 행을 유지하고, 받은 연도는 저장소 데이터로 교체
+    previous = BidStore()
+    previous.reset({"2023": make_year(2023, ["상담센터 운영"]), "2024": make_year(2024, ["이전 공고"])}, {})
+    merged = store.to_dataframe(previous.to_dataframe())
+    assert sorted(merged["공고명"].tolist()) == ["상담센터 운영", "콜센터 위탁 운영 용역"]
+
+    store.apply_year_event("2023", "put", "/", make_year(2023, ["상담센터 운영"]))
+    store.apply_year_event("2025", "put", "/", None)
+    assert store.loaded
+    assert store.wait_years(["2023", "2024"], timeout=0)
+    # 모든 연도를 받은 뒤에는 저장소 데이터만 사용
+    assert len(store.to_dataframe(previous.to_dataframe())) == 2
+
+    # 연도 리스너의 하위 경로 이벤트도 해당 연도 아래에 반영
+    store.apply_year_event("2024", "patch", "/01", {"bid_new": {"공고명": "신규 공고", "채권자명": "기관B"}})
+    assert "신규 공고" in store.to_dataframe()["공고명"].tolist()
+
+
+def test_user_input_overlay_accepts_fractions_for_int_columns():
+    # Parquet 스냅샷이나 공유 스냅샷 작업자에서는 저장소 없이 현재 데이터에 직접 반영
+    store = BidStore()
+    df = store.reset({"2024": make_year(2024, ["콜센터 운영", "상담센터 운영"])}, {})
+    df["용역기간(개월)"] = df["용역기간(개월)"].astype("int64")
+    df["물동량 평균"] = pd.Series([10, 20], dtype="int64")
+    bid_id = df["bid_id"].iloc[0]
+
+    edited = apply_user_input_overlay(df, {bid_id: {"용역기간(개월)": 3.5, "물동량 평균": "7"}})
+    assert edited["용역기간(개월)"].tolist() == [3.5, 12.0]
+    assert edited["물동량 평균"].tolist() == [7.0, 20.0]
+    assert str(edited["bid_id"].dtype) == "category"
+    # 원본 데이터 프레임은 그대로
+    assert df["용역기간(개월)"].tolist() == [12, 12]
+
+
+def test_prediction_rows_are_flagged_and_linked_to_source_bid():
+    store = BidStore()
+    df = store.reset({"2024": make_year(2024, ["수요예측 시스템 운영", "콜센터 운영 (2차 예측)"])}, {})
+    # 공고명에 "예측"이 들어간 실제 입찰은 원본, 차수 표시가 붙은 이전 형식 행만 예측
+    assert df["is_prediction"].tolist() == [False, True]
+
+    predictions = predictions_for_year(df[~df["is_prediction"]], 2025)
+    assert predictions["is_prediction"].all()
+    assert predictions["base_bid_id"].tolist() == [df["bid_id"].iloc[0]]
+
+
+def test_upcoming_months_stop_at_limit():
+    df = BidStore().reset({"2024": make_year(2024, ["콜센터 운영"])}, {})
+    snapshots = SnapshotHolder(df, prediction_years=40)
+    snapshot = snapshots.current()
+
+    # 12개월 주기 예측이므로 3개 년월은 3개 연도만 만들면 충분 (먼 예측 연도는 만들지 않음)
+    assert snapshot.upcoming_months_from("2025-01", limit=3) == ["2025-01", "2026-01", "2027-01"]
+    assert len(snapshots.year_cache) == 3 and (snapshot.version, 2028) not in snapshots.year_cache
@@ -0,0 +1,66 @@
+import data_loader
+from data_loader import FirebaseLoader
+from data_store import SnapshotHolder
+
+
+class FakeRegistration:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class FakeReference:
+    def __init__(self, db, path):
+        self.db = db
+        self.path = path
+
+    def get(self, shallow=False):
+        node = self.db.tree
+        for segment in self.path.strip("/").split("/"):
+            node = (node or {}).get(segment) if segment else node
+        if shallow and isinstance(node, dict):
+            return {key: True for key in node}
+        return node
+
+    def listen(self, callback):
+        registration = FakeRegistration()
+        self.db.listeners[self.path] = registration
+        callback(type("Event", (), {"event_type": "put", "path": "/", "data": self.get()})())
+        return registration
+
+
+class FakeDb:
+    def __init__(self, tree):
+        self.tree = tree
+        self.listeners = {}
+
+    def reference(self, path):
+        return FakeReference(self, path)
+
+
+def make_year(year, name):
+    return {"01": {f"bid_{year}": {"공고명": name, "채권자명": "기관A", "입찰일시": f"{year}-01-15 10:00:00"}}}
+
+
+def test_removed_year_is_closed_and_dropped(monkeypatch):
+    fake_db = FakeDb({"bids": {"2024": make_year(2024, "콜센터 운영"), "2025": make_year(2025, "상담센터 운영")}})
+    monkeypatch.setattr(data_loader, "db", fake_db)
+    loader = FirebaseLoader(SnapshotHolder(), merge_window=0, listener_load_timeout=1)
+    loader.bid_store.set_year_keys(loader.list_year_keys())
+    loader.bid_store.apply_user_inputs_event("put", "/", None)
+    for year in ("2024", "2025"):
+        loader.listen_year(year)
+    assert sorted(loader.bid_store.to_dataframe()["공고명"]) == ["상담센터 운영", "콜센터 운영"]
+
+    # /bids/2024가 삭제되면 다음 목록 확인에서 리스너를 닫고 그 연도의 행을 제거
+    del fake_db.tree["bids"]["2024"]
+    added, removed = loader.refresh_year_keys()
+    assert (added, removed) == ([], ["2024"])
+    assert fake_db.listeners["/bids/2024"].closed
+    assert not fake_db.listeners["/bids/2025"].closed
+    assert loader.bid_store.to_dataframe()["공고명"].tolist() == ["상담센터 운영"]
+    # 삭제 반영은 다시 로드 작업자가 게시
+    assert loader.reload_scheduler.wait(timeout=5)
+    assert loader.snapshots.current().df["공고명"].tolist() == ["상담센터 운영"]
@@ -0,0 +1,232 @@
+import json
+import os
+import threading
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("firebase_admin")
+
+from migrate_to_firebase import (
+    InMemoryDatabase, Manifest, iter_batches, iter_bid_records, parse_args, plan_sync,
+    run_full_upload, send_batch, stable_bid_id,
+)
+
+COLUMNS = ["입찰일시", "실수요기관", "공고명", "계약 기간 내", "물동량 평균", "용역기간(개월)"]
+
+
+def make_rows(count):
+    return [
+        [f"2024-{month:02d}-10 10:00:00", f"기관{i % 3}", f"콜센터 운영 용역 {i}", f"{i},000,000", "1,200", 12]
+        for i, month in zip(range(count), [1, 1, 2, 2, 3, 3, 4, 4, 5, 5, 6, 6])
+    ]
+
+
+def write_csv(path, rows):
+    pd.DataFrame(rows, columns=COLUMNS).to_csv(path, index=False)
+    return str(path)
+
+
+def records_of(csv_file):
+    return list(iter_bid_records(csv_file, chunk_size=4))
+
+
+def upload_tree(records):
+    """전체 업로드와 같은 원격 트리 (InMemoryDatabase)"""
+    database = InMemoryDatabase()
+    payload = {}
+    for bid_id, year, month, base_data, user_data in records:
+        payload[f"bids/{year}/{month}/{bid_id}"] = base_data
+        payload[f"user_inputs/{bid_id}"] = user_data
+    database.reference('/').update(payload)
+    return database
+
+
+def manifest_of(records):
+    manifest = Manifest(None)
+    for record in records:
+        manifest.add(*record)
+    return manifest
+
+
+def sorted_tree(node):
+    """Firebase get()처럼 키 순서로 정렬한 트리"""
+    if not isinstance(node, dict):
+        return node
+    return {key: sorted_tree(node[key]) for key in sorted(node)}
+
+
+def apply_changes(database, changes):
+    if changes:
+        database.reference('/').update(dict(changes))
+
+
+def test_reordered_rows_keep_ids_and_plan_nothing(tmp_path):
+    rows = make_rows(12)
+    original = records_of(write_csv(tmp_path / "a.csv", rows))
+    reordered = records_of(write_csv(tmp_path / "b.csv", rows[::-1]))
+    assert sorted(record[0] for record in original) == sorted(record[0] for record in reordered)
+    assert original[0][0] == stable_bid_id("기관0", "콜센터 운영 용역 0", "2024-01-10 10:00:00")
+
+    changes, _, counts = plan_sync(reordered, manifest_of(original))
+    assert changes == []
+    assert counts == {'inserted': 0, 'changed': 0, 'deleted': 0, 'unchanged': 12}
+
+
+def test_edited_row_replaces_only_its_bid(tmp_path):
+    rows = make_rows(12)
+    original = records_of(write_csv(tmp_path / "a.csv", rows))
+    rows[4][3] = "9,999"
+    edited = records_of(write_csv(tmp_path / "b.csv", rows))
+
+    changes, _, counts = plan_sync(edited, manifest_of(original))
+    bid_id = original[4][0]
+    assert [path for path, _ in changes] == [f"bids/2024/03/{bid_id}"]
+    assert changes[0][1]["계약 기간 내"] == "9,999"
+    assert counts['changed'] == 1 and counts['unchanged'] == 11
+
+
+def test_moved_and_removed_rows_delete_old_paths(tmp_path):
+    rows = make_rows(12)
+    original = records_of(write_csv(tmp_path / "a.csv", rows))
+    database = upload_tree(original)
+
+    # 입찰일시가 바뀌면 ID도 바뀌므로 원본 행을 그대로 두고 다른 달 경로만 비교
+    moved_id, removed_id = original[0][0], original[11][0]
+    moved = [list(record) for record in original[:11]]
+    moved[0][2] = "05"
+    changes, updated, counts = plan_sync([tuple(record) for record in moved], manifest_of(original))
+    assert (f"bids/2024/01/{moved_id}", None) in changes
+    assert f"bids/2024/05/{moved_id}" in dict(changes)
+    assert (f"bids/2024/06/{removed_id}", None) in changes
+    assert (f"user_inputs/{removed_id}", None) in changes
+    assert counts == {'inserted': 0, 'changed': 1, 'deleted': 1, 'unchanged': 10}
+
+    apply_changes(database, changes)
+    assert moved_id not in database.tree["bids"]["2024"]["01"]
+    assert moved_id in database.tree["bids"]["2024"]["05"]
+    assert removed_id not in database.tree["bids"]["2024"].get("06", {})
+    assert removed_id not in database.tree["user_inputs"]
+    assert updated.records[moved_id]["path"] == "2024/05"
+
+
+def test_legacy_ids_migrate_with_dashboard_edits(tmp_path):
+    rows = make_rows(12)
+    # 같은 기관/공고명/입찰일시가 반복되는 행 (2번, 10번)
+    rows[10] = list(rows[2])
+    csv_file = write_csv(tmp_path / "a.csv", rows)
+    records = records_of(csv_file)
+
+    # 이전 형식 ID(bid_{행 번호}_{공고명})로 저장된 원격 트리, 중복 행은 대시보드에서 각각 수정
+    legacy = [(f"bid_{i}_{record[3]['공고명'][:5]}",) + record[1:] for i, record in enumerate(records)]
+    database = upload_tree(legacy)
+    for i, volume in ((2, 111.0), (10, 222.0)):
+        database.reference(f"user_inputs/{legacy[i][0]}").update({"물동량 평균": volume, "수정자": "dashboard"})
+
+    remote = Manifest.from_remote(
+        None, sorted_tree(database.reference('/bids').get()), sorted_tree(database.reference('/user_inputs').get())
+    )
+    changes, updated, counts = plan_sync(records, remote)
+    apply_changes(database, changes)
+    assert counts['inserted'] == 12 and counts['deleted'] == 12
+
+    bids = {bid_id for months in database.tree["bids"].values() for bids in months.values() for bid_id in bids}
+    assert bids == {record[0] for record in records}
+    assert set(database.tree["user_inputs"]) == bids
+
+    # 중복 행의 번호는 CSV 행 순서 기준 (bid_10_이 bid_2_보다 먼저 정렬되어도 바뀌지 않음)
+    first, second = records[2][0], records[10][0]
+    assert second == f"{first}_1"
+    assert database.tree["user_inputs"][first]["물동량 평균"] == 111.0
+    assert database.tree["user_inputs"][second]["물동량 평균"] == 222.0
+    assert database.tree["user_inputs"][records[0][0]]["수정자"] == "initial_import"
+
+    # 옮긴 뒤 다시 동기화하면 변경 없음
+    changes, _, _ = plan_sync(records, updated)
+    assert changes == []
+
+
+class FlakyReference:
+    """fail_after번 성공한 뒤부터 update()가 실패하는 루트 참조 (failures번 실패하면 다시 성공)"""
+
+    def __init__(self, reference, fail_after=0, failures=None):
+        self.reference = reference
+        self.fail_after = fail_after
+        self.failures = failures
+        self.calls = 0
+        self.failed = 0
+        self._lock = threading.Lock()
+
+    def update(self, payload):
+        with self._lock:
+            self.calls += 1
+            failing = self.calls > self.fail_after and (self.failures is None or self.failed < self.failures)
+            if failing:
+                self.failed += 1
+        if failing:
+            raise ConnectionError("네트워크 오류")
+        self.reference.update(payload)
+
+
+def without_timestamps(tree):
+    """실행 시각이 들어가는 마지막_수정일을 뺀 트리"""
+    return {
+        **tree,
+        "user_inputs": {
+            bid_id: {key: value for key, value in data.items() if key != "마지막_수정일"}
+            for bid_id, data in tree.get("user_inputs", {}).items()
+        },
+    }
+
+
+def upload_args(tmp_path, csv_file):
+    return parse_args([
+        "--csv", csv_file, "--batch-size", "2", "--workers", "2", "--chunk-size", "5",
+        "--checkpoint", str(tmp_path / "checkpoint.json"), "--manifest", str(tmp_path / "manifest.json"),
+        "--max-retries", "1", "--retry-delay", "0",
+    ])
+
+
+def test_interrupted_upload_resumes_from_checkpoint(tmp_path, monkeypatch):
+    csv_file = write_csv(tmp_path / "bids.csv", make_rows(12) * 2)
+    args = upload_args(tmp_path, csv_file)
+    monkeypatch.setattr("builtins.input", lambda prompt: "n")
+
+    # 배치 키는 실행할 때마다 같음
+    keys = [key for key, _ in iter_batches(iter_bid_records(csv_file, 5), 2)]
+    assert keys == [key for key, _ in iter_batches(iter_bid_records(csv_file, 5), 2)]
+    assert len(keys) == len(set(keys)) == 12
+
+    clean = InMemoryDatabase()
+    run_full_upload(args, clean.reference)
+    assert not os.path.exists(args.checkpoint)
+    os.remove(args.manifest)
+
+    database = InMemoryDatabase()
+    flaky = FlakyReference(database.reference('/'), fail_after=5)
+    with pytest.raises(RuntimeError):
+        run_full_upload(args, lambda path: flaky if path == '/' else database.reference(path))
+    with open(args.checkpoint, encoding="utf-8") as f:
+        completed = json.load(f)["completed"]
+    assert len(completed) == database.updates and 0 < len(completed) < len(keys)
+
+    # 다시 실행하면 완료된 배치는 건너뛰고 나머지만 전송
+    before = database.updates
+    run_full_upload(args, database.reference)
+    assert database.updates - before == len(keys) - len(completed)
+    assert without_timestamps(database.tree) == without_timestamps(clean.tree)
+    assert not os.path.exists(args.checkpoint)
+
+
+def test_send_batch_retries_then_gives_up():
+    database = InMemoryDatabase()
+    flaky = FlakyReference(database.reference('/'), failures=2)
+    send_batch(flaky, {"bids/2024/01/bid_1": {"공고명": "콜센터"}}, max_retries=2, retry_delay=0)
+    assert flaky.calls == 3
+    assert database.tree["bids"]["2024"]["01"]["bid_1"] == {"공고명": "콜센터"}
+
+    flaky = FlakyReference(database.reference('/'))
+    with pytest.raises(ConnectionError):
+        send_batch(flaky, {"bids/2024/01/bid_2": {"공고명": "상담"}}, max_retries=2, retry_delay=0)
+    assert flaky.calls == 3
+    assert "bid_2" not in database.tree["bids"]["2024"]["01"]
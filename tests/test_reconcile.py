@@ -0,0 +1,117 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bid_schema import apply_bid_schema
+from data_store import BidStore, SnapshotHolder, apply_user_input_overlay
+from preprocess import CSV_COLUMN_DTYPES, clean_bid_rows, predictions_for_year
+from reconcile import SUCCESSOR_COLUMN, find_successor_dates, fulfilled_predictions, with_successor_dates
+from snapshot_file import load_snapshot, save_snapshot
+
+SOURCE_CSV = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "DB", "2324List.csv")
+
+
+def make_bids(rows):
+    return pd.DataFrame(rows, columns=["실수요기관", "공고명", "예상_입찰일"]).assign(
+        예상_입찰일=lambda df: pd.to_datetime(df["예상_입찰일"])
+    )
+
+
+def test_next_year_bid_fulfills_prediction():
+    df = make_bids([
+        ("기관A", "2024년 종합상담 콜센터 운영 용역", "2024-01-10"),
+        ("기관A", "2025년 종합상담 콜센터 운영 용역(재공고)", "2025-02-01"),
+        ("기관A", "청사 시설관리 용역", "2024-03-01"),
+        ("기관B", "2025년 종합상담 콜센터 운영 용역", "2025-01-10"),
+    ])
+    successors = find_successor_dates(df)
+    assert successors[0] == np.datetime64("2025-02-01")
+    # 다른 공고명, 다른 기관, 마지막 입찰은 다음 입찰이 없음
+    assert np.isnat(successors[1:]).all()
+
+    # 예측 입찰일 + 허용 기간 전에 실제 입찰이 있으면 이미 반영된 예측 (그 뒤 주기도 포함)
+    cycles = np.array(["2024-07-01", "2025-01-10", "2026-01-10"], dtype="datetime64[ns]")
+    fulfilled = fulfilled_predictions(cycles, np.repeat(successors[0], 3), 90)
+    assert fulfilled.tolist() == [False, True, True]
+
+
+def test_parallel_lots_do_not_fulfill_each_other():
+    # 같은 기관이 동시에 진행하는 비슷한 이름의 공고는 각자의 다음 입찰만 인정
+    df = make_bids([
+        ("기관A", "고객센터 상담 위탁운영(1권역)", "2023-03-01"),
+        ("기관A", "고객센터 상담 위탁운영(2권역)", "2023-03-01"),
+        ("기관A", "고객센터 상담 위탁운영(1권역)", "2024-03-01"),
+    ])
+    successors = find_successor_dates(df)
+    assert successors[0] == np.datetime64("2024-03-01")
+    assert np.isnat(successors[1])
+
+
+def make_store_frame(bids):
+    """(bid_id, 공고명, 입찰일시) 목록을 BidStore로 읽은 원본 데이터 프레임"""
+    tree = {}
+    for bid_id, name, bid_date in bids:
+        tree.setdefault(bid_date[:4], {}).setdefault(bid_date[5:7], {})[bid_id] = {
+            "공고명": name, "채권자명": "기관A", "입찰일시": f"{bid_date} 10:00:00", "용역기간(개월)": 12,
+        }
+    return BidStore().reset(tree, {})
+
+
+def test_predictions_for_year_hides_fulfilled_cycles():
+    df = make_store_frame([
+        ("bid_1", "2023년 콜센터 운영 용역", "2023-01-10"),
+        ("bid_2", "2024년 콜센터 운영 용역", "2024-02-01"),
+        ("bid_3", "청사 시설관리 용역", "2023-03-01"),
+    ])
+    # 2023-01-10의 첫 예측(2024-01-10)은 2024-02-01 입찰로 이미 채워짐
+    predictions = predictions_for_year(df, 2024)
+    assert predictions["base_bid_id"].tolist() == ["bid_3"]
+    # 다음 입찰이 없는 입찰은 그대로 예측
+    assert sorted(predictions_for_year(df, 2025)["base_bid_id"]) == ["bid_2", "bid_3"]
+
+    no_successor = np.full(len(df), np.datetime64("NaT"), dtype="datetime64[ns]")
+    assert sorted(predictions_for_year(df, 2024, no_successor)["base_bid_id"]) == ["bid_1", "bid_3"]
+
+
+def test_successor_dates_are_published_with_the_snapshot(tmp_path):
+    df = make_store_frame([
+        ("bid_1", "2023년 콜센터 운영 용역", "2023-01-10"),
+        ("bid_2", "2024년 콜센터 운영 용역", "2024-02-01"),
+    ])
+    snapshots = SnapshotHolder()
+    snapshot = snapshots.publish(df)
+    assert snapshot.df[SUCCESSOR_COLUMN].tolist() == [pd.Timestamp("2024-02-01 10:00"), pd.NaT]
+
+    # 사용자 입력만 바뀐 게시는 이전 값을 그대로 사용 (다시 계산하지 않음)
+    edited = apply_user_input_overlay(df, {"bid_1": {"물동량 평균": 100}})
+    previous = snapshot.df.assign(**{SUCCESSOR_COLUMN: pd.Timestamp("2030-01-01")})
+    assert (with_successor_dates(edited, previous)[SUCCESSOR_COLUMN] == pd.Timestamp("2030-01-01")).all()
+    reused = snapshots.publish(edited).df
+    assert reused[SUCCESSOR_COLUMN].tolist() == snapshot.df[SUCCESSOR_COLUMN].tolist()
+
+    # 공고명이 바뀌면 다시 계산
+    renamed = df.assign(공고명=["2023년 콜센터 운영 용역", "청사 시설관리 용역"])
+    assert pd.isna(with_successor_dates(renamed, snapshot.df)[SUCCESSOR_COLUMN]).all()
+
+    # 로컬 스냅샷 파일에 함께 저장되어 다시 시작할 때 계산하지 않음
+    pytest.importorskip("pyarrow")
+    save_snapshot(str(tmp_path), snapshot.df, snapshot.version)
+    loaded, _ = load_snapshot(str(tmp_path))
+    assert loaded[SUCCESSOR_COLUMN].tolist() == snapshot.df[SUCCESSOR_COLUMN].tolist()
+
+
+def test_fulfilled_predictions_removed_from_2023():
+    # 의도된 변경: DB/2324List.csv 기준 2023년 6월 물동량 215 -> 205, 2023년 전체 표 206 -> 195건
+    pytest.importorskip("dash")
+    import callbacks
+
+    source = pd.read_csv(SOURCE_CSV, usecols=list(CSV_COLUMN_DTYPES), dtype=CSV_COLUMN_DTYPES)
+    df = clean_bid_rows(source)
+    df["bid_id"] = [f"bid_{i}" for i in range(len(df))]
+    snapshot = SnapshotHolder(apply_bid_schema(df)).current()
+
+    chart = callbacks.build_monthly_chart(snapshot.year(2023).index, 2023).to_dict()
+    assert chart["data"][0]["y"][5] == 205
+    assert len(callbacks.build_full_table_frame(snapshot, 2023)) == 195
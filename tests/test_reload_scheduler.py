@@ -0,0 +1,70 @@
+import threading
+
+from reload_scheduler import ReloadScheduler
+
+
+class FakeReload:
+    """호출 횟수와 동시 실행 수를 기록하고, 지정한 횟수만큼 오류를 내는 가짜 reload"""
+
+    def __init__(self, errors=()):
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        self.errors = list(errors)
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            self.calls += 1
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        self.started.set()
+        self.release.wait(5)
+        with self._lock:
+            self.active -= 1
+        if self.errors:
+            raise self.errors.pop(0)
+
+
+def test_triggers_within_window_are_merged():
+    reload = FakeReload()
+    scheduler = ReloadScheduler(reload, merge_window=0.2)
+    generations = [scheduler.trigger() for _ in range(5)]
+    assert generations == [1, 2, 3, 4, 5]
+    assert scheduler.wait(timeout=5)
+    assert reload.calls == 1
+    assert scheduler.stats()["reloads_run"] == 1 and scheduler.stats()["triggers_received"] == 5
+
+
+def test_reloads_never_overlap():
+    reload = FakeReload()
+    reload.release.clear()
+    scheduler = ReloadScheduler(reload, merge_window=0)
+    first = scheduler.trigger()
+    assert reload.started.wait(5)
+
+    # 실행 중에 들어온 요청은 끝난 뒤 한 번 더 실행 (첫 reload 완료만으로는 반영 안 됨)
+    second = scheduler.trigger()
+    scheduler.trigger()
+    assert not scheduler.wait(second, timeout=0.1)
+    reload.release.set()
+    assert scheduler.wait(first, timeout=5)
+    assert scheduler.wait(timeout=5)
+    assert reload.calls == 2 and reload.max_active == 1
+
+
+def test_wait_reports_failed_reload():
+    reload = FakeReload(errors=[RuntimeError("게시 실패")])
+    scheduler = ReloadScheduler(reload, merge_window=0)
+    failed = scheduler.trigger()
+    assert not scheduler.wait(failed, timeout=5)
+    stats = scheduler.stats()
+    assert stats["reloads_failed"] == 1 and stats["reloads_run"] == 0
+
+    # 다음 요청의 reload가 성공하면 이전 요청까지 반영됨
+    assert scheduler.wait(scheduler.trigger(), timeout=5)
+    assert scheduler.wait(failed, timeout=0)
+    assert scheduler.stats()["reloads_run"] == 1
@@ -0,0 +1,78 @@
+import os
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from bid_schema import apply_bid_schema
+from data_store import SnapshotHolder
+from shared_snapshot import KEEP_FILES, SharedSnapshotFollower, map_shared_snapshot, write_shared_snapshot
+
+
+def make_frame(names):
+    return apply_bid_schema(pd.DataFrame({
+        "bid_id": [f"bid_{i}" for i in range(len(names))],
+        "공고명": names,
+        "실수요기관": ["기관A"] * len(names),
+        "입찰금액_1순위": ["143,930,000"] * len(names),
+        "Min": [3, ""] * (len(names) // 2) + [3] * (len(names) % 2),
+        "용역기간(개월)": [12.0] * len(names),
+        "예상_입찰일": pd.to_datetime(["2024-01-01"] * len(names)),
+        "예상_연도": [2024] * len(names),
+        "예상_입찰월": [1] * len(names),
+    }))
+
+
+def test_mapped_snapshot_keeps_schema(tmp_path):
+    df = make_frame(["콜센터 위탁 운영 용역", "상담센터 운영"])
+    marker = write_shared_snapshot(str(tmp_path), df, data_version=4)
+
+    mapped = map_shared_snapshot(str(tmp_path), marker)
+
+    assert marker["data_version"] == 4
+    assert mapped["공고명"].tolist() == df["공고명"].tolist()
+    # 스키마 타입(category, 작은 정수 등)이 다시 변환하지 않아도 유지됨
+    for col in ("실수요기관", "bid_id", "예상_연도", "예상_입찰월", "입찰금액_1순위", "is_prediction"):
+        assert mapped[col].dtype == df[col].dtype, col
+    assert mapped["예상_입찰일"].tolist() == df["예상_입찰일"].tolist()
+
+
+def test_mapped_categories_use_file_strings(tmp_path):
+    df = make_frame(["콜센터 위탁 운영 용역", "상담센터 운영", "콜센터 위탁 운영 용역"])
+    df["입찰결과_1순위"] = pd.Categorical(["업체A", None, "업체B"])
+    marker = write_shared_snapshot(str(tmp_path), df, data_version=1)
+
+    mapped = map_shared_snapshot(str(tmp_path), marker)
+
+    # 숫자와 빈 문자열이 섞인 Min 외에는 값과 타입이 그대로
+    pd.testing.assert_frame_equal(mapped.drop(columns="Min"), df.drop(columns="Min"))
+    # 범주는 파이썬 객체가 아닌 Arrow 기반 문자열, 빈 값은 코드 -1
+    assert str(mapped["bid_id"].cat.categories.dtype) == "str"
+    assert mapped["입찰결과_1순위"].cat.codes.tolist() == [0, -1, 1]
+
+
+def test_follower_switches_to_new_version(tmp_path):
+    directory = str(tmp_path)
+    snapshots = SnapshotHolder()
+    follower = SharedSnapshotFollower(directory, snapshots)
+
+    # 로더가 아직 게시하지 않았으면 기다리다 실패
+    assert not follower.wait_first(0)
+
+    write_shared_snapshot(directory, make_frame(["공고1"]), data_version=1)
+    assert follower.wait_first(1)
+    assert snapshots.current().df["공고명"].tolist() == ["공고1"]
+
+    # 같은 파일이면 다시 게시하지 않음
+    assert not follower.poll()
+    assert snapshots.version == 1
+
+    for version in range(2, KEEP_FILES + 3):
+        write_shared_snapshot(directory, make_frame(["공고1", f"공고{version}"]), data_version=version)
+    assert follower.poll()
+    assert snapshots.version == 2
+    assert snapshots.current().df["공고명"].tolist() == ["공고1", f"공고{KEEP_FILES + 2}"]
+
+    # 오래된 파일은 최근 KEEP_FILES개만 남음
+    assert len([name for name in os.listdir(directory) if name.endswith(".arrow")]) == KEEP_FILES
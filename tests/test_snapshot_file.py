@@ -0,0 +1,94 @@
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from data_store import SnapshotHolder
+from snapshot_file import load_snapshot, save_snapshot, start_from_snapshot
+
+
+def make_combined_frame():
+    base = pd.DataFrame({
+        "bid_id": ["bid_1", "bid_2"],
+        "공고명": ["콜센터 위탁 운영 용역", "상담센터 운영"],
+        "실수요기관": ["기관A", "기관B"],
+        "입찰금액_1순위": ["143,930,000", "349,083,532"],
+        "Min": [3, ""],  # Firebase 원본처럼 숫자와 빈 문자열이 섞인 컬럼
+        "용역기간(개월)": [12.0, 6.0],
+        "예상_입찰일": pd.to_datetime(["2024-01-01", "2024-03-15"]),
+        "예상_연도": [2024, 2024],
+        "예상_입찰월": [1, 3],
+    })
+    prediction = base.iloc[[0]].copy()
+    prediction["공고명"] = "콜센터 위탁 운영 용역 (1차 예측)"
+    prediction["입찰금액_1순위"] = 0
+    prediction["예상_입찰일"] = pd.Timestamp("2025-01-01")
+    prediction["예상_연도"] = 2025
+    prediction["is_prediction"] = True
+    prediction["prediction_count"] = 1
+    return pd.concat([base, prediction], ignore_index=True)
+
+
+def test_startup_serves_local_snapshot_without_network(tmp_path):
+    df = make_combined_frame()
+    save_snapshot(str(tmp_path), df, data_version=7)
+
+    reconcile_done = threading.Event()
+
+    def reconcile_without_network():
+        try:
+            raise ConnectionError("network unreachable")
+        finally:
+            reconcile_done.set()
+
+    snapshots = SnapshotHolder()
+    meta = start_from_snapshot(snapshots, str(tmp_path), reconcile_without_network)
+
+    # 네트워크 없이도 로컬 스냅샷 데이터가 바로 게시됨
+    assert meta["data_version"] == 7
+    snapshot = snapshots.current()
+    assert snapshot.version == 1
+    assert len(snapshot.df) == 2
+    assert snapshot.index.years == [2024]
+    # 예측 행은 연도를 조회할 때 원본 행에서 다시 생성됨 (저장된 예측 행은 사용하지 않음)
+    assert snapshot.year(2025).index.rows(2025, prediction=True)["공고명"].tolist() == [
+        "콜센터 위탁 운영 용역 (1차 예측)", "상담센터 운영 (2차 예측)", "상담센터 운영 (3차 예측)",
+    ]
+
+    # 백그라운드 동기화가 실패해도 스냅샷은 유지됨
+    assert reconcile_done.wait(5)
+    assert snapshots.current() is snapshot
+
+
+def test_snapshot_round_trip_keeps_values(tmp_path):
+    df = make_combined_frame()
+    save_snapshot(str(tmp_path), df, data_version=3)
+
+    loaded, meta = load_snapshot(str(tmp_path))
+
+    # 예측 행은 연도별로 다시 만들므로 원본 행만 한 파일로 저장
+    assert meta["rows"] == 2 and list(meta["files"]) == ["bids.parquet"]
+    assert loaded["bid_id"].tolist() == ["bid_1", "bid_2"]
+    assert loaded["예상_입찰일"].tolist() == df["예상_입찰일"].tolist()[:2]
+    assert not loaded["is_prediction"].any()
+    # 숫자와 빈 문자열이 섞인 원본 컬럼은 문자열로 저장됨
+    assert loaded["Min"].tolist() == ["3", ""]
+
+    # 다시 저장하면 이전 파일은 정리됨
+    save_snapshot(str(tmp_path), loaded, data_version=4)
+    assert sorted(os.listdir(tmp_path)) == sorted([load_snapshot(str(tmp_path))[1]["files"]["bids.parquet"], "snapshot.json"])
+
+
+def test_startup_without_snapshot_loads_synchronously(tmp_path):
+    calls = []
+    snapshots = SnapshotHolder()
+
+    meta = start_from_snapshot(snapshots, str(tmp_path / "missing"), lambda: calls.append("reconcile"))
+
+    assert meta is None
+    assert calls == ["reconcile"]
+    assert snapshots.current().version == 0
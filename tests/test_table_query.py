@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from table_query import FilterQueryError, filter_query_mask, sort_frame
+
+
+@pytest.fixture
+def table():
+    return pd.DataFrame({
+        "공고명": ["콜센터 운영", "Call Center", "상담센터 용역", "", None],
+        "평균M/M": [0.0, 12.5, np.nan, 30.0, 7.0],
+        "용역기간(개월)": [12, 24, 0, 36, 12],
+        "입찰게시": ["2024-01-10", "2024-02-01", "2024-02-20", "2023-12-05", "2024-03-01"],
+    })
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("", [0, 1, 2, 3, 4]),
+    # filter_table 버튼이 보내는 조건
+    ("{평균M/M} = 0 || {평균M/M} is blank", [0, 2]),
+    ("{용역기간(개월)} = 0 || {용역기간(개월)} is blank", [2]),
+    ("{평균M/M} is nil", [2]),
+    ("{공고명} is blank", [3, 4]),
+    ("{용역기간(개월)} >= 24 && {평균M/M} > 20", [3]),
+    ("{용역기간(개월)} eq 12", [0, 4]),
+    ("{용역기간(개월)} != 12", [1, 2, 3]),
+    ("!({용역기간(개월)} = 12)", [1, 2, 3]),
+    ("not {용역기간(개월)} = 12", [1, 2, 3]),
+    ("({용역기간(개월)} = 12 || {용역기간(개월)} = 0) && {평균M/M} > 5", [4]),
+    ("{용역기간(개월)} = 12 || {용역기간(개월)} = 0 && {평균M/M} > 5", [0, 4]),
+    ("{공고명} contains 센터", [0, 2]),
+    ('{공고명} contains "콜센터 운영"', [0]),
+    ("{공고명} icontains call", [1]),
+    ("{공고명} scontains call", []),
+    ("{공고명} = 'call center'", [1]),
+    ("{공고명} s= 'call center'", []),
+    ("{입찰게시} datestartswith 2024-02", [1, 2]),
+    ('{입찰게시} < "2024-01-01"', [3]),
+])
+def test_filter_query_mask(table, query, expected):
+    mask = filter_query_mask(table, query, case_insensitive_columns=["공고명"])
+    assert np.flatnonzero(mask).tolist() == expected
+
+
+@pytest.mark.parametrize("query", [
+    "{없는 컬럼} = 1",
+    "{평균M/M} =",
+    "{평균M/M} between 1",
+    "({평균M/M} = 0",
+    "{평균M/M} is weird",
+    "평균M/M = 0",
+])
+def test_invalid_filter_query(table, query):
+    with pytest.raises(FilterQueryError):
+        filter_query_mask(table, query)
+
+
+def test_sort_frame_keeps_order_without_sort_by(table):
+    assert sort_frame(table, []).index.tolist() == [0, 1, 2, 3, 4]
+    assert sort_frame(table, [{"column_id": "없는 컬럼"}]).index.tolist() == [0, 1, 2, 3, 4]
+    # 빈 값은 방향과 관계없이 마지막, 같은 값은 기존 순서 유지
+    result = sort_frame(table, [{"column_id": "평균M/M", "direction": "desc"}])
+    assert result.index.tolist() == [3, 1, 4, 0, 2]
+    result = sort_frame(table, [{"column_id": "용역기간(개월)", "direction": "asc"},
+                                {"column_id": "입찰게시", "direction": "desc"}])
+    assert result.index.tolist() == [2, 4, 0, 1, 3]
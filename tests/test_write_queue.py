@@ -0,0 +1,73 @@
+import threading
+
+from write_queue import WriteQueue
+
+
+class FakeWrite:
+    """전송된 payload를 기록하고, 지정한 횟수만큼 오류를 내는 가짜 write"""
+
+    def __init__(self, errors=()):
+        self.payloads = []
+        self.errors = list(errors)
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self, payload):
+        self.payloads.append(payload)
+        self.started.set()
+        self.release.wait(5)
+        if self.errors:
+            raise self.errors.pop(0)
+
+
+def make_queue(write, **kwargs):
+    return WriteQueue(write, flush_delay=0.05, retry_delay=0.01, max_retry_delay=0.02, **kwargs)
+
+
+def test_edits_to_same_bid_are_merged():
+    write = FakeWrite()
+    queue = make_queue(write)
+    queue.enqueue("bid_1", {"물동량 평균": 1.0})
+    queue.enqueue("bid_1", {"용역기간(개월)": 12.0})
+    queue.enqueue("bid_2", {"물동량 평균": 3.0})
+    assert queue.flush(timeout=5)
+    assert write.payloads == [{"bid_1/물동량 평균": 1.0, "bid_1/용역기간(개월)": 12.0, "bid_2/물동량 평균": 3.0}]
+    assert queue.batches_sent == 1
+
+
+def test_retry_keeps_newer_value():
+    write = FakeWrite(errors=[ConnectionError("일시 오류")])
+    write.release.clear()
+    queue = make_queue(write)
+    queue.enqueue("bid_1", {"물동량 평균": 1.0, "용역기간(개월)": 12.0})
+
+    # 첫 전송이 실패하는 동안 들어온 새 값이 재시도 때 우선
+    assert write.started.wait(5)
+    queue.enqueue("bid_1", {"물동량 평균": 2.0})
+    write.release.set()
+    assert queue.flush(timeout=5)
+    assert write.payloads[-1] == {"bid_1/물동량 평균": 2.0, "bid_1/용역기간(개월)": 12.0}
+    assert queue.failures == 1 and queue.dropped == 0
+
+
+def test_rejected_edits_are_dropped_and_do_not_block_flush():
+    write = FakeWrite(errors=[ValueError("잘못된 값")])
+    queue = make_queue(write)
+    queue.enqueue("bid_1", {"물동량 평균": float("nan")})
+    assert queue.flush(timeout=5)
+    assert queue.dropped == 1 and len(write.payloads) == 1
+
+    # 이후 같은 입찰의 수정은 버린 수정과 관계없이 전송
+    queue.enqueue("bid_1", {"물동량 평균": 4.0})
+    assert queue.flush(timeout=5)
+    assert write.payloads[-1] == {"bid_1/물동량 평균": 4.0}
+
+
+def test_transient_failures_stop_after_max_retries():
+    write = FakeWrite(errors=[ConnectionError("일시 오류")] * 10)
+    queue = make_queue(write, max_retries=2)
+    queue.enqueue("bid_1", {"물동량 평균": 1.0})
+    assert queue.flush(timeout=5)
+    assert len(write.payloads) == 3
+    assert queue.dropped == 1 and queue.pending_count == 0
@@ -0,0 +1,149 @@
+import threading
+import time
+
+# 다시 보내도 성공할 수 없는 Firebase 오류 코드 (firebase_admin.exceptions.FirebaseError.code)
+PERMANENT_ERROR_CODES = {"INVALID_ARGUMENT", "PERMISSION_DENIED", "UNAUTHENTICATED", "NOT_FOUND", "FAILED_PRECONDITION"}
+
+
+def is_permanent_error(error):
+    """재시도해도 성공할 수 없는 쓰기 오류인지 확인 (잘못된 값, 권한 없음 등)"""
+    return isinstance(error, (ValueError, TypeError)) or getattr(error, "code", None) in PERMANENT_ERROR_CODES
+
+
+class WriteQueue:
+    """
+    Firebase 쓰기를 모아서 백그라운드에서 전송하는 write-behind 큐
+
+    같은 bid_id에 대한 대기 중 수정은 필드 단위로 병합되고, 한 번에 모인 수정은
+    다중 경로 update() 한 번으로 전송된다. 전송에 실패하면 수정을 다시 대기열에
+    넣고 점점 긴 간격으로 재시도한다 (그 사이 들어온 새 값이 우선).
+    재시도해도 성공할 수 없는 오류이거나 max_retries번 연속 실패한 수정은 기록 후 버린다.
+    """
+
+    def __init__(self, write, flush_delay=0.2, retry_delay=1.0, max_retry_delay=60.0, max_retries=5):
+        """
+        Args:
+            write (callable): 다중 경로 payload({"bid_id/필드": 값})를 전송하는 함수
+            flush_delay (float): 첫 수정 후 전송 전까지 추가 수정을 모으는 시간(초)
+            retry_delay (float): 첫 재시도 대기 시간(초)
+            max_retry_delay (float): 최대 재시도 대기 시간(초)
+            max_retries (int): 같은 bid_id의 수정을 버리기 전까지 재시도 횟수
+        """
+        self._write = write
+        self.flush_delay = flush_delay
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.max_retries = max_retries
+        self._pending = {}  # bid_id -> {필드: 값}
+        self._attempts = {}  # bid_id -> 연속 실패 횟수 (새 수정이 들어오면 초기화)
+        self._in_flight = False
+        self._cond = threading.Condition()
+        self._thread = None
+        self.batches_sent = 0
+        self.failures = 0
+        self.dropped = 0
+
+    def enqueue(self, bid_id, fields):
+        """bid_id의 필드 수정을 대기열에 추가 (기존 대기 수정과 병합)"""
+        with self._cond:
+            self._pending.setdefault(bid_id, {}).update(fields)
+            self._attempts.pop(bid_id, None)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="firebase-write-queue", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    @property
+    def pending_count(self):
+        with self._cond:
+            return len(self._pending)
+
+    def flush(self, timeout=None):
+        """대기 중인 수정이 모두 처리(전송 또는 포기)될 때까지 대기 (완료 시 True)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._pending or self._in_flight:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return True
+
+    @staticmethod
+    def build_payload(batch):
+        """{bid_id: {필드: 값}}을 다중 경로 update용 {"bid_id/필드": 값}으로 변환"""
+        return {
+            f"{bid_id}/{field}": value
+            for bid_id, fields in batch.items()
+            for field, value in fields.items()
+        }
+
+    def _requeue_failed(self, batch, error):
+        """
+        실패한 수정을 다시 대기열에 넣기 (self._cond를 잡은 상태에서 호출)
+
+        그 사이 들어온 새 수정이 실패한 값보다 우선한다. 재시도할 수 없는 오류이거나
+        재시도 횟수를 넘은 bid_id의 수정은 버린다 (새 수정이 있으면 그것만 남김).
+
+        Returns:
+            int: 다시 대기열에 넣은 bid_id 수
+        """
+        permanent = is_permanent_error(error)
+        requeued = 0
+        for bid_id, fields in batch.items():
+            newer = self._pending.get(bid_id)
+            if newer is not None:
+                # enqueue에서 시도 횟수가 초기화된 새 수정 (실패한 값은 새 값 아래에 병합)
+                if not permanent:
+                    self._pending[bid_id] = {**fields, **newer}
+                requeued += 1
+                continue
+            attempts = self._attempts.get(bid_id, 0) + 1
+            if permanent or attempts > self.max_retries:
+                self._attempts.pop(bid_id, None)
+                self.dropped += 1
+                print(f"Firebase 쓰기 포기 ({bid_id}, {attempts}회 실패): {error}")
+                continue
+            self._attempts[bid_id] = attempts
+            self._pending[bid_id] = dict(fields)
+            requeued += 1
+        return requeued
+
+    def _run(self):
+        delay = self.retry_delay
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+
+            # 짧은 시간 동안 들어오는 수정을 모아서 한 번에 전송
+            time.sleep(self.flush_delay)
+
+            with self._cond:
+                batch, self._pending = self._pending, {}
+                self._in_flight = True
+
+            try:
+                self._write(self.build_payload(batch))
+            except Exception as e:
+                self.failures += 1
+                with self._cond:
+                    requeued = self._requeue_failed(batch, e)
+                    self._in_flight = False
+                    self._cond.notify_all()
+                if not requeued:
+                    delay = self.retry_delay
+                    continue
+                print(f"Firebase 쓰기 실패 ({len(batch)}건), {delay:.0f}초 후 재시도: {e}")
+                time.sleep(delay)
+                delay = min(delay * 2, self.max_retry_delay)
+                continue
+
+            delay = self.retry_delay
+            with self._cond:
+                for bid_id in batch:
+                    if bid_id not in self._pending:
+                        self._attempts.pop(bid_id, None)
+                self.batches_sent += 1
+                self._in_flight = False
+                self._cond.notify_all()